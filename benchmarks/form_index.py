@@ -0,0 +1,61 @@
+""" Times looking up the forms of a lexeme with 500 forms by grammatical feature and by ID,
+    through the form index and by scanning every form as Lexeme did before the index existed.
+
+    A few forms have their features changed in place between rounds of lookups,
+    so the index has to take those changes into account as well.
+    The index is built once, before the lookups are timed.
+"""
+
+import time
+
+import tfsl
+from tfsl.languages import langs
+
+FORM_COUNT = 500
+FEATURES = ["Q110786", "Q146786", "Q1751855", "Q192613", "Q499327"]
+ROUNDS = 20
+CHANGES_PER_ROUND = 5
+
+def scan_forms(lexeme: tfsl.Lexeme, inflections: list) -> list:
+    """ Finds the forms with the provided features by checking every form. """
+    return [form for form in lexeme.forms if all(i in form.features for i in inflections)]
+
+def scan_id(lexeme: tfsl.Lexeme, form_id: str) -> tfsl.LexemeForm:
+    """ Finds the form with the provided ID by checking every form. """
+    for form in lexeme.forms:
+        if form.id == form_id:
+            return form
+    raise KeyError(form_id)
+
+def time_lookups(lexeme: tfsl.Lexeme, by_features, by_id) -> float:
+    """ Changes a few forms in place and looks up forms by feature and by ID, returning the time taken. """
+    start = time.perf_counter()
+    for round_number in range(ROUNDS):
+        for i in range(CHANGES_PER_ROUND):
+            features = lexeme.forms[(round_number * CHANGES_PER_ROUND + i) % FORM_COUNT].features
+            features.symmetric_difference_update([FEATURES[round_number % len(FEATURES)]])
+        for feature in FEATURES:
+            by_features(lexeme, [feature, FEATURES[0]])
+        for i in range(0, FORM_COUNT, 10):
+            by_id(lexeme, f"L1-F{i + 1}")
+    return time.perf_counter() - start
+
+def main() -> None:
+    lexeme = tfsl.Lexeme(["benchmark" @ langs.en_], langs.en_, "Q1084")
+    with lexeme.edit() as editor:
+        for i in range(FORM_COUNT):
+            form = tfsl.LexemeForm([f"form{i}" @ langs.en_], [FEATURES[i % len(FEATURES)], FEATURES[(i // 5) % len(FEATURES)]])
+            form.id = f"L1-F{i + 1}"
+            editor += form
+    lexeme = editor.result
+
+    scanned = time_lookups(lexeme, scan_forms, scan_id)
+    print(f"scanning every form: {scanned * 1000:.2f} ms")
+    start = time.perf_counter()
+    lexeme.form_index # pylint: disable=pointless-statement
+    print(f"building the form index: {(time.perf_counter() - start) * 1000:.2f} ms")
+    indexed = time_lookups(lexeme, lambda lexeme, inflections: lexeme.get_forms(inflections), lambda lexeme, form_id: lexeme[form_id])
+    print(f"form index: {indexed * 1000:.2f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+""" Times building a lexeme with 500 forms by adding one form at a time.
+
+    Since the forms of a lexeme are held in a PVector, each addition should take
+    roughly the same time however many forms the lexeme already has.
+    The same lexeme is then built again inside a single Lexeme.edit() block.
+"""
+
+import time
+
+import tfsl
+from tfsl.languages import langs
+
+FORM_COUNT = 500
+BATCH_SIZE = 100
+
+def main() -> None:
+    lexeme = tfsl.Lexeme(["benchmark" @ langs.en_], langs.en_, "Q1084")
+    total_start = time.perf_counter()
+    batch_start = total_start
+    for i in range(FORM_COUNT):
+        lexeme = lexeme + tfsl.LexemeForm([f"form{i}" @ langs.en_], ["Q110786"])
+        if (i + 1) % BATCH_SIZE == 0:
+            batch_end = time.perf_counter()
+            per_form = (batch_end - batch_start) / BATCH_SIZE * 1e6
+            print(f"forms {i + 2 - BATCH_SIZE}-{i + 1}: {per_form:.1f} us per addition")
+            batch_start = batch_end
+    total = time.perf_counter() - total_start
+    print(f"{len(lexeme.forms)} forms added one at a time in {total * 1000:.1f} ms")
+
+    lexeme = tfsl.Lexeme(["benchmark" @ langs.en_], langs.en_, "Q1084")
+    edit_start = time.perf_counter()
+    with lexeme.edit() as editor:
+        for i in range(FORM_COUNT):
+            editor += tfsl.LexemeForm([f"form{i}" @ langs.en_], ["Q110786"])
+    lexeme = editor.result
+    total = time.perf_counter() - edit_start
+    print(f"{len(lexeme.forms)} forms added in one edit block in {total * 1000:.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+""" Times serializing a lexeme with 500 forms, each with a statement.
+
+    The first call builds the JSON of every component. Later calls on the same lexeme,
+    and calls on a lexeme differing from it by one form, should reuse the cached
+    JSON of every unchanged component.
+"""
+
+import time
+
+import tfsl
+from tfsl.languages import langs
+
+FORM_COUNT = 500
+REPEATS = 20
+
+def main() -> None:
+    lexeme = tfsl.Lexeme(["benchmark" @ langs.en_], langs.en_, "Q1084")
+    with lexeme.edit() as editor:
+        for i in range(FORM_COUNT):
+            form = tfsl.LexemeForm([f"form{i}" @ langs.en_], ["Q110786"])
+            editor += form + tfsl.Statement("P1476", f"title{i}" @ langs.en_)
+    lexeme = editor.result
+
+    start = time.perf_counter()
+    lexeme.__jsonout__()
+    first = time.perf_counter() - start
+    print(f"first serialization: {first * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        lexeme.__jsonout__()
+    repeated = (time.perf_counter() - start) / REPEATS
+    print(f"repeated serialization: {repeated * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    for i in range(REPEATS):
+        changed = lexeme + tfsl.LexemeForm([f"extra{i}" @ langs.en_], ["Q110786"])
+        changed.__jsonout__()
+    after_edit = (time.perf_counter() - start) / REPEATS
+    print(f"serialization after adding one form: {after_edit * 1000:.2f} ms")
+
+if __name__ == '__main__':
+    main()
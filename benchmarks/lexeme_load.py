@@ -0,0 +1,55 @@
+""" Times loading a lexeme with 500 forms from JSON, changing the features of one form,
+    and outputting the result as JSON, with and without building the lexeme lazily.
+"""
+
+import time
+
+from tfsl.lexeme import build_lexeme
+
+FORM_COUNT = 500
+STATEMENTS_PER_FORM = 4
+PROPERTY = "P1476"
+
+def statement_json(text: str) -> dict:
+    """ Builds the JSON of a statement with a monolingual text value. """
+    return {
+        "mainsnak": {
+            "snaktype": "value",
+            "property": PROPERTY,
+            "datavalue": {"value": {"text": text, "language": "en"}, "type": "monolingualtext"},
+            "datatype": "monolingualtext"
+        },
+        "type": "statement",
+        "rank": "normal"
+    }
+
+def lexeme_json() -> dict:
+    """ Builds the JSON of a lexeme with many forms, each with a few statements. """
+    return {
+        "id": "L1",
+        "lemmas": {"en": {"language": "en", "value": "benchmark"}},
+        "language": "Q1860",
+        "lexicalCategory": "Q1084",
+        "claims": {},
+        "forms": [{
+            "id": f"L1-F{i + 1}",
+            "representations": {"en": {"language": "en", "value": f"form{i}"}},
+            "grammaticalFeatures": ["Q110786"],
+            "claims": {PROPERTY: [statement_json(f"form{i} note{j}") for j in range(STATEMENTS_PER_FORM)]}
+        } for i in range(FORM_COUNT)],
+        "senses": []
+    }
+
+def main() -> None:
+    source = lexeme_json()
+    for lazy in [False, True]:
+        start = time.perf_counter()
+        lexeme = build_lexeme(source, lazy)
+        loaded = time.perf_counter()
+        lexeme.forms[0].features.add("Q146786")
+        lexeme.__jsonout__()
+        done = time.perf_counter()
+        print(f"lazy={lazy}: loaded in {(loaded - start) * 1000:.1f} ms, edited and output in {(done - loaded) * 1000:.1f} ms")
+
+if __name__ == '__main__':
+    main()
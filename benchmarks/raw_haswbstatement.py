@@ -0,0 +1,53 @@
+""" Times scanning 100k L_ objects for lexemes with a given property-value pair.
+
+    Each lexeme has a few statements with item values, only some of which match,
+    so most of the time goes into comparing the query value against raw statement JSON.
+"""
+
+import time
+
+import tfsl
+from tfsl.itemvalue import ItemValue
+
+LEXEME_COUNT = 100_000
+PROPERTY = "P5185"
+VALUES = ["Q499327", "Q1775415", "Q1775461", "Q27918551"]
+
+def statement_json(value: str) -> dict:
+    """ Builds the JSON of a statement with the provided item as its value. """
+    return {
+        "mainsnak": {
+            "snaktype": "value",
+            "property": PROPERTY,
+            "datavalue": {
+                "value": {"entity-type": "item", "numeric-id": int(value[1:]), "id": value},
+                "type": "wikibase-entityid"
+            },
+            "datatype": "wikibase-item"
+        },
+        "type": "statement",
+        "rank": "normal"
+    }
+
+def lexeme_json(index: int) -> dict:
+    """ Builds the JSON of a lexeme whose statements depend on the provided number. """
+    return {
+        "id": f"L{index + 1}",
+        "lemmas": {"en": {"language": "en", "value": f"lemma{index}"}},
+        "language": "Q1860",
+        "lexicalCategory": "Q1084",
+        "claims": {PROPERTY: [statement_json(VALUES[(index + offset) % len(VALUES)]) for offset in range(index % 3 + 1)]},
+        "forms": [],
+        "senses": []
+    }
+
+def main() -> None:
+    lexemes = [tfsl.L_.from_json(lexeme_json(i)) for i in range(LEXEME_COUNT)]
+    query = ItemValue(VALUES[0])
+    start = time.perf_counter()
+    matches = sum(1 for lexeme in lexemes if lexeme.haswbstatement(PROPERTY, query))
+    total = time.perf_counter() - start
+    print(f"{matches} of {len(lexemes)} lexemes matched in {total * 1000:.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -1,47 +1,33 @@
 import tfsl
+import tfsl.bulk
 import utils
-import time
 import re
 
 
 def fetch_lexemes_to_clean():
     query = 'SELECT DISTINCT ?lexeme { ?lexeme dct:language wd:Q12107 ; ontolex:lexicalForm ?f . ?f wikibase:grammaticalFeature wd:Q56648701 ; ontolex:representation ?form . FILTER (!REGEX(?form,"^[fzcFZC]")) }'
-    return utils.sparql_query(query)
+    return (lexeme_id for lexeme_id in tfsl.bulk.sparql_source(query) if lexeme_id not in ('L630016', 'L628789'))
 
 
 def clean_lexeme(lexeme):
-    change = False
     for form in lexeme.forms:
-        if 'Q56648701' in form.features and not re.search('^[fzcFZC]', form.representations.texts.pop().text):
-            change = True
+        if 'Q56648701' in form.features and not re.search('^[fzcFZC]', form.representations.texts[-1].text):
             form.features.remove('Q56648701')
             form.features.add('Q97130345')
-    return change
-
-
-def apply_changes(lexemes):
-    account = utils.load_json_file('account.json')
-    session = tfsl.WikibaseSession(account['username'], account['password'])
-    for lexeme in lexemes:
-        time.sleep(5)
-        session.push(lexeme, "cleaning grammatical features", 5, True)
-        print('Lexeme {} edited!'.format(lexeme.id))
+    return lexeme
 
 
 def main():
-    changed_lexemes = []
-    lexemes = fetch_lexemes_to_clean()
-    for lex in lexemes:
-        lexeme_id = lex['lexeme']['value'][31:]
-        if lexeme_id not in ('L630016', 'L628789'):
-            lexeme = tfsl.L(lexeme_id)
-            if clean_lexeme(lexeme):
-                changed_lexemes.append(lexeme)
-    if changed_lexemes:
-        print('{} lexemes to clean...'.format(len(changed_lexemes)))
-        apply_changes(changed_lexemes)
-    else:
-        print('No lexeme to clean!')
+    session = utils.open_session('account.json')
+    with tfsl.EditJournal('cleanBretonMutations.journal') as journal:
+        count = (tfsl.pipeline(fetch_lexemes_to_clean())
+                 .skip_completed(journal)
+                 .fetch()
+                 .transform(clean_lexeme)
+                 .skip_unchanged()
+                 .push(session, "cleaning grammatical features", 5, True, journal,
+                       on_pushed=lambda lexeme, response: print('Lexeme {} edited!'.format(lexeme.id))))
+    print('{} lexemes cleaned!'.format(count))
 
 
 if __name__ == '__main__':
@@ -1,5 +1,7 @@
 import json
 import requests
+import tfsl
+import tfsl.auth
 import urllib.parse
 
 
@@ -29,3 +31,11 @@ def fetch_url_json(url):
 def sparql_query(query):
     url = 'https://query.wikidata.org/sparql?{}'.format(urllib.parse.urlencode({'query': query, 'format': 'json'}))
     return fetch_url_json(url)['results']['bindings']
+
+
+def open_session(filename):
+    # the file holds either one account or a list of accounts to spread edits over
+    accounts = load_json_file(filename)
+    if isinstance(accounts, list):
+        return tfsl.auth.SessionPool.from_accounts(accounts)
+    return tfsl.WikibaseSession(accounts['username'], accounts['password'], session_file=accounts.get('session_file'))
@@ -0,0 +1,370 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from collections import namedtuple
+
+import requests
+
+import tfsl.auth
+from tfsl.auth import EditConflictError, MaxlagError, PushQueue, RateBudget, RetryPolicy, SessionPool, WikibaseSession
+from tfsl.journal import EditJournal
+from tfsl.lexeme import build_lexeme
+
+class RecordingSession:
+    """ Stands in for a WikibaseSession, answering each edit after a delay
+        and refusing the first edit to each entity listed in 'lagged' with a maxlag error.
+    """
+    def __init__(self, delay=0.01, lagged=()):
+        self.delay = delay
+        self.lagged = set(lagged)
+        self.lock = threading.Lock()
+        self.sent = []
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    def build_push_request(self, obj_in, summary=None, maxlag_in=5, bot=False, full=False):
+        entity_id, serial = obj_in
+        return {"id": entity_id, "serial": serial}
+
+    def send_edit(self, requestjson, base_json=None):
+        with self.lock:
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+            lagged = requestjson["id"] in self.lagged
+            self.lagged.discard(requestjson["id"])
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+            if lagged:
+                raise MaxlagError(0.05)
+            self.sent.append((requestjson["id"], requestjson["serial"]))
+        return {"success": 1, "serial": requestjson["serial"]}
+
+Edit = namedtuple("Edit", ["id", "serial"])
+
+class RecordingAccount(RecordingSession):
+    """ Stands in for a WikibaseSession logged in with one account of a SessionPool. """
+    edit_budget = None
+
+    def push_queue(self, max_in_flight=4, latency_target=10.0, journal=None):
+        return PushQueue(self, max_in_flight, latency_target, journal=journal)
+
+    def send_edit(self, requestjson, base_json=None):
+        if self.edit_budget is not None:
+            self.edit_budget.wait()
+        return super().send_edit(requestjson, base_json)
+
+class FakeResponse:
+    def __init__(self, status_code=200, json_data=None, headers=None, cookies=None):
+        self.status_code = status_code
+        self.json_data = json_data
+        self.headers = headers or {}
+        self.cookies = cookies or {}
+        self.text = str(json_data)
+
+    def json(self):
+        return self.json_data
+
+class ScriptedSession:
+    """ Stands in for a requests.Session, answering each request with the next of the provided answers. """
+    def __init__(self, answers):
+        self.answers = list(answers)
+        self.calls = []
+        self.cookies = requests.cookies.RequestsCookieJar()
+
+    def answer(self, method, data):
+        self.calls.append((method, dict(data)))
+        answer = self.answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        for name, value in answer.cookies.items():
+            self.cookies.set(name, value, domain="example.org", path="/")
+        return answer
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        return self.answer("GET", params)
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        return self.answer("POST", data)
+
+def scripted_session(answers, token="old", **session_args):
+    session = WikibaseSession("Bot@tfsl", "secret", token=token, url="https://example.org/w/api.php",
+                              retry_policy=RetryPolicy(base_delay=0.001, max_attempts=session_args.pop("max_attempts", 6)),
+                              **session_args)
+    session.session = ScriptedSession(answers)
+    return session
+
+def login_answers(csrf_token="new"):
+    return [
+        FakeResponse(200, {"query": {"tokens": {"logintoken": "login"}}}),
+        FakeResponse(200, {"login": {"result": "Success"}}, cookies={"wikidatawikiSession": "cookie"}),
+        FakeResponse(200, {"query": {"tokens": {"csrftoken": csrf_token}}}),
+    ]
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_delays(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.0)
+        self.assertEqual([policy.get_delay(attempt) for attempt in range(1, 6)], [1.0, 2.0, 4.0, 5.0, 5.0])
+        self.assertEqual(policy.get_delay(1, retry_after=3.0), 3.0)
+        policy = RetryPolicy(base_delay=1.0, jitter=0.5)
+        self.assertTrue(all(0.5 <= policy.get_delay(1) <= 1.0 for _ in range(20)))
+
+    def test_limits(self):
+        policy = RetryPolicy(max_attempts=3, time_budget=10.0)
+        self.assertTrue(policy.allows(2, 5.0, 4.0))
+        self.assertFalse(policy.allows(3, 0.0, 0.0))
+        self.assertFalse(policy.allows(1, 8.0, 4.0))
+
+    def test_transient_failures(self):
+        session = scripted_session([
+            requests.ConnectionError("reset"),
+            FakeResponse(503),
+            FakeResponse(429, headers={"retry-after": "0.01"}),
+            FakeResponse(200, {"error": {"code": "maxlag"}}, headers={"retry-after": "0.01"}),
+            FakeResponse(200, {"batchcomplete": ""}),
+        ])
+        self.assertEqual(session.get({"action": "query"}), {"batchcomplete": ""})
+        self.assertEqual(len(session.session.calls), 5)
+
+    def test_give_up(self):
+        session = scripted_session([FakeResponse(502)] * 3, max_attempts=3)
+        with self.assertRaises(Exception):
+            session.get({"action": "query"})
+        self.assertEqual(len(session.session.calls), 3)
+        session = scripted_session([FakeResponse(200, {"error": {"code": "permissiondenied"}})])
+        with self.assertRaises(PermissionError):
+            session.post({"action": "wbeditentity", "token": "__AUTO__"})
+        self.assertEqual(len(session.session.calls), 1)
+
+    def test_badtoken(self):
+        session = scripted_session([
+            FakeResponse(200, {"error": {"code": "badtoken"}}),
+            FakeResponse(200, {"query": {"tokens": {"csrftoken": "new"}}}),
+            FakeResponse(200, {"success": 1}),
+        ])
+        self.assertEqual(session.post({"action": "wbeditentity", "token": "__AUTO__"}), {"success": 1})
+        methods_tokens = [(method, data.get("token")) for method, data in session.session.calls]
+        self.assertEqual(methods_tokens, [("POST", "old"), ("GET", None), ("POST", "new")])
+
+    def test_creation_not_sent_twice(self):
+        creation = {"action": "wbeditentity", "new": "lexeme", "data": "{}"}
+        for failure in [requests.ReadTimeout("timed out"), requests.ConnectionError("reset"), FakeResponse(503)]:
+            with self.subTest(failure=failure):
+                session = scripted_session([failure, FakeResponse(200, {"entity": {"id": "L2"}})])
+                with self.assertRaises(Exception):
+                    session.send_edit(dict(creation), retry_lag=True)
+                self.assertEqual(len(session.session.calls), 1)
+        session = scripted_session([requests.ConnectTimeout("no connection"), FakeResponse(200, {"entity": {"id": "L2"}})])
+        self.assertEqual(session.send_edit(dict(creation)), {"entity": {"id": "L2"}})
+        self.assertEqual(len(session.session.calls), 2)
+        session = scripted_session([requests.ReadTimeout("timed out"), FakeResponse(200, {"entity": {"id": "L1"}})])
+        session.send_edit({"action": "wbeditentity", "id": "L1", "baserevid": "5", "data": json.dumps({"id": "L1"})})
+        self.assertEqual(len(session.session.calls), 2)
+
+    def test_send_edit_raises_maxlag(self):
+        session = scripted_session([FakeResponse(200, {"error": {"code": "maxlag"}}, headers={"retry-after": "2"})])
+        with self.assertRaises(MaxlagError) as context:
+            session.send_edit({"action": "wbeditentity"})
+        self.assertEqual(context.exception.retry_after, 2.0)
+
+class TestLogin(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.session_file = os.path.join(self.tempdir.name, "bot.session")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_lazy_login(self):
+        session = scripted_session([FakeResponse(200, {"entities": {}})], token=None)
+        session.get({"action": "wbgetentities", "ids": "L1"})
+        self.assertEqual(len(session.session.calls), 1)
+        self.assertFalse(session.logged_in)
+
+        session.session.answers = login_answers() + [FakeResponse(200, {"success": 1})]
+        self.assertEqual(session.post({"action": "wbeditentity", "token": "__AUTO__"}), {"success": 1})
+        actions = [data.get("action") for _, data in session.session.calls[1:]]
+        self.assertEqual(actions, ["query", "login", "query", "wbeditentity"])
+        self.assertNotIn("assertuser", session.session.calls[2][1])
+        self.assertEqual(session.session.calls[-1][1]["token"], "new")
+
+    def test_session_file(self):
+        session = scripted_session(login_answers() + [FakeResponse(200, {"success": 1})], token=None, session_file=self.session_file)
+        session.post({"action": "wbeditentity", "token": "__AUTO__"})
+        self.assertEqual(os.stat(self.session_file).st_mode & 0o777, 0o600)
+        with open(self.session_file, encoding="utf-8") as fileptr:
+            self.assertNotIn("secret", fileptr.read())
+        with open(self.session_file + ".tmp", "w", encoding="utf-8") as fileptr:
+            fileptr.write("stale")
+        os.chmod(self.session_file + ".tmp", 0o644)
+        session.save_session()
+        self.assertEqual(os.stat(self.session_file).st_mode & 0o777, 0o600)
+        self.assertFalse(os.path.exists(self.session_file + ".tmp"))
+
+        session = scripted_session([FakeResponse(200, {"success": 1})], token=None, session_file=self.session_file)
+        self.assertEqual(session.csrf_token, "new")
+        self.assertEqual(session.session.cookies.get("wikidatawikiSession"), None)
+        session.post({"action": "wbeditentity", "token": "__AUTO__"})
+        self.assertEqual(len(session.session.calls), 1)
+
+        restored = WikibaseSession("Bot@tfsl", "secret", url="https://example.org/w/api.php", session_file=self.session_file)
+        self.assertEqual(restored.session.cookies.get("wikidatawikiSession"), "cookie")
+        expired = WikibaseSession("Bot@tfsl", "secret", url="https://example.org/w/api.php",
+                                  session_file=self.session_file, session_lifetime=-1)
+        expired.save_session()
+        self.assertIsNone(WikibaseSession("Bot@tfsl", "secret", url="https://example.org/w/api.php",
+                                          session_file=self.session_file).csrf_token)
+        self.assertIsNone(WikibaseSession("Other", "secret", url="https://example.org/w/api.php",
+                                          session_file=self.session_file).csrf_token)
+
+    def test_expired_session(self):
+        session = scripted_session([FakeResponse(200, {"error": {"code": "assertuserfailed"}})] + login_answers()
+                                   + [FakeResponse(200, {"success": 1})])
+        session.logged_in = True
+        self.assertEqual(session.post({"action": "wbeditentity", "token": "__AUTO__"}), {"success": 1})
+        tokens = [data.get("token") for _, data in session.session.calls]
+        self.assertEqual(tokens, ["old", None, None, None, "new"])
+
+        session = scripted_session([FakeResponse(200, {"error": {"code": "badtoken"}}),
+                                    FakeResponse(200, {"query": {"tokens": {"csrftoken": "+\\"}}})] + login_answers()
+                                   + [FakeResponse(200, {"success": 1})])
+        self.assertEqual(session.post({"action": "wbeditentity", "token": "__AUTO__"}), {"success": 1})
+        self.assertEqual(session.session.calls[-1][1]["token"], "new")
+
+class TestEditConflicts(unittest.TestCase):
+    def setUp(self):
+        self.old_config = tfsl.auth.current_config
+        self.tempdir = tempfile.TemporaryDirectory()
+        tfsl.auth.set_config(self.tempdir.name, 60)
+        self.lexeme_json = {
+            "pageid": 1, "ns": 146, "title": "Lexeme:L1", "lastrevid": 2,
+            "modified": "2021-01-01T00:00:00Z", "type": "lexeme", "id": "L1",
+            "lemmas": {"en": {"language": "en", "value": "dam"}},
+            "language": "Q1860", "lexicalCategory": "Q1084", "claims": {},
+            "forms": [{"id": "L1-F1", "representations": {"en": {"language": "en", "value": "dams"}},
+                       "grammaticalFeatures": ["Q146786"], "claims": {}}],
+            "senses": []
+        }
+        self.latest_json = dict(copy.deepcopy(self.lexeme_json), lastrevid=3)
+        self.latest_json["lemmas"]["de"] = {"language": "de", "value": "Damm"}
+
+    def tearDown(self):
+        tfsl.auth.current_config = self.old_config
+        tfsl.auth.cache_path_created = False
+        self.tempdir.cleanup()
+
+    def test_rebase(self):
+        x = build_lexeme(self.lexeme_json)
+        x.forms[0].features.add("Q1")
+        session = scripted_session([
+            FakeResponse(200, {"error": {"code": "editconflict"}}),
+            FakeResponse(200, {"entities": {"L1": self.latest_json}}),
+            FakeResponse(200, {"success": 1}),
+        ])
+        self.assertEqual(session.push(x), {"success": 1})
+        (_, first), (_, refetch), (_, second) = session.session.calls
+        self.assertEqual(first["baserevid"], "2")
+        self.assertEqual(refetch["ids"], "L1")
+        self.assertEqual(second["baserevid"], "3")
+        self.assertEqual(first["action"], "wbleditformelements")
+        self.assertEqual(second["action"], "wbleditformelements")
+        self.assertEqual(second["data"], first["data"])
+        with open(os.path.join(self.tempdir.name, "L1.json"), encoding="utf-8") as fileptr:
+            self.assertEqual(json.load(fileptr)["lastrevid"], 3)
+
+    def test_overlapping_changes(self):
+        x = build_lexeme(self.lexeme_json)
+        x.forms[0].features.add("Q1")
+        self.latest_json["forms"][0]["grammaticalFeatures"] = ["Q110786"]
+        session = scripted_session([
+            FakeResponse(200, {"error": {"code": "editconflict"}}),
+            FakeResponse(200, {"entities": {"L1": self.latest_json}}),
+        ])
+        with self.assertRaises(EditConflictError):
+            session.push(x)
+        session = scripted_session([FakeResponse(200, {"error": {"code": "editconflict"}})])
+        with self.assertRaises(EditConflictError):
+            session.push(x, full=True)
+        self.assertEqual(len(session.session.calls), 1)
+
+class TestPushQueue(unittest.TestCase):
+    def test_order_and_results(self):
+        session = RecordingSession()
+        with PushQueue(session, max_in_flight=4) as queue:
+            futures = [queue.submit((f"L{i % 5}", i)) for i in range(40)]
+        self.assertEqual([future.result()["serial"] for future in futures], list(range(40)))
+        for entity in range(5):
+            serials = [serial for entity_id, serial in session.sent if entity_id == f"L{entity}"]
+            self.assertEqual(serials, sorted(serials))
+        self.assertGreater(session.most_in_flight, 1)
+        self.assertLessEqual(session.most_in_flight, 4)
+
+    def test_maxlag(self):
+        session = RecordingSession(lagged=["L1"])
+        with PushQueue(session, max_in_flight=4) as queue:
+            futures = [queue.submit(("L1", i)) for i in range(3)]
+            start = time.monotonic()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertEqual([future.result()["serial"] for future in futures], [0, 1, 2])
+        self.assertEqual(session.sent, [("L1", 0), ("L1", 1), ("L1", 2)])
+        self.assertEqual(queue.window, 2.5)
+
+    def test_journal(self):
+        session = RecordingSession(lagged=["L1"])
+        with tempfile.TemporaryDirectory() as tempdir:
+            with EditJournal(os.path.join(tempdir, "edits.journal")) as journal:
+                with PushQueue(session, journal=journal) as queue:
+                    for i in range(3):
+                        queue.submit((f"L{i}", i))
+                self.assertTrue(all(journal.is_completed(f"L{i}") for i in range(3)))
+                self.assertEqual(journal.get_unfinished(), {})
+
+    def test_latency(self):
+        session = RecordingSession(delay=0.02)
+        with PushQueue(session, max_in_flight=4, latency_target=0.01) as queue:
+            queue.submit(("L1", 0)).result()
+        self.assertEqual(queue.window, 1.0)
+
+    def test_errors(self):
+        session = RecordingSession()
+        session.send_edit = lambda requestjson, base_json: (_ for _ in ()).throw(PermissionError("blocked"))
+        with PushQueue(session) as queue:
+            future = queue.submit(("L1", 0))
+        self.assertIsInstance(future.exception(), PermissionError)
+
+class TestSessionPool(unittest.TestCase):
+    def test_affinity(self):
+        accounts = [RecordingAccount(delay=0.001) for _ in range(3)]
+        pool = SessionPool(accounts)
+        with pool.push_queue(max_in_flight=2) as queue:
+            futures = [queue.submit(Edit(f"L{i % 12}", i)) for i in range(60)]
+        self.assertEqual([future.result()["serial"] for future in futures], list(range(60)))
+        self.assertTrue(all(account.sent for account in accounts))
+        for i in range(12):
+            senders = [account for account in accounts if any(entity_id == f"L{i}" for entity_id, _ in account.sent)]
+            self.assertEqual(senders, [pool.get_session(f"L{i}")])
+            serials = [serial for entity_id, serial in senders[0].sent if entity_id == f"L{i}"]
+            self.assertEqual(serials, sorted(serials))
+        self.assertEqual(len({id(pool.get_session(None)) for _ in range(3)}), 3)
+        for i in range(12):
+            self.assertIs(pool.get_session(f"L{i}-F1"), pool.get_session(f"L{i}"))
+            self.assertIs(pool.get_session(f"L{i}-S2"), pool.get_session(f"L{i}"))
+
+    def test_rate_budget(self):
+        accounts = [RecordingAccount(delay=0) for _ in range(2)]
+        pool = SessionPool(accounts, edits_per_minute=1200)
+        self.assertIsInstance(accounts[0].edit_budget, RateBudget)
+        self.assertIsNot(accounts[0].edit_budget, accounts[1].edit_budget)
+        start = time.monotonic()
+        for _ in range(4):
+            accounts[0].edit_budget.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+        with self.assertRaises(ValueError):
+            SessionPool([])
+
+if __name__ == '__main__':
+    unittest.main()
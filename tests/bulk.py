@@ -0,0 +1,124 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import tfsl
+import tfsl.auth
+from tfsl.auth import DryRunSession, PushQueue
+from tfsl.bulk import bounded_map, dump_source, pipeline
+from tfsl.journal import EditJournal
+
+def lexeme_json(lid, feature="Q110786"):
+    return {
+        "pageid": 1, "ns": 146, "title": f"Lexeme:{lid}", "lastrevid": 2,
+        "modified": "2021-01-01T00:00:00Z", "type": "lexeme", "id": lid,
+        "lemmas": {"en": {"language": "en", "value": "dam"}},
+        "language": "Q1860", "lexicalCategory": "Q1084", "claims": {},
+        "forms": [{"id": f"{lid}-F1", "representations": {"en": {"language": "en", "value": "dams"}},
+                   "grammaticalFeatures": [feature], "claims": {}}],
+        "senses": []
+    }
+
+class PushingSession:
+    """ Stands in for a WikibaseSession, recording each edit sent through its push queues. """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sent = []
+
+    def push_queue(self, max_in_flight=4, latency_target=10.0, journal=None):
+        return PushQueue(self, max_in_flight, latency_target, journal=journal)
+
+    def build_push_request(self, obj_in, summary=None, maxlag_in=5, bot=False, full=False):
+        return tfsl.auth.WikibaseSession.build_push_request(self, obj_in, summary, maxlag_in, bot, full)
+
+    def send_edit(self, requestjson, base_json=None):
+        with self.lock:
+            self.sent.append(requestjson)
+        return {"success": 1, "lastrevid": 3}
+
+    assert_user = None
+
+def replace_feature(lexeme):
+    for form in lexeme.forms:
+        if "Q110786" in form.features:
+            form.features.remove("Q110786")
+            form.features.add("Q146786")
+    return lexeme
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        self.old_config = tfsl.auth.current_config
+        self.tempdir = tempfile.TemporaryDirectory()
+        tfsl.auth.set_config(self.tempdir.name, 60)
+
+    def tearDown(self):
+        tfsl.auth.current_config = self.old_config
+        tfsl.auth.cache_path_created = False
+        self.tempdir.cleanup()
+
+    def test_clean_lexemes(self):
+        for i in range(1, 21):
+            with open(os.path.join(self.tempdir.name, f"L{i}.json"), "w", encoding="utf-8") as fileptr:
+                json.dump(lexeme_json(f"L{i}", "Q110786" if i % 2 else "Q146786"), fileptr)
+        session = PushingSession()
+        pushed = []
+        count = (tfsl.pipeline(f"L{i}" for i in range(1, 21))
+                 .fetch(batch_size=3)
+                 .transform(replace_feature)
+                 .skip_unchanged()
+                 .push(session, "cleaning", on_pushed=lambda lexeme, response: pushed.append(lexeme.id)))
+        self.assertEqual(count, 10)
+        self.assertEqual(pushed, [f"L{i}" for i in range(1, 21, 2)])
+        self.assertEqual([request["summary"] for request in session.sent], ["cleaning"] * 10)
+
+    def test_journal_and_dump(self):
+        dump_path = os.path.join(self.tempdir.name, "lexemes.json.gz")
+        with gzip.open(dump_path, "wt", encoding="utf-8") as fileptr:
+            fileptr.write("[\n" + ",\n".join(json.dumps(lexeme_json(f"L{i}")) for i in range(1, 6)) + "\n]\n")
+        session = PushingSession()
+        with EditJournal(os.path.join(self.tempdir.name, "edits.journal")) as journal:
+            journal.record_completed({"id": "L2", "data": "{}"}, {"lastrevid": 3})
+            count = pipeline(dump_source(dump_path)).skip_completed(journal).fetch().transform(replace_feature).push(session, journal=journal)
+            self.assertEqual(count, 4)
+            self.assertEqual([request["id"] for request in session.sent], ["L1", "L3", "L4", "L5"])
+            self.assertTrue(journal.is_completed("L5"))
+
+    def test_dry_run(self):
+        for i in range(1, 11):
+            with open(os.path.join(self.tempdir.name, f"L{i}.json"), "w", encoding="utf-8") as fileptr:
+                json.dump(lexeme_json(f"L{i}"), fileptr)
+            os.utime(os.path.join(self.tempdir.name, f"L{i}.json"), (0, 0))
+        session = DryRunSession("Bot@tfsl", latency=2.0, max_in_flight=4, edits_per_minute=30)
+        with EditJournal(os.path.join(self.tempdir.name, "edits.journal")) as journal:
+            count = (pipeline(f"L{i}" for i in range(1, 13))
+                     .fetch(cache_only=True)
+                     .transform(replace_feature)
+                     .push(session, "cleaning", journal=journal))
+            self.assertFalse(journal.is_completed("L1"))
+        self.assertEqual(count, 10)
+        report = session.report()
+        self.assertEqual(report.edit_count, 10)
+        self.assertEqual(report.modules, {"wbleditformelements": 10})
+        self.assertTrue(all(0 < edit.payload_bytes < 400 for edit in report.edits))
+        self.assertEqual(report.payload_bytes, sum(edit.payload_bytes for edit in report.edits))
+        self.assertEqual(report.estimated_seconds, 20.0)
+        self.assertIn("10 edits", str(report))
+        with self.assertRaises(RuntimeError):
+            session.get({"action": "query"})
+
+    def test_bounded_map(self):
+        taken = []
+        def source():
+            for i in range(100):
+                taken.append(i)
+                yield i
+        results = bounded_map(lambda x: x * 2, source(), 4, 8)
+        self.assertEqual([next(results) for _ in range(3)], [0, 2, 4])
+        self.assertLessEqual(len(taken), 11)
+        self.assertEqual(list(results), [x * 2 for x in range(3, 100)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from tfsl.changes import (AliasChange, FeatureChange, FormAdded, QualifierAdded, RankChange, ReferenceAdded,
+                          SenseRemoved, SitelinkChange, StatementAdded, StatementRemoved, TextChange, diff)
+from tfsl.claim import Claim
+from tfsl.item import Item
+from tfsl.languages import langs
+from tfsl.lexeme import build_lexeme
+from tfsl.lexemeform import LexemeForm
+from tfsl.reference import Reference
+from tfsl.statement import Rank, Statement
+
+def statement_json(stmt_id, value):
+    return {
+        "id": stmt_id, "type": "statement", "rank": "normal",
+        "mainsnak": {"snaktype": "value", "property": "P1476", "hash": "0123", "datatype": "monolingualtext",
+                     "datavalue": {"value": {"text": value, "language": "en"}, "type": "monolingualtext"}}
+    }
+
+class TestDiffMethods(unittest.TestCase):
+    def setUp(self):
+        self.lexeme_json = {
+            "pageid": 1, "ns": 146, "title": "Lexeme:L1", "lastrevid": 2,
+            "modified": "2021-01-01T00:00:00Z", "type": "lexeme", "id": "L1",
+            "lemmas": {"en": {"language": "en", "value": "dam"}},
+            "language": "Q1860",
+            "lexicalCategory": "Q1084",
+            "claims": {"P1476": [statement_json("L1$1", "dam"), statement_json("L1$2", "weir")]},
+            "forms": [
+                {"id": "L1-F1", "representations": {"en": {"language": "en", "value": "dam"}},
+                 "grammaticalFeatures": ["Q110786"], "claims": {}},
+                {"id": "L1-F2", "representations": {"en": {"language": "en", "value": "dams"}},
+                 "grammaticalFeatures": ["Q146786"], "claims": {}}
+            ],
+            "senses": [{"id": "L1-S1", "glosses": {"en": {"language": "en", "value": "barrier"}}, "claims": {}}]
+        }
+
+    def test_unchanged(self):
+        x = build_lexeme(self.lexeme_json)
+        self.assertEqual(diff(x, x), [])
+        self.assertEqual(diff(x, build_lexeme(self.lexeme_json)), [])
+        self.assertEqual(diff(build_lexeme(self.lexeme_json, lazy=True), build_lexeme(self.lexeme_json)), [])
+
+    def test_lexeme_changes(self):
+        x = build_lexeme(self.lexeme_json)
+        newform = LexemeForm(["dammed" @ langs.en_], ["Q1392475"])
+        changed_form = LexemeForm(x.forms[1].representations, ["Q146786", "Q1"])
+        changed_form.set_published_settings(x.forms[1].get_published_settings())
+        y = (x + ("dam" @ langs.de_) + newform - x.senses[0] - x.forms[1] + changed_form
+             - x["P1476"][1] + Statement("P1476", "barrage" @ langs.en_))
+        changes = diff(x, y)
+        self.assertCountEqual(changes, [
+            TextChange(None, "lemmas", None, "dam" @ langs.de_),
+            FormAdded(None, newform),
+            FeatureChange("L1-F2", frozenset(["Q1"]), frozenset()),
+            SenseRemoved(None, x.senses[0]),
+            StatementRemoved(None, x["P1476"][1]),
+            StatementAdded(None, Statement("P1476", "barrage" @ langs.en_)),
+        ])
+
+    def test_statement_changes(self):
+        x = build_lexeme(self.lexeme_json, lazy=True)
+        old_stmt = x["P1476"][0]
+        qualifier = Claim("P1683", "dam" @ langs.nl_)
+        reference = Reference(Claim("P1476", "source" @ langs.en_))
+        new_stmt = (old_stmt + qualifier + reference) @ Rank.Preferred
+        new_stmt.set_published_settings(old_stmt.get_published_settings())
+        y = x - old_stmt + new_stmt
+        self.assertCountEqual(diff(x, y), [
+            RankChange(None, new_stmt, Rank.Normal, Rank.Preferred),
+            QualifierAdded(None, new_stmt, qualifier),
+            ReferenceAdded(None, new_stmt, reference),
+        ])
+
+    def test_item_changes(self):
+        x = Item(["dam" @ langs.en_], aliases={"en": {"weir"}}, sitelinks={"enwiki": {"site": "enwiki", "title": "Dam"}})
+        y = Item(["barrage" @ langs.en_], aliases={"en": {"weir", "barrage"}})
+        self.assertCountEqual(diff(x, y), [
+            TextChange(None, "labels", "dam" @ langs.en_, "barrage" @ langs.en_),
+            AliasChange(None, "en", frozenset(["barrage"]), frozenset()),
+            SitelinkChange(None, "enwiki", {"site": "enwiki", "title": "Dam"}, None),
+        ])
+
+    def test_mismatched_types(self):
+        with self.assertRaises(TypeError):
+            diff(build_lexeme(self.lexeme_json), Item())
+
+if __name__ == '__main__':
+    unittest.main()
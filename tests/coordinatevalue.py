@@ -0,0 +1,16 @@
+import unittest
+
+from tfsl.coordinatevalue import CoordinateValue
+
+class TestCoordinateValueMethods(unittest.TestCase):
+    def test_coordinatevalue_equality(self):
+        x = CoordinateValue(48.39, -4.49, 0.01)
+        y = CoordinateValue(48.39, -4.49, 0.01)
+        z = CoordinateValue(48.39, -4.49, 0.01, "http://www.wikidata.org/entity/Q405")
+        self.assertEqual(x, y)
+        self.assertEqual(hash(x), hash(y))
+        self.assertNotEqual(x, z)
+        self.assertEqual(len({x, y, z}), 2)
+
+if __name__ == '__main__':
+    unittest.main()
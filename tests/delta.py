@@ -0,0 +1,110 @@
+import copy
+import unittest
+
+from tfsl.delta import lexeme_delta, matches_base, rebase_delta
+from tfsl.languages import langs
+from tfsl.lexeme import build_lexeme
+from tfsl.lexemeform import LexemeForm
+from tfsl.statement import Statement
+
+def text_json(value, language="en"):
+    return {"language": language, "value": value}
+
+def statement_json(stmt_id, value):
+    return {
+        "id": stmt_id, "type": "statement", "rank": "normal",
+        "mainsnak": {"snaktype": "value", "property": "P1476", "hash": "0123", "datatype": "monolingualtext",
+                     "datavalue": {"value": {"text": value, "language": "en"}, "type": "monolingualtext"}}
+    }
+
+class TestDeltaMethods(unittest.TestCase):
+    def setUp(self):
+        self.lexeme_json = {
+            "pageid": 1, "ns": 146, "title": "Lexeme:L1", "lastrevid": 2,
+            "modified": "2021-01-01T00:00:00Z", "type": "lexeme", "id": "L1",
+            "lemmas": {"en": text_json("dam")},
+            "language": "Q1860",
+            "lexicalCategory": "Q1084",
+            "claims": {"P1476": [statement_json("L1$1", "dam")]},
+            "forms": [
+                {"id": f"L1-F{i}", "representations": {"en": text_json(f"dam{i}")},
+                 "grammaticalFeatures": ["Q110786"], "claims": {}}
+                for i in range(1, 101)
+            ],
+            "senses": [{"id": "L1-S1", "glosses": {"en": text_json("barrier")}, "claims": {}}]
+        }
+        self.original_json = copy.deepcopy(self.lexeme_json)
+
+    def test_matches_base(self):
+        base = statement_json("L1$1", "dam")
+        current = dict(copy.deepcopy(base), references=[])
+        del current["mainsnak"]["hash"]
+        self.assertTrue(matches_base(current, base))
+        self.assertFalse(matches_base(base, current))
+        current["rank"] = "preferred"
+        self.assertFalse(matches_base(current, base))
+
+    def test_unchanged_lexeme(self):
+        for lazy in [False, True]:
+            with self.subTest(lazy=lazy):
+                x = build_lexeme(self.lexeme_json, lazy)
+                self.assertEqual(lexeme_delta(x.__jsonout__(), x.base_json), {"id": "L1", "lastrevid": 2})
+
+    def test_changed_feature(self):
+        for lazy in [False, True]:
+            with self.subTest(lazy=lazy):
+                x = build_lexeme(self.lexeme_json, lazy)
+                x.forms[41].features.add("Q146786")
+                delta = lexeme_delta(x.__jsonout__(), x.base_json)
+                self.assertEqual(list(delta), ["id", "lastrevid", "forms"])
+                self.assertEqual(len(delta["forms"]), 1)
+                self.assertEqual(delta["forms"][0]["id"], "L1-F42")
+                self.assertCountEqual(delta["forms"][0]["grammaticalFeatures"], ["Q110786", "Q146786"])
+                self.assertEqual(self.lexeme_json, self.original_json)
+
+    def test_added_parts(self):
+        x = build_lexeme(self.lexeme_json)
+        newstmt = Statement("P1476", "weir" @ langs.en_)
+        y = x + newstmt + LexemeForm(["dams" @ langs.en_]) + ("dam" @ langs.de_)
+        self.assertIs(y.base_json, self.lexeme_json)
+        delta = lexeme_delta(y.__jsonout__(), y.base_json)
+        self.assertEqual(delta["lemmas"], {"de": text_json("dam", "de")})
+        self.assertEqual(delta["claims"], {"P1476": [newstmt.__jsonout__()]})
+        self.assertEqual(len(delta["forms"]), 1)
+        self.assertIn("add", delta["forms"][0])
+        self.assertNotIn("senses", delta)
+
+    def test_removed_statement(self):
+        x = build_lexeme(self.lexeme_json)
+        y = x - x["P1476"][0]
+        delta = lexeme_delta(y.__jsonout__(), y.base_json)
+        self.assertEqual(delta["claims"]["P1476"][0]["id"], "L1$1")
+        self.assertIn("remove", delta["claims"]["P1476"][0])
+
+    def test_rebase(self):
+        x = build_lexeme(self.lexeme_json)
+        x.forms[41].features.add("Q146786")
+        delta = lexeme_delta(x.__jsonout__(), x.base_json)
+        latest = copy.deepcopy(self.lexeme_json)
+        latest["lastrevid"] = 3
+        latest["forms"][40]["grammaticalFeatures"] = ["Q146786"]
+        latest["claims"]["P1476"][0] = statement_json("L1$1", "weir")
+        rebased = rebase_delta(delta, self.lexeme_json, latest)
+        self.assertEqual(rebased, dict(delta, lastrevid=3))
+        latest["forms"][41]["representations"]["de"] = text_json("Damm", "de")
+        self.assertEqual(rebase_delta(delta, self.lexeme_json, latest)["forms"], delta["forms"])
+        latest["forms"][41]["grammaticalFeatures"] = ["Q1"]
+        self.assertIsNone(rebase_delta(delta, self.lexeme_json, latest))
+
+    def test_rebase_statements(self):
+        x = build_lexeme(self.lexeme_json)
+        y = x - x["P1476"][0] + Statement("P1476", "weir" @ langs.en_)
+        delta = lexeme_delta(y.__jsonout__(), y.base_json)
+        latest = dict(copy.deepcopy(self.lexeme_json), lastrevid=3)
+        latest["senses"] = []
+        self.assertEqual(rebase_delta(delta, self.lexeme_json, latest)["lastrevid"], 3)
+        latest["claims"]["P1476"][0]["rank"] = "preferred"
+        self.assertIsNone(rebase_delta(delta, self.lexeme_json, latest))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from tfsl.changes import FeatureChange
+from tfsl.featurerules import FeatureRules, forbid, replace, replacements_to_rules, require
+from tfsl.languages import langs
+from tfsl.lexeme import Lexeme
+from tfsl.lexemeform import LexemeForm
+
+def make_lexeme(*forms):
+    lexeme = Lexeme(["dam" @ langs.en_], langs.en_, "Q1084")
+    for i, (text, features) in enumerate(forms, 1):
+        form = LexemeForm([text @ langs.en_], features)
+        form.id = f"L1-F{i}"
+        lexeme = lexeme + form
+    return lexeme
+
+class TestFeatureRules(unittest.TestCase):
+    def test_replace(self):
+        rules = FeatureRules(replacements_to_rules({"Q47088290": ["Q499327", "Q110786"]}))
+        lexeme = make_lexeme(("dam", ["Q47088290", "Q1"]), ("dams", ["Q146786"]))
+        self.assertEqual(rules.changes(lexeme), [FeatureChange("L1-F1", frozenset(["Q499327", "Q110786"]), frozenset(["Q47088290"]))])
+        self.assertEqual(lexeme.forms[0].features, {"Q47088290", "Q1"})
+        self.assertEqual(len(rules.apply(lexeme)), 1)
+        self.assertEqual(lexeme.forms[0].features, {"Q499327", "Q110786", "Q1"})
+        self.assertEqual(rules.apply(lexeme), [])
+
+    def test_conditions(self):
+        rules = FeatureRules([
+            require(["Q110786"], unless=["Q146786"]),
+            forbid(["Q110786"], when=["Q146786"]),
+            replace("Q56648701", ["Q97130345"], pattern="^[fzc]"),
+        ])
+        lexeme = make_lexeme(("dam", []), ("dams", ["Q146786", "Q110786"]), ("zam", ["Q56648701"]), ("bam", ["Q56648701"]))
+        changes = rules.apply(lexeme)
+        self.assertEqual([change.location for change in changes], ["L1-F1", "L1-F2", "L1-F3", "L1-F4"])
+        self.assertEqual([form.features for form in lexeme.forms],
+                         [{"Q110786"}, {"Q146786"}, {"Q97130345", "Q110786"}, {"Q56648701", "Q110786"}])
+
+    def test_apply_all(self):
+        rules = FeatureRules([replace("Q1", ["Q2"])])
+        lexemes = [make_lexeme(("dam", ["Q1"] if i % 3 else [])) for i in range(30)]
+        for workers in [1, 4]:
+            with self.subTest(workers=workers):
+                results = list(rules.apply_all(lexemes, workers))
+                self.assertEqual([lexeme for lexeme, _ in results], lexemes)
+                self.assertEqual(sum(len(changes) for _, changes in results), 20 if workers == 1 else 0)
+        self.assertTrue(all(lexeme.forms[0].features <= {"Q2"} for lexeme in lexemes))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+""" Tests functionality from the tfsl.formindex module. """
+
+import unittest
+from operator import itemgetter
+
+from tfsl.formindex import FormIndex
+
+class TestFormIndexMethods(unittest.TestCase):
+    """ Holds tests of the FormIndex class. """
+    def setUp(self):
+        self.forms = [{"id": f"L1-F{i}", "grammaticalFeatures": [f"Q{i % 2}", f"Q{10 + i % 3}"]}
+                      for i in range(30)]
+        self.index = FormIndex(itemgetter("id"), itemgetter("grammaticalFeatures"), self.forms)
+
+    def expected(self, forms, inflections, exclusions=()):
+        """ Finds the forms matching a query by checking every form. """
+        return [form for form in forms
+                if all(i in form["grammaticalFeatures"] for i in inflections)
+                and all(i not in form["grammaticalFeatures"] for i in exclusions)]
+
+    def test_query(self):
+        """ Tests that queries match a scan of every form, in the same order. """
+        for inflections, exclusions in [(["Q0"], []), (["Q1", "Q11"], []), (["Q0"], ["Q12"]),
+                                        ([], ["Q1"]), (["Q5"], []), (["Q0", "Q1"], [])]:
+            with self.subTest(inflections=inflections, exclusions=exclusions):
+                self.assertEqual(self.index.query(inflections, exclusions),
+                                 self.expected(self.forms, inflections, exclusions))
+
+    def test_add_and_remove(self):
+        """ Tests that adding and removing forms keeps older indexes intact. """
+        new_form = {"id": "L1-F30", "grammaticalFeatures": ["Q0"]}
+        changed = self.index.remove(self.forms[0]).add(new_form)
+        remaining = self.forms[1:] + [new_form]
+        self.assertEqual(changed.forms, remaining)
+        self.assertEqual(changed.query(["Q0"]), self.expected(remaining, ["Q0"]))
+        self.assertEqual(self.index.query(["Q0"]), self.expected(self.forms, ["Q0"]))
+        self.assertIs(changed.get("L1-F30"), new_form)
+        with self.assertRaises(KeyError):
+            changed.get("L1-F0")
+        self.assertIs(self.index.get("L1-F0"), self.forms[0])
+
+    def test_changed_in_place(self):
+        """ Tests that forms changed in place are removed by what they were indexed under
+            and found by what they have now once the change is reported.
+        """
+        form = self.forms[0]
+        form["grammaticalFeatures"] = ["Q5"]
+        form["id"] = "L1-F99"
+        removed = self.index.remove(form)
+        self.assertNotIn(form, removed.query(["Q0"]))
+        self.assertEqual(removed.query(["Q0"]), self.expected(self.forms[1:], ["Q0"]))
+        self.assertIs(self.index.refresh(), self.index)
+        self.index.change_log.mark(0)
+        refreshed = self.index.refresh()
+        self.assertIs(refreshed.refresh(), refreshed)
+        self.assertEqual(refreshed.query(["Q5"]), [form])
+        self.assertEqual(refreshed.query(["Q0"]), self.expected(self.forms, ["Q0"]))
+        self.assertIs(refreshed.get("L1-F99"), form)
+        with self.assertRaises(KeyError):
+            refreshed.get("L1-F0")
+        self.forms[2]["grammaticalFeatures"] = ["Q1", "Q11"]
+        self.index.change_log.mark(2)
+        self.assertEqual(self.index.refresh().query(["Q1", "Q11"]), self.expected(self.forms, ["Q1", "Q11"]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+""" Tests that importing tfsl stays cheap and free of side effects. """
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import tfsl.auth
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_TIME_BUDGET = 0.5
+
+def run_snippet(snippet):
+    """ Runs the provided code in a fresh interpreter and returns what it printed. """
+    completed = subprocess.run([sys.executable, "-c", snippet], cwd=REPO_ROOT,
+                               capture_output=True, text=True, check=True)
+    return completed.stdout.strip()
+
+class TestPackageImport(unittest.TestCase):
+    """ Holds tests of what importing tfsl does. """
+    def test_import_is_lazy(self):
+        """ Tests that importing tfsl imports none of its submodules. """
+        output = run_snippet("import sys, tfsl; print(sorted(m for m in sys.modules if m.startswith('tfsl') or m == 'requests'))")
+        self.assertEqual(output, "['tfsl']")
+
+    def test_import_interfaces_only(self):
+        """ Tests that importing tfsl.interfaces does not pull in network access. """
+        output = run_snippet("import sys, tfsl.interfaces; print('tfsl.auth' in sys.modules, 'requests' in sys.modules)")
+        self.assertEqual(output, "False False")
+
+    def test_import_time_budget(self):
+        """ Tests that importing tfsl takes less time than the budget above. """
+        output = run_snippet("import time; start = time.perf_counter(); import tfsl; print(time.perf_counter() - start)")
+        self.assertLess(float(output), IMPORT_TIME_BUDGET)
+
+    def test_lazy_attributes(self):
+        """ Tests that names in tfsl are still reachable. """
+        output = run_snippet("import tfsl; print(tfsl.Lexeme.__module__, tfsl.langs.bn_.item, tfsl.interfaces.__name__)")
+        self.assertEqual(output, "tfsl.lexeme Q9610 tfsl.interfaces")
+
+    def test_import_journal(self):
+        """ Tests that tfsl.journal can be imported first, directly or through tfsl. """
+        self.assertEqual(run_snippet("import tfsl.journal; print(tfsl.journal.EditJournal.__name__)"), "EditJournal")
+        self.assertEqual(run_snippet("import tfsl; print(tfsl.EditJournal.__module__)"), "tfsl.journal")
+
+    def test_config_not_read_at_import(self):
+        """ Tests that importing modules which access the network does not read config.ini. """
+        output = run_snippet("import tfsl.lexeme, tfsl.auth; print(tfsl.auth.current_config)")
+        self.assertEqual(output, "None")
+
+class TestConfig(unittest.TestCase):
+    """ Holds tests of setting the configuration programmatically. """
+    def setUp(self):
+        self.old_config = tfsl.auth.current_config
+
+    def tearDown(self):
+        tfsl.auth.current_config = self.old_config
+        tfsl.auth.cache_path_created = False
+
+    def test_set_config(self):
+        """ Tests that the cache folder is only created once it is used. """
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache_dir = os.path.join(tempdir, "cache")
+            tfsl.auth.set_config(cache_dir, 60)
+            self.assertEqual(tfsl.auth.get_config(), (cache_dir, 60.0))
+            self.assertFalse(os.path.exists(cache_dir))
+            filename = tfsl.auth.get_filename("L1")
+            self.assertEqual(filename, os.path.join(cache_dir, "L1.json"))
+            self.assertTrue(os.path.isdir(cache_dir))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from tfsl.item import Item
+from tfsl.languages import langs
+from tfsl.statement import Statement
+
+class TestItemMethods(unittest.TestCase):
+    def setUp(self):
+        self.property = "P1476"
+        self.property2 = "P1683"
+        self.value_mt1 = "দাম" @ langs.bn_
+        self.value_mt2 = "dam" @ langs.en_
+        self.label1 = "dam" @ langs.en_
+        self.label2 = "barrage" @ langs.fr_
+        self.stmtlist = [Statement(self.property, self.value_mt1)]
+        self.x = Item([self.label1], [], {"en": {"weir"}}, self.stmtlist)
+
+    def test_item_edit(self):
+        newstmt = Statement(self.property2, self.value_mt2)
+        with self.x.edit() as editor:
+            editor += newstmt
+            editor -= self.stmtlist[0]
+            editor.add_label(self.label2)
+            editor.sub_label(langs.en_)
+            editor.aliases["en"].add("dyke")
+        y = editor.result
+        self.assertEqual(self.x.statements.statements, {self.property: self.stmtlist})
+        self.assertEqual(self.x.aliases, {"en": {"weir"}})
+        self.assertEqual(y.statements.statements, {self.property2: [newstmt]})
+        self.assertEqual(list(y.statements.removed_statements), [self.property])
+        self.assertEqual(y.get_label(langs.fr_), self.label2)
+        self.assertEqual(len(y.labels), 1)
+        self.assertEqual(y.aliases, {"en": {"weir", "dyke"}})
+
+if __name__ == '__main__':
+    unittest.main()
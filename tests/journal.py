@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from tfsl.journal import EditJournal, get_payload_hash
+
+def request(entity_id, data, baserevid="2"):
+    return {"action": "wbeditentity", "id": entity_id, "baserevid": baserevid, "data": data}
+
+class TestEditJournal(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "edits.journal")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_resume(self):
+        with EditJournal(self.path) as journal:
+            journal.record_planned(request("L1", '{"id": "L1"}'))
+            journal.record_completed(request("L1", '{"id": "L1"}'), {"entity": {"lastrevid": 3}, "success": 1})
+            journal.record_planned(request("L2", '{"id": "L2"}'))
+            journal.record_planned(request("L3", '{"id": "L3"}'))
+            journal.record_completed(request("L3", '{"id": "L3"}'), {"pageinfo": {"lastrevid": 4}, "success": 1})
+        with open(self.path, "a", encoding="utf-8") as fileptr:
+            fileptr.write('{"event": "compl')
+
+        with EditJournal(self.path) as journal:
+            self.assertTrue(journal.is_completed("L1"))
+            self.assertTrue(journal.is_completed("L1", get_payload_hash(request("L1", '{"id": "L1"}'))))
+            self.assertFalse(journal.is_completed("L1", get_payload_hash(request("L1", '{"id": "L1", "x": 1}'))))
+            self.assertFalse(journal.is_completed("L2"))
+            self.assertEqual(journal.completed["L3"]["revid"], 4)
+            self.assertEqual(journal.completed["L1"]["baserevid"], 2)
+            self.assertEqual(list(journal.get_unfinished()), ["L2"])
+            journal.record_completed(request("L2", '{"id": "L2"}'), {"lastrevid": 5, "success": 1})
+            self.assertEqual(journal.get_unfinished(), {})
+
+    def test_record_after_cut_line(self):
+        with EditJournal(self.path) as journal:
+            journal.record_planned(request("L1", '{"id": "L1"}'))
+        with open(self.path, "a", encoding="utf-8") as fileptr:
+            fileptr.write('{"event": "compl')
+        with EditJournal(self.path) as journal:
+            journal.record_completed(request("L1", '{"id": "L1"}'), {"lastrevid": 3, "success": 1})
+        with EditJournal(self.path) as journal:
+            self.assertTrue(journal.is_completed("L1"))
+            self.assertEqual(journal.get_unfinished(), {})
+
+if __name__ == '__main__':
+    unittest.main()
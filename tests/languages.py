@@ -1,6 +1,8 @@
+import copy
+import pickle
 import unittest
 
-from tfsl.languages import langs
+from tfsl.languages import Language, get_first_lang, langs
 
 class TestLanguageMethods(unittest.TestCase):
     def setUp(self):
@@ -24,5 +26,32 @@ class TestLanguageMethods(unittest.TestCase):
         self.assertNotEqual(self.language, "Q33173")
         self.assertEqual(self.language2, "Q33173")
 
+    def test_canonical_langs(self):
+        self.assertIs(Language("bn", "Q9610"), self.language)
+        self.assertIs(copy.copy(self.language), self.language)
+        self.assertIs(copy.deepcopy(self.language), self.language)
+        self.assertIs(pickle.loads(pickle.dumps(self.language)), self.language)
+        self.assertEqual(hash(Language("bn", "Q9610")), hash(self.language))
+        self.assertNotEqual(Language("bn", "Q33173"), self.language)
+
+    def test_find_langs(self):
+        self.assertEqual(langs.find("bn"), [self.language])
+        self.assertEqual(langs.find("Q22283016"), [langs.mis_, langs.und_])
+        self.assertEqual(get_first_lang("bn-x-Q48726740"), langs.bangali_)
+        self.assertIs(langs.find("xyz")[0], langs.find("xyz")[0])
+        self.assertEqual(get_first_lang("xyz").item, "Q22282914")
+        self.assertEqual(get_first_lang("xyz-x-Q5").item, "Q5")
+        self.assertFalse(hasattr(langs, "xyz_"))
+
+    def test_custom_langs(self):
+        self.assertEqual(get_first_lang("qaa").item, "Q22282914")
+        langs.qaa_ = Language("qaa", "Q1568")
+        self.assertIs(get_first_lang("qaa"), langs.qaa_)
+        self.assertIs(get_first_lang("Q1568"), langs.qaa_)
+
+    def test_invalid_item(self):
+        with self.assertRaises(ValueError):
+            Language("bn", "bn")
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,10 +2,10 @@ import unittest
 
 from tfsl.claim import Claim
 from tfsl.languages import langs
-from tfsl.lexeme import Lexeme
+from tfsl.lexeme import L_, Lexeme, build_lexeme
 from tfsl.lexemeform import LexemeForm
 from tfsl.lexemesense import LexemeSense
-from tfsl.statement import Statement
+from tfsl.statement import Rank, Statement
 
 class TestLexemeMethods(unittest.TestCase):
     def setUp(self):
@@ -80,12 +80,195 @@ class TestLexemeMethods(unittest.TestCase):
         self.assertEqual(y.senses, self.senselist)
         self.assertEqual(self.x.forms, self.formlist)
         self.assertEqual(y.forms, [self.formlist[0], self.formlist[1], newform])
-        
+
+    def test_lexeme_get_forms(self):
+        form1 = LexemeForm([self.rep6], [self.feature1, self.feature2])
+        form2 = LexemeForm([self.rep7], [self.feature1, self.feature3])
+        form3 = LexemeForm([self.rep8], [self.feature1])
+        form2.set_published_settings({"id": "L1-F2"})
+        y = self.x + form1 + form2
+        self.assertEqual(y.get_forms([self.feature1]), [form1, form2])
+        self.assertEqual(y.get_forms([self.feature1], [self.feature2]), [form2])
+        self.assertEqual(y.get_forms([self.feature2, self.feature3]), [])
+        self.assertEqual(y.get_forms([], [self.feature3]), self.formlist + [form1])
+        self.assertEqual(y["L1-F2"], form2)
+        self.assertIs(y["L1-F2"], y.forms[-1])
+        z = y - form1 + form3
+        self.assertIs(z.form_index.forms, z.forms)
+        self.assertEqual(z.get_forms([self.feature1]), [form2, form3])
+        self.assertEqual(z.get_forms([self.feature2]), [])
+        self.assertEqual(y.get_forms([self.feature1]), [form1, form2])
+        z.forms = [form3]
+        self.assertEqual(z.get_forms([self.feature1]), [form3])
+        with self.assertRaises(KeyError):
+            z["L1-F2"] # pylint: disable=pointless-statement
+
+    def test_lexeme_get_forms_changed_in_place(self):
+        form1 = LexemeForm([self.rep6], [self.feature1])
+        form2 = LexemeForm([self.rep7], [self.feature1, self.feature2])
+        form1.set_published_settings({"id": "L1-F1"})
+        y = self.x + form1 + form2
+        self.assertEqual(y.get_forms([self.feature1]), [form1, form2])
+        form1, form2 = y.forms[-2:]
+        form1.features.add(self.feature3)
+        form2.features.discard(self.feature1)
+        self.assertEqual(y.get_forms([self.feature3]), [form1])
+        self.assertEqual(y.get_forms([self.feature1]), [form1])
+        form1.id = "L1-F3"
+        self.assertIs(y["L1-F3"], form1)
+        with self.assertRaises(KeyError):
+            y["L1-F1"] # pylint: disable=pointless-statement
+        z = y - form1
+        self.assertEqual(z.forms, self.formlist + [form2])
+        self.assertEqual(z.get_forms([self.feature3]), [])
+        self.assertEqual(z.get_forms([self.feature2]), [form2])
+
+    def test_lexeme_shared_parts_copied(self):
+        with self.assertRaises(TypeError):
+            self.x.forms.append(LexemeForm([self.rep6]))
+        with self.assertRaises(TypeError):
+            self.x.senses.extend(self.senselist)
+        y = self.x + LexemeForm([self.rep6], [self.feature1])
+        y.forms[0].features.add(self.feature3)
+        y[self.property][0].rank = Rank.Preferred
+        self.assertNotIn(self.feature3, self.x.forms[0].features)
+        self.assertEqual(self.x[self.property][0].rank, Rank.Normal)
+        self.x.forms[1].features.add(self.feature2)
+        self.assertNotIn(self.feature2, y.forms[1].features)
+        self.assertEqual(y.get_forms([self.feature3]), [y.forms[0]])
+        self.assertEqual(self.x.get_forms([self.feature3]), [])
+
+    def test_lexeme_edit(self):
+        newstmt = Statement(self.property2, self.value_mt2)
+        newforms = [LexemeForm([f"dam{i}" @ langs.en_]) for i in range(40)]
+        self.x.set_published_settings({"pageid": 1, "ns": 146, "title": "Lexeme:L1", "lastrevid": 2,
+                                       "modified": "2021-01-01T00:00:00Z", "type": "lexeme", "id": "L1"})
+        with self.x.edit() as editor:
+            editor += newstmt
+            editor -= self.stmtlist[0]
+            editor -= self.senselist[0]
+            for form in newforms:
+                editor += form
+            editor += self.rep3
+        y = editor.result
+        self.assertEqual(self.x.forms, self.formlist)
+        self.assertEqual(self.x.senses, self.senselist)
+        self.assertCountEqual(self.x.statements.statements, {self.property: self.stmtlist})
+        self.assertEqual(y.forms, self.formlist + newforms)
+        self.assertEqual(y.senses, [self.senselist[1]])
+        self.assertEqual(y.statements.statements, {self.property2: [newstmt]})
+        self.assertEqual(list(y.statements.removed_statements), [self.property])
+        self.assertEqual(y.lemmata[langs.ur_], self.rep3)
+        self.assertEqual(y.get_published_settings(), self.x.get_published_settings())
+
+    def test_lexeme_edit_error(self):
+        with self.assertRaises(NotImplementedError):
+            with self.x.edit() as editor:
+                editor += self.category
+        self.assertIsNone(editor.result)
+
+    def test_lexeme_jsonout_cache(self):
+        first = self.x.__jsonout__()
+        self.assertIs(self.x.__jsonout__(), first)
+        y = self.x + LexemeForm([self.rep5], [self.feature1])
+        second = y.__jsonout__()
+        self.assertIsNot(second, first)
+        self.assertIs(second["forms"][0], first["forms"][0])
+        self.assertIs(second["senses"][1], first["senses"][1])
+        self.assertIs(second["claims"], first["claims"])
+        y.forms[0].features.add(self.feature2)
+        third = y.__jsonout__()
+        self.assertIsNot(third, second)
+        self.assertEqual(third["forms"][0]["grammaticalFeatures"], [self.feature2])
+        self.assertIs(third["forms"][1], second["forms"][1])
+
     # def test_lexeme_remove_statement(self):
     # def test_lexeme_remove_sense(self):
     # def test_lexeme_remove_form(self):
     # def test_lexeme_change_language(self):
     # def test_lexeme_change_category(self):
 
+class TestRawLexemeMethods(unittest.TestCase):
+    def setUp(self):
+        self.lexeme_json = {
+            "id": "L1",
+            "lemmas": {"en": {"language": "en", "value": "dam"}},
+            "language": "Q1860",
+            "lexicalCategory": "Q1084",
+            "claims": {"P1476": [{
+                "mainsnak": {"snaktype": "value", "property": "P1476",
+                             "datavalue": {"value": {"text": "dam", "language": "en"}, "type": "monolingualtext"}},
+                "type": "statement", "rank": "normal"
+            }]},
+            "forms": [
+                {"id": "L1-F1", "representations": {"en": {"language": "en", "value": "dam"}},
+                 "grammaticalFeatures": ["Q110786"], "claims": {}},
+                {"id": "L1-F2", "representations": {"en": {"language": "en", "value": "dams"}},
+                 "grammaticalFeatures": ["Q146786"], "claims": {}}
+            ],
+            "senses": [{"id": "L1-S1", "glosses": {"en": {"language": "en", "value": "barrier"}}, "claims": {}}]
+        }
+        self.x = L_.from_json(self.lexeme_json)
+
+    def test_memoized_views(self):
+        self.assertIs(self.x.lemmata, self.x.lemmata)
+        self.assertIs(self.x["P1476"], self.x.get_stmts("P1476"))
+        self.assertIs(self.x[langs.en_], self.x[langs.en_])
+        self.assertIs(self.x["L1-F2"], self.x.get_forms()[1])
+        self.assertIs(self.x.get_forms(["Q146786"])[0], self.x.get_forms()[1])
+        self.assertIs(self.x["S1"], self.x.get_senses()[0])
+        form = self.x["F1"]
+        self.assertIs(form.representations, form.representations)
+
+    def test_clear_views(self):
+        lemmata = self.x.lemmata
+        self.lexeme_json["lemmas"]["en"]["value"] = "weir"
+        self.assertIs(self.x.lemmata, lemmata)
+        self.x.clear_views()
+        self.assertEqual(self.x.lemmata[langs.en_], "weir" @ langs.en_)
+        self.x.set_json(dict(self.lexeme_json, forms=[]))
+        self.assertEqual(len(self.x.get_forms()), 0)
+        with self.assertRaises(KeyError):
+            self.x["F1"] # pylint: disable=pointless-statement
+
+    def test_lazy_lexeme(self):
+        x = build_lexeme(self.lexeme_json, lazy=True)
+        self.assertIsNone(x.statements.statement_map["P1476"].built)
+        self.assertIs(x.forms[0].__jsonout__(), self.lexeme_json["forms"][0])
+        self.assertIs(x.senses[0].__jsonout__(), self.lexeme_json["senses"][0])
+        self.assertIs(x.__jsonout__()["claims"]["P1476"][0], self.lexeme_json["claims"]["P1476"][0])
+        self.assertEqual(x["P1476"][0].value, "dam" @ langs.en_)
+
+        x.forms[1].features.add("Q1")
+        form_json = x.forms[1].__jsonout__()
+        self.assertIsNot(form_json, self.lexeme_json["forms"][1])
+        self.assertCountEqual(form_json["grammaticalFeatures"], ["Q146786", "Q1"])
+        self.assertEqual(form_json["id"], "L1-F2")
+
+        y = x + Statement("P1476", "weir" @ langs.en_)
+        claims_json = y.__jsonout__()["claims"]["P1476"]
+        self.assertEqual(len(claims_json), 2)
+        self.assertEqual(claims_json[1]["mainsnak"]["datavalue"]["value"], {"text": "weir", "language": "en"})
+
+    def test_lazy_lexeme_statement_changed(self):
+        self.lexeme_json["forms"][0]["claims"] = {"P1476": self.lexeme_json["claims"]["P1476"]}
+        x = build_lexeme(self.lexeme_json, lazy=True)
+        self.assertIs(x.forms[0].__jsonout__(), self.lexeme_json["forms"][0])
+        x.forms[0]["P1476"][0].rank = Rank.Preferred
+        x["P1476"][0].rank = Rank.Deprecated
+        lexeme_json = x.__jsonout__()
+        self.assertEqual(lexeme_json["forms"][0]["claims"]["P1476"][0]["rank"], "preferred")
+        self.assertEqual(lexeme_json["claims"]["P1476"][0]["rank"], "deprecated")
+        self.assertEqual(self.lexeme_json["claims"]["P1476"][0]["rank"], "normal")
+        self.assertIs(lexeme_json["forms"][1], self.lexeme_json["forms"][1])
+
+    def test_lazy_lexeme_matches_eager(self):
+        eager = build_lexeme(self.lexeme_json).__jsonout__()
+        lazy = build_lexeme(self.lexeme_json, lazy=True).__jsonout__()
+        self.assertEqual(eager["lemmas"], lazy["lemmas"])
+        self.assertEqual([form["id"] for form in eager["forms"]], [form["id"] for form in lazy["forms"]])
+        self.assertEqual(eager["claims"]["P1476"][0]["mainsnak"]["datavalue"],
+                         lazy["claims"]["P1476"][0]["mainsnak"]["datavalue"])
+
 if __name__ == '__main__':
     unittest.main()
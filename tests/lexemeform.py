@@ -2,8 +2,8 @@ import unittest
 
 from tfsl.claim import Claim
 from tfsl.languages import langs
-from tfsl.lexemeform import LexemeForm
-from tfsl.statement import Statement
+from tfsl.lexemeform import LexemeForm, build_form
+from tfsl.statement import Rank, Statement
 
 class TestFormMethods(unittest.TestCase):
     def setUp(self):
@@ -140,6 +140,43 @@ class TestFormMethods(unittest.TestCase):
         self.assertCountEqual(y.features, featlist)
         self.assertEqual(y.statements, {self.property: [stmtlist[0]]})
 
+    def test_lexemeform_fingerprint(self):
+        stmtlist = [Statement(self.property, self.value_mt1)]
+        x = LexemeForm([self.rep1, self.rep2], [self.feature1, self.feature2], stmtlist)
+        y = LexemeForm([self.rep2, self.rep1], [self.feature2, self.feature1], stmtlist)
+        self.assertEqual(x, y)
+        self.assertEqual(len({x.fingerprint, y.fingerprint}), 1)
+        with self.assertRaises(TypeError):
+            hash(x)
+        self.assertNotEqual(x, x + self.value_mt2)
+        self.assertNotEqual(x, x + Statement(self.property, self.value_mt2))
+        y.features.add(self.feature3)
+        self.assertNotEqual(x, y)
+
+    def test_lexemeform_fingerprint_statement_changed(self):
+        x = LexemeForm([self.rep1], [self.feature1], [Statement(self.property, self.value_mt1)])
+        y = LexemeForm([self.rep1], [self.feature1], [Statement(self.property, self.value_mt1)])
+        self.assertEqual(x, y)
+        x.statements[self.property][0].rank = Rank.Preferred
+        self.assertNotEqual(x, y)
+
+    def test_lexemeform_lazy_equality(self):
+        form_json = {"id": "L1-F1", "representations": {"en": {"language": "en", "value": "dam"}},
+                     "grammaticalFeatures": [self.feature1],
+                     "claims": {self.property: [{"mainsnak": {"snaktype": "value", "property": self.property,
+                                                               "datavalue": {"value": {"text": "dam", "language": "en"}}},
+                                                  "type": "statement", "rank": "normal"}]}}
+        x = build_form(form_json, lazy=True)
+        y = build_form(form_json, lazy=True)
+        self.assertEqual(x, y)
+        self.assertIsNone(x.statements.statement_map[self.property].built)
+        self.assertIsNone(y.statements.statement_map[self.property].built)
+        x.statements[self.property][0].rank = Rank.Preferred
+        self.assertNotEqual(x, y)
+        self.assertNotEqual(x, build_form(form_json))
+        self.assertEqual(y, build_form(form_json))
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,52 @@
+import unittest
+
+from tfsl.languages import langs
+from tfsl.monolingualtextholder import MonolingualTextHolder
+
+class TestMonolingualTextHolderMethods(unittest.TestCase):
+    def setUp(self):
+        self.rep1 = "दाम" @ langs.hi_
+        self.rep2 = "دام" @ langs.ur_
+        self.rep3 = "دم" @ langs.ur_
+        self.rep4 = "dam" @ langs.en_
+        self.x = MonolingualTextHolder([self.rep1, self.rep2, self.rep4])
+
+    def test_holder_lookup(self):
+        self.assertEqual(self.x[langs.ur_], self.rep2)
+        self.assertEqual(self.x[self.rep4], self.rep4)
+        self.assertIn(langs.hi_, self.x)
+        self.assertIn(self.rep2, self.x)
+        self.assertNotIn(self.rep3, self.x)
+        self.assertNotIn(langs.bn_, self.x)
+        with self.assertRaises(KeyError):
+            self.x[langs.bn_] # pylint: disable=pointless-statement
+        with self.assertRaises(KeyError):
+            self.x[self.rep3] # pylint: disable=pointless-statement
+
+    def test_holder_replace(self):
+        y = self.x + self.rep3
+        self.assertEqual(list(y), [self.rep1, self.rep4, self.rep3])
+        self.assertEqual(list(self.x), [self.rep1, self.rep2, self.rep4])
+        self.assertEqual(y[langs.ur_], self.rep3)
+
+    def test_texts_read_only(self):
+        self.assertEqual(self.x.texts, (self.rep1, self.rep2, self.rep4))
+        with self.assertRaises(AttributeError):
+            self.x.texts.pop() # pylint: disable=no-member
+        self.assertEqual(len(self.x), 3)
+
+    def test_holder_remove(self):
+        y = self.x - langs.ur_
+        z = y - self.rep4
+        self.assertEqual(list(z), [self.rep1])
+        self.assertEqual(len(self.x), 3)
+        self.assertEqual(list(self.x.removed_texts), [])
+        self.assertEqual(list(y.removed_texts), [self.rep2])
+        self.assertEqual(z.__jsonout__(), {
+            "ur": {"value": self.rep2.text, "language": "ur", "remove": ""},
+            "en": {"value": self.rep4.text, "language": "en", "remove": ""},
+            "hi": {"value": self.rep1.text, "language": "hi"}
+        })
+
+if __name__ == '__main__':
+    unittest.main()
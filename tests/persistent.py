@@ -0,0 +1,112 @@
+""" Tests functionality from the tfsl.persistent module. """
+
+import unittest
+
+from tfsl.persistent import PMap, PVector, pvector
+
+class CollidingKey:
+    """ A key whose hash collides with that of many other keys. """
+    def __init__(self, key):
+        self.key = key
+
+    def __hash__(self):
+        return self.key % 3
+
+    def __eq__(self, rhs):
+        return isinstance(rhs, CollidingKey) and self.key == rhs.key
+
+class TestPVectorMethods(unittest.TestCase):
+    """ Holds tests of the PVector class. """
+    def test_append(self):
+        """ Tests that appending keeps older versions intact. """
+        versions = [PVector()]
+        for i in range(1100):
+            versions.append(versions[-1].appended(i))
+        for length in [0, 1, 32, 33, 1024, 1025, 1056, 1057, 1100]:
+            with self.subTest(length=length):
+                self.assertEqual(len(versions[length]), length)
+                self.assertEqual(list(versions[length]), list(range(length)))
+        self.assertEqual(versions[-1][-1], 1099)
+        self.assertEqual(versions[-1], PVector(range(1100)))
+
+    def test_set(self):
+        """ Tests replacing elements inside the trie and inside the tail. """
+        original = PVector(range(100))
+        changed = original.set(5, "a").set(99, "b")
+        self.assertEqual(changed[5], "a")
+        self.assertEqual(changed[99], "b")
+        self.assertEqual(list(original), list(range(100)))
+        with self.assertRaises(IndexError):
+            original.set(100, "c")
+
+    def test_without(self):
+        """ Tests removing elements by value. """
+        original = PVector([1, 2, 1, 3])
+        self.assertEqual(original.without(1), [2, 3])
+        self.assertIs(original.without(4), original)
+
+    def test_compare(self):
+        """ Tests comparisons with lists. """
+        self.assertEqual(PVector([1, 2]), [1, 2])
+        self.assertEqual([1, 2], PVector([1, 2]))
+        self.assertNotEqual(PVector([1, 2]), [2, 1])
+
+    def test_in_place_methods(self):
+        """ Tests that the list methods changing a list in place raise rather than doing nothing. """
+        original = PVector([1])
+        with self.assertRaises(TypeError):
+            original.append(2)
+        with self.assertRaises(TypeError):
+            original.extend([2])
+        self.assertEqual(original.extended([2, 3]), [1, 2, 3])
+        self.assertEqual(original, [1])
+
+    def test_pvector(self):
+        """ Tests that pvector does not copy PVectors. """
+        original = PVector([1])
+        self.assertIs(pvector(original), original)
+        self.assertEqual(pvector(None), [])
+
+class TestPMapMethods(unittest.TestCase):
+    """ Holds tests of the PMap class. """
+    def test_set_and_discard(self):
+        """ Tests that changes keep older versions intact and preserve insertion order. """
+        original = PMap({"a": 1, "b": 2})
+        changed = original.set("c", 3).set("a", 4).discard("b")
+        self.assertEqual(list(changed.items()), [("a", 4), ("c", 3)])
+        self.assertEqual(original, {"a": 1, "b": 2})
+        self.assertIs(original.discard("z"), original)
+        self.assertNotIn("b", changed)
+        with self.assertRaises(KeyError):
+            changed["b"] # pylint: disable=pointless-statement
+
+    def test_in_place_methods(self):
+        """ Tests that updating a map in place raises rather than doing nothing. """
+        original = PMap({"a": 1})
+        with self.assertRaises(TypeError):
+            original.update({"b": 2})
+        self.assertEqual(original.updated({"b": 2}), {"a": 1, "b": 2})
+        self.assertEqual(original, {"a": 1})
+
+    def test_reinsertion_order(self):
+        """ Tests that a key removed and then added again goes last. """
+        current = PMap({"a": 1, "b": 2}).discard("a").set("a", 3)
+        self.assertEqual(list(current), ["b", "a"])
+
+    def test_many_keys(self):
+        """ Tests against a dict with many keys, including colliding ones. """
+        current = PMap()
+        expected = {}
+        for i in range(2000):
+            key = CollidingKey(i % 50) if i % 3 == 0 else i % 700
+            if i % 4 == 0:
+                current = current.discard(key)
+                expected.pop(key, None)
+            else:
+                current = current.set(key, i)
+                expected[key] = i
+        self.assertEqual(current, expected)
+        self.assertEqual(list(current), list(expected))
+
+if __name__ == '__main__':
+    unittest.main()
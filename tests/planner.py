@@ -0,0 +1,86 @@
+import json
+import unittest
+
+from tfsl.auth import WikibaseSession
+from tfsl.delta import lexeme_delta
+from tfsl.languages import langs
+from tfsl.lexeme import build_lexeme
+from tfsl.lexemeform import LexemeForm
+from tfsl.lexemesense import LexemeSense
+from tfsl.planner import plan_request
+from tfsl.statement import Statement
+
+def statement_json(stmt_id, value):
+    return {
+        "id": stmt_id, "type": "statement", "rank": "normal",
+        "mainsnak": {"snaktype": "value", "property": "P1476", "hash": "0123", "datatype": "monolingualtext",
+                     "datavalue": {"value": {"text": value, "language": "en"}, "type": "monolingualtext"}}
+    }
+
+class TestPlannerMethods(unittest.TestCase):
+    def setUp(self):
+        self.lexeme = build_lexeme({
+            "pageid": 1, "ns": 146, "title": "Lexeme:L1", "lastrevid": 2,
+            "modified": "2021-01-01T00:00:00Z", "type": "lexeme", "id": "L1",
+            "lemmas": {"en": {"language": "en", "value": "dam"}},
+            "language": "Q1860",
+            "lexicalCategory": "Q1084",
+            "claims": {"P1476": [statement_json("L1$1", "dam"), statement_json("L1$2", "weir")]},
+            "forms": [{"id": "L1-F1", "representations": {"en": {"language": "en", "value": "dams"}},
+                       "grammaticalFeatures": ["Q146786"], "claims": {}}],
+            "senses": [{"id": "L1-S1", "glosses": {"en": {"language": "en", "value": "barrier"}}, "claims": {}}]
+        })
+        self.session = WikibaseSession.__new__(WikibaseSession)
+        self.session.assert_user = "Bot"
+
+    def plan(self, lexeme_in):
+        return plan_request(self.session.build_push_request(lexeme_in, "summary"))
+
+    def test_form_changes(self):
+        newform = LexemeForm(["dammed" @ langs.en_], ["Q1392475"])
+        request = self.plan(self.lexeme + newform)
+        self.assertEqual(request["action"], "wbladdform")
+        self.assertEqual(request["lexemeId"], "L1")
+        self.assertEqual(json.loads(request["data"]), {"representations": {"en": {"language": "en", "value": "dammed"}},
+                                                       "grammaticalFeatures": ["Q1392475"]})
+        self.assertEqual((request["summary"], request["assertuser"], request["baserevid"]), ("summary", "Bot", "2"))
+
+        x = self.lexeme
+        x.forms[0].features.add("Q1")
+        request = self.plan(x)
+        self.assertEqual(request["action"], "wbleditformelements")
+        self.assertEqual(request["formId"], "L1-F1")
+        self.assertCountEqual(json.loads(request["data"])["grammaticalFeatures"], ["Q1", "Q146786"])
+
+
+    def test_sense_changes(self):
+        request = self.plan(self.lexeme + LexemeSense(["barrage" @ langs.fr_]))
+        self.assertEqual((request["action"], request["lexemeId"]), ("wbladdsense", "L1"))
+        request = plan_request({"action": "wbeditentity", "id": "L1", "baserevid": "2",
+                                "data": json.dumps({"id": "L1", "senses": [{"id": "L1-S1", "remove": ""}]})})
+        self.assertEqual(request, {"action": "wblremovesense", "id": "L1-S1", "baserevid": "2"})
+
+    def test_statement_changes(self):
+        newstmt = Statement("P1476", "barrage" @ langs.en_)
+        request = self.plan(self.lexeme + newstmt)
+        self.assertEqual(request["action"], "wbsetclaim")
+        claim = json.loads(request["claim"])
+        self.assertTrue(claim["id"].startswith("L1$"))
+        self.assertEqual(claim["mainsnak"], newstmt.__jsonout__()["mainsnak"])
+
+        request = self.plan(self.lexeme - self.lexeme["P1476"][0] - self.lexeme["P1476"][1])
+        self.assertEqual(request["action"], "wbremoveclaims")
+        self.assertCountEqual(request["claim"].split("|"), ["L1$1", "L1$2"])
+
+    def test_fallback(self):
+        for lexeme_out in [
+            self.lexeme + ("dam" @ langs.de_),
+            self.lexeme + Statement("P1476", "barrage" @ langs.en_) + LexemeSense(["barrage" @ langs.fr_]),
+            self.lexeme,
+        ]:
+            request = self.plan(lexeme_out)
+            self.assertEqual(request["action"], "wbeditentity")
+            self.assertEqual(json.loads(request["data"]), lexeme_delta(lexeme_out.__jsonout__(), lexeme_out.base_json))
+
+if __name__ == '__main__':
+    unittest.main()
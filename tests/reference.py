@@ -60,5 +60,18 @@ class TestReferenceMethods(unittest.TestCase):
         self.assertNotIn(self.claim1, x)
         self.assertIn(self.claim2, x)
 
+    def test_ref_fingerprint(self):
+        x = Reference(self.claim1, self.claim3)
+        y = Reference(self.claim3, self.claim1)
+        z = Reference(self.claim1, Claim(self.prop2, self._text4))
+        self.assertEqual(x, y)
+        self.assertNotEqual(x, z)
+        self.assertEqual(len({x, y, z}), 2)
+        fingerprint = x.fingerprint
+        del x[self.prop2]
+        self.assertNotEqual(x.fingerprint, fingerprint)
+        self.assertEqual(x, Reference(self.claim1))
+
+
 if __name__ == '__main__':
     unittest.main()
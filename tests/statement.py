@@ -144,6 +144,37 @@ class TestStatementMethods(unittest.TestCase):
         self.assertEqual(y.qualifiers, {})
         self.assertCountEqual(y.references, [])
     
+    def test_statement_jsonout_cache(self):
+        reference = Reference(Claim("P1922", self.value_r1), Claim("P1448", self.value_q1))
+        x = Statement(self.property, self.value_mt, Rank.Preferred, [Claim("P1683", self.value_q2)], [reference])
+        first = x.__jsonout__()
+        self.assertIs(x.__jsonout__(), first)
+        self.assertEqual(first["mainsnak"], Claim(self.property, self.value_mt).__jsonout__())
+        self.assertEqual(first["qualifiers-order"], ["P1683"])
+        del reference["P1448"]
+        second = x.__jsonout__()
+        self.assertIsNot(second, first)
+        self.assertEqual(second["references"][0]["snaks-order"], ["P1922"])
+        x.rank = Rank.Deprecated
+        self.assertEqual(x.__jsonout__()["rank"], "deprecated")
+
+    def test_statement_fingerprint(self):
+        quallist = [Claim("P1448", self.value_q1), Claim("P1683", self.value_q2)]
+        reference = Reference(Claim("P1922", self.value_r1))
+        x = Statement(self.property, self.value_mt, Rank.Preferred, quallist, [reference])
+        y = Statement(self.property, self.value_mt, Rank.Preferred, quallist[::-1], [reference])
+        y.id = "L1$1"
+        self.assertEqual(x, y)
+        self.assertEqual(len({x.fingerprint, y.fingerprint}), 1)
+        with self.assertRaises(TypeError):
+            hash(x)
+        self.assertNotEqual(x, x @ Rank.Normal)
+        self.assertNotEqual(x, Statement(self.property, self.value_mt2, Rank.Preferred, quallist, [reference]))
+        self.assertNotEqual(Statement("P1683", False), Statement("P1683", True))
+        fingerprint = x.fingerprint
+        reference += Claim("P1448", self.value_q1)
+        self.assertEqual(x.fingerprint, fingerprint)
+
     # TODO: once loading items from Wikidata, verify that setting value to different type disallowed
 
 if __name__ == '__main__':
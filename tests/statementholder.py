@@ -0,0 +1,114 @@
+import unittest
+
+from tfsl.claim import Claim, build_value
+from tfsl.itemvalue import ItemValue
+from tfsl.languages import langs
+from tfsl.quantityvalue import QuantityValue
+from tfsl.statement import Rank, Statement
+from tfsl.statementholder import StatementHolder, haswbstatement
+from tfsl.timevalue import TimeValue
+
+def snak_json(prop, value=None, snaktype="value"):
+    mainsnak = {"snaktype": snaktype, "property": prop}
+    if value is not None:
+        mainsnak["datavalue"] = {"value": value}
+    return {"mainsnak": mainsnak, "type": "statement", "rank": "normal"}
+
+class TestStatementHolderMethods(unittest.TestCase):
+    def setUp(self):
+        self.property = "P1476"
+        self.property2 = "P1683"
+        self.value_mt1 = "দাম" @ langs.bn_
+        self.value_mt2 = "dam" @ langs.en_
+        self.stmt1 = Statement(self.property, self.value_mt1)
+        self.stmt2 = Statement(self.property, self.value_mt2)
+        self.stmt3 = Statement(self.property2, False)
+        self.x = StatementHolder([self.stmt1, self.stmt3])
+
+    def test_haswbstatement(self):
+        self.assertTrue(self.x.haswbstatement(self.property))
+        self.assertTrue(self.x.haswbstatement(self.property, self.value_mt1))
+        self.assertFalse(self.x.haswbstatement(self.property, self.value_mt2))
+        self.assertTrue(self.x.haswbstatement(self.property2, False))
+        self.assertFalse(self.x.haswbstatement(self.property2, True))
+        self.assertIn(Claim(self.property, self.value_mt1), self.x)
+        self.assertNotIn(Claim(self.property, self.value_mt2), self.x)
+
+    def test_value_index_through_edits(self):
+        self.x.haswbstatement(self.property, self.value_mt1)
+        y = self.x + self.stmt2 + self.stmt2
+        self.assertTrue(y.haswbstatement(self.property, self.value_mt2))
+        self.assertFalse(self.x.haswbstatement(self.property, self.value_mt2))
+        z = y - self.stmt2
+        self.assertFalse(z.haswbstatement(self.property, self.value_mt2))
+        self.assertTrue(z.haswbstatement(self.property, self.value_mt1))
+        self.assertNotIn(self.stmt2, z)
+        self.assertIn(self.stmt1, z)
+        w = z - self.property
+        self.assertFalse(w.haswbstatement(self.property, self.value_mt1))
+        self.assertNotIn(Claim(self.property, self.value_mt1), w)
+
+    def test_value_index_after_statement_changed(self):
+        self.assertTrue(self.x.haswbstatement(self.property, self.value_mt1))
+        self.x[self.property][0].value = self.value_mt2
+        self.assertFalse(self.x.haswbstatement(self.property, self.value_mt1))
+        self.assertTrue(self.x.haswbstatement(self.property, self.value_mt2))
+        self.assertIn(self.stmt1, self.x)
+        self.assertIn(Claim(self.property, self.value_mt2), self.x)
+        y = self.x + Statement(self.property, self.value_mt1)
+        self.assertTrue(y.haswbstatement(self.property, self.value_mt2))
+        self.assertTrue(y.haswbstatement(self.property, self.value_mt1))
+
+    def test_shared_statements_copied(self):
+        y = self.x + self.stmt2
+        y[self.property][0].rank = Rank.Preferred
+        self.assertEqual(self.x[self.property][0].rank, Rank.Normal)
+        self.x[self.property2][0].value = True
+        self.assertTrue(y.haswbstatement(self.property2, False))
+        z = y.copy()
+        z.statements[self.property][1].rank = Rank.Deprecated
+        self.assertEqual(y[self.property][1].rank, Rank.Normal)
+        self.assertEqual(z[self.property][0].rank, Rank.Preferred)
+
+    def test_jsonout_after_statement_changed(self):
+        first = self.x.__jsonout__()
+        self.assertIs(self.x.__jsonout__(), first)
+        self.x[self.property][0].rank = Rank.Preferred
+        second = self.x.__jsonout__()
+        self.assertIsNot(second, first)
+        self.assertEqual(second[self.property][0]["rank"], "preferred")
+        self.assertIs(second[self.property2][0], first[self.property2][0])
+
+class TestRawHaswbstatement(unittest.TestCase):
+    def setUp(self):
+        self.values = [
+            {"entity-type": "item", "numeric-id": 5, "id": "Q5"},
+            {"entity-type": "form", "id": "L1-F1"},
+            {"text": "dam", "language": "en"},
+            "ABC123",
+            TimeValue("+2021-01-01T00:00:00Z").__jsonout__(),
+            {"amount": "+5", "unit": "1"},
+            {"amount": "+7", "upperBound": "+8", "lowerBound": "+6", "unit": "http://www.wikidata.org/entity/Q11573"},
+            {"amount": "+9", "upperBound": "+9", "lowerBound": "+9", "unit": "1"}
+        ]
+        self.claims = {
+            "P1": [snak_json("P1", value) for value in self.values],
+            "P2": [snak_json("P2", snaktype="novalue")]
+        }
+
+    def test_raw_haswbstatement(self):
+        queries = [ItemValue("Q5"), "Q5", ItemValue("L1-F1"), ItemValue("Q6"), "dam" @ langs.en_,
+                   "dam" @ langs.de_, "ABC123", "abc123", TimeValue("+2021-01-01T00:00:00Z"),
+                   TimeValue("+2021-01-01T00:00:00Z", precision=9), build_value(self.values[5]), build_value(self.values[6]),
+                   build_value(self.values[7]), QuantityValue("+9", unit="1"), QuantityValue("+5", unit="Q11573")]
+        for query in queries:
+            with self.subTest(query=query):
+                expected = any(build_value(value) == query for value in self.values)
+                self.assertEqual(haswbstatement(self.claims, "P1", query), expected)
+        self.assertTrue(haswbstatement(self.claims, "P2", False))
+        self.assertFalse(haswbstatement(self.claims, "P2", True))
+        self.assertFalse(haswbstatement(self.claims, "P1", False))
+        self.assertFalse(haswbstatement(self.claims, "P3", "Q5"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,16 @@
+import unittest
+
+from tfsl.timevalue import TimeValue
+
+class TestTimeValueMethods(unittest.TestCase):
+    def test_timevalue_equality(self):
+        x = TimeValue("+2021-01-01T00:00:00Z")
+        y = TimeValue("+2021-01-01T00:00:00Z")
+        z = TimeValue("+2021-01-01T00:00:00Z", precision=9)
+        self.assertEqual(x, y)
+        self.assertEqual(hash(x), hash(y))
+        self.assertNotEqual(x, z)
+        self.assertEqual(len({x, y, z}), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,22 +1,85 @@
-""" twofivesixlex -- a library to use and edit Wikidata items and lexemes """
+""" twofivesixlex -- a library to use and edit Wikidata items and lexemes
+
+    Submodules are only imported once one of the names below is first accessed (PEP 562),
+    so that 'import tfsl' remains cheap for processes that only need part of the library.
+"""
 
 # pylint: disable=useless-import-alias
 
-from tfsl.auth import WikibaseSession as WikibaseSession
-from tfsl.claim import Claim as Claim
-from tfsl.coordinatevalue import CoordinateValue as CoordinateValue
-from tfsl.item import Item as Item, Q as Q, Q_ as Q_
-from tfsl.itemvalue import ItemValue as ItemValue
-from tfsl.languages import Language as Language, langs as langs
-from tfsl.lexeme import Lexeme as Lexeme, L as L, L_ as L_, LexemeLike as LexemeLike
-from tfsl.lexemeform import LexemeForm as LexemeForm, LF_ as LF_, LexemeFormLike as LexemeFormLike
-from tfsl.lexemesense import LexemeSense as LexemeSense, LS_ as LS_, LexemeSenseLike as LexemeSenseLike
-from tfsl.monolingualtext import MonolingualText as MonolingualText
-from tfsl.monolingualtextholder import MonolingualTextHolder as MonolingualTextHolder
-from tfsl.quantityvalue import QuantityValue as QuantityValue
-from tfsl.reference import Reference as Reference
-from tfsl.statement import Statement as Statement
-from tfsl.statementholder import StatementHolder as StatementHolder
-from tfsl.timevalue import TimeValue as TimeValue
-import tfsl.interfaces as interfaces
-import tfsl.utils as utils
+from importlib import import_module
+from typing import Any, Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tfsl.auth import WikibaseSession as WikibaseSession
+    from tfsl.bulk import pipeline as pipeline
+    from tfsl.changes import diff as diff
+    from tfsl.claim import Claim as Claim
+    from tfsl.coordinatevalue import CoordinateValue as CoordinateValue
+    from tfsl.item import Item as Item, Q as Q, Q_ as Q_
+    from tfsl.itemvalue import ItemValue as ItemValue
+    from tfsl.journal import EditJournal as EditJournal
+    from tfsl.languages import Language as Language, langs as langs
+    from tfsl.lexeme import Lexeme as Lexeme, L as L, L_ as L_, LexemeLike as LexemeLike
+    from tfsl.lexemeform import LexemeForm as LexemeForm, LF_ as LF_, LexemeFormLike as LexemeFormLike
+    from tfsl.lexemesense import LexemeSense as LexemeSense, LS_ as LS_, LexemeSenseLike as LexemeSenseLike
+    from tfsl.monolingualtext import MonolingualText as MonolingualText
+    from tfsl.monolingualtextholder import MonolingualTextHolder as MonolingualTextHolder
+    from tfsl.quantityvalue import QuantityValue as QuantityValue
+    from tfsl.reference import Reference as Reference
+    from tfsl.statement import Statement as Statement
+    from tfsl.statementholder import StatementHolder as StatementHolder
+    from tfsl.timevalue import TimeValue as TimeValue
+    import tfsl.interfaces as interfaces
+    import tfsl.utils as utils
+
+lazy_attributes: Dict[str, str] = {
+    "WikibaseSession": "tfsl.auth",
+    "pipeline": "tfsl.bulk",
+    "diff": "tfsl.changes",
+    "Claim": "tfsl.claim",
+    "CoordinateValue": "tfsl.coordinatevalue",
+    "Item": "tfsl.item",
+    "Q": "tfsl.item",
+    "Q_": "tfsl.item",
+    "ItemValue": "tfsl.itemvalue",
+    "EditJournal": "tfsl.journal",
+    "Language": "tfsl.languages",
+    "langs": "tfsl.languages",
+    "Lexeme": "tfsl.lexeme",
+    "L": "tfsl.lexeme",
+    "L_": "tfsl.lexeme",
+    "LexemeLike": "tfsl.lexeme",
+    "LexemeForm": "tfsl.lexemeform",
+    "LF_": "tfsl.lexemeform",
+    "LexemeFormLike": "tfsl.lexemeform",
+    "LexemeSense": "tfsl.lexemesense",
+    "LS_": "tfsl.lexemesense",
+    "LexemeSenseLike": "tfsl.lexemesense",
+    "MonolingualText": "tfsl.monolingualtext",
+    "MonolingualTextHolder": "tfsl.monolingualtextholder",
+    "QuantityValue": "tfsl.quantityvalue",
+    "Reference": "tfsl.reference",
+    "Statement": "tfsl.statement",
+    "StatementHolder": "tfsl.statementholder",
+    "TimeValue": "tfsl.timevalue",
+}
+
+lazy_submodules: Dict[str, str] = {
+    "interfaces": "tfsl.interfaces",
+    "utils": "tfsl.utils",
+}
+
+__all__ = list(lazy_attributes) + list(lazy_submodules)
+
+def __getattr__(name: str) -> Any:
+    if name in lazy_attributes:
+        value = getattr(import_module(lazy_attributes[name]), name)
+    elif name in lazy_submodules:
+        value = import_module(lazy_submodules[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
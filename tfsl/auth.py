@@ -4,14 +4,25 @@ import configparser
 import json
 import logging
 import os
+import random
+import threading
 import time
+import urllib.parse
+import zlib
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from getpass import getpass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from types import TracebackType
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple, Type, Union
 
 import requests
+import urllib3.exceptions
 
+import tfsl.delta
 import tfsl.interfaces as I
+import tfsl.journal
+import tfsl.planner
 
 maxlag: int = 5
 
@@ -29,29 +40,147 @@ csrf_token_params = {
 }
 
 WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
+# the CSRF token given to sessions which are not logged in
+ANONYMOUS_TOKEN = "+\\"
 DEFAULT_USER_AGENT = 'tfsl 0.0.1'
 
+class MaxlagError(Exception):
+    """ Raised when an edit is refused because the servers are lagged,
+        holding how long (in seconds) the servers asked to wait before trying again.
+    """
+    def __init__(self, retry_after: float):
+        super().__init__(f"Maxlag hit, retry after {retry_after} seconds")
+        self.retry_after = retry_after
+
+class EditConflictError(PermissionError):
+    """ Raised when an edit is refused because the entity was changed since the revision the edit was based on. """
+
+class RetryPolicy:
+    """ Decides whether and when a WikibaseSession sends again a request which failed for a transient reason:
+        lagged or throttled servers, a server error, a dropped connection, a timeout, or an expired CSRF token.
+
+        The delay before each new attempt doubles from base_delay up to max_delay,
+        less a random fraction (up to 'jitter') of itself so that many clients do not retry in step,
+        but is never shorter than what the server asked for in a Retry-After header.
+        Requests are tried at most max_attempts times, and not again if the next attempt would start
+        more than time_budget seconds after the first. Each attempt waits at most 'timeout' seconds for an answer.
+
+        Edits which would be made again if sent twice, such as creating an entity or adding a form,
+        are only sent again after a failure which shows that they were not made:
+        a failure to connect, a throttled or lagged server, or a refused CSRF token.
+        After a timeout, a dropped connection or a server error such an edit may or may not have been made,
+        so the failure is raised instead, leaving it to the caller to check the entity before sending the edit again.
+        Edits carrying a baserevid are sent again regardless, as a copy made after the first one was saved
+        is refused as an edit conflict rather than made twice.
+    """
+    def __init__(self, max_attempts: int=6, base_delay: float=1.0, max_delay: float=60.0,
+                 jitter: float=0.5, time_budget: float=600.0, timeout: float=60.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.time_budget = time_budget
+        self.timeout = timeout
+
+    def get_delay(self, attempt: int, retry_after: Optional[float]=None) -> float:
+        """ Returns how long to wait after the provided (1-based) attempt failed. """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay -= delay * self.jitter * random.random()
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def allows(self, attempt: int, elapsed: float, delay: float) -> bool:
+        """ Checks whether another attempt may be made after the provided attempt failed,
+            given the time elapsed since the first attempt and the delay before the next one.
+        """
+        return attempt < self.max_attempts and elapsed + delay <= self.time_budget
+
+def was_not_sent(error: Exception) -> bool:
+    """ Checks whether the provided failure to get an answer to a request happened before it reached the server. """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+def may_resend(method: str, data: Dict[str, str], with_token: bool) -> bool:
+    """ Checks whether the provided request may be sent again when it is not known whether it was carried out. """
+    return method == "GET" or not with_token or "baserevid" in data
+
+def get_retry_after(response: requests.Response) -> Optional[float]:
+    """ Returns the number of seconds in the Retry-After header of the provided response, if there is one. """
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+class RateBudget:
+    """ Spaces out the edits made through a session so that at most edits_per_minute are made in any minute. """
+    def __init__(self, edits_per_minute: float):
+        self.interval = 60 / edits_per_minute
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        """ Waits until the next edit may be made. """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 class WikibaseSession:
-    """ Auth library for Wikibases. """
+    """ Auth library for Wikibases.
+
+        Nothing is sent when a session is created: it only logs in (asking for the password then if none was provided)
+        and retrieves a CSRF token once a request needing one is first sent, so that sessions only used to read never log in.
+        If the session expires on the server, it logs in again and sends the refused request again.
+
+        If a session_file is provided, the session's cookies and CSRF token are kept in it (readable only by its owner),
+        and reused by later sessions for the same user until session_lifetime seconds after they were obtained.
+    """
+    # if set, edits through this session wait for their turn in it
+    edit_budget: Optional[RateBudget] = None
+
     def __init__(self,
                  username: str,
                  password: Optional[str] = None,
                  token: Optional[str] = None,
                  user_agent: str = DEFAULT_USER_AGENT,
-                 url: str = WIKIDATA_API_URL
+                 url: str = WIKIDATA_API_URL,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 session_file: Optional[str] = None,
+                 session_lifetime: float = 3600.0
                  ):
         self.url = url
         self.user_agent = user_agent
         self.headers = {"User-Agent": user_agent}
         self.session = requests.Session()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
 
         self.username = username
+        self._password = password
+        self.session_file = session_file
+        self.session_lifetime = session_lifetime
+        self.auth_lock = threading.RLock()
+        self.logged_in = False
+        self.csrf_token: Optional[str] = token
+        if token is not None:
+            logging.info("Using CSRF token: %s", self.csrf_token)
+        elif session_file is not None:
+            self.load_session()
+
         self.assert_user = None
-        if password is not None:
-            self._password = password
-        else:
-            self._password = getpass(f"Enter password for {self.username}: ")
+        if username is not None:
+            # truncate bot name if a "bot password" is used
+            self.assert_user = username.split("@")[0]
 
+    def login(self) -> None:
+        """ Logs in with the session's username and password, asking for the password if none was provided. """
+        if self._password is None:
+            self._password = getpass(f"Enter password for {self.username}: ")
+        self.session.cookies.clear()
         token_response = self.get(token_request_params)
         login_token = token_response["query"]["tokens"]["logintoken"]
 
@@ -61,33 +190,119 @@ class WikibaseSession:
             "lgname": self.username,
             "lgpassword": self._password,
             "lgtoken": login_token,
+            "maxlag": "30",
         }
-        connection_response = self.post(connection_request_params, 30)
-        if connection_response.get("login", []).get("result") != "Success":
+        connection_response = self.send_request("POST", connection_request_params)
+        if connection_response.get("login", {}).get("result") != "Success":
             raise PermissionError("Login failed", connection_response["login"]["reason"])
         logging.info("Log in succeeded")
-
-        if token is not None:
-            self.csrf_token = token
-            logging.info("Using CSRF token: %s", self.csrf_token)
-        else:
+        self.logged_in = True
+
+    def ensure_login(self) -> str:
+        """ Logs in and retrieves a CSRF token if the session has none yet, and returns the CSRF token. """
+        with self.auth_lock:
+            if self.csrf_token is None:
+                if not self.logged_in:
+                    self.login()
+                self.refresh_csrf_token()
+            assert self.csrf_token is not None
+            return self.csrf_token
+
+    def reauthenticate(self, rejected_token: Optional[str]) -> None:
+        """ Logs in again and retrieves a new CSRF token, unless another thread already did so
+            since the provided token was rejected.
+        """
+        with self.auth_lock:
+            if self.csrf_token == rejected_token:
+                self.logged_in = False
+                self.csrf_token = None
+                self.ensure_login()
+
+    def refresh_csrf_token(self) -> None:
+        """ Retrieves a new CSRF token for the session, logging in again first if the session has expired. """
+        with self.auth_lock:
             csrf_response = self.get(csrf_token_params)
-            self.csrf_token = csrf_response["query"]["tokens"]["csrftoken"]
+            csrf_token = csrf_response["query"]["tokens"]["csrftoken"]
+            if csrf_token == ANONYMOUS_TOKEN and self.username is not None:
+                logging.info("Session expired, logging in again")
+                self.login()
+                csrf_response = self.get(csrf_token_params)
+                csrf_token = csrf_response["query"]["tokens"]["csrftoken"]
+            self.csrf_token = csrf_token
             logging.info("Got CSRF token: %s", self.csrf_token)
-
-        if username is not None:
-            # truncate bot name if a "bot password" is used
-            self.assert_user = username.split("@")[0]
-
-    def push(self, obj_in: I.Entity, summary: Optional[str]=None, maxlag_in: int=maxlag, bot: bool=False) -> Any:
-        """ Post data to Wikibase. """
+            self.save_session()
+
+    def load_session(self) -> None:
+        """ Restores the cookies and CSRF token kept in the session file, if they are for this user and have not expired. """
+        assert self.session_file is not None
+        try:
+            with open(self.session_file, encoding="utf-8") as fileptr:
+                saved = json.load(fileptr)
+        except (OSError, ValueError):
+            return
+        if saved.get("username") != self.username or saved.get("url") != self.url or saved.get("expires", 0) < time.time():
+            return
+        for cookie in saved["cookies"]:
+            self.session.cookies.set_cookie(requests.cookies.create_cookie(**cookie))
+        self.csrf_token = saved["csrf_token"]
+        self.logged_in = True
+        logging.info("Reusing session for %s from %s", self.username, self.session_file)
+
+    def save_session(self) -> None:
+        """ Writes the session's cookies and CSRF token to the session file, if there is one, readable only by its owner. """
+        if self.session_file is None:
+            return
+        saved = {
+            "username": self.username,
+            "url": self.url,
+            "csrf_token": self.csrf_token,
+            "expires": time.time() + self.session_lifetime,
+            "cookies": [{"name": cookie.name, "value": cookie.value, "domain": cookie.domain, "path": cookie.path,
+                         "expires": cookie.expires, "secure": cookie.secure} for cookie in self.session.cookies],
+        }
+        temp_path = self.session_file + ".tmp"
+        # a temporary file left behind would keep its own mode, so a fresh one is created in its place
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        fileno = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fileno, "w", encoding="utf-8") as fileptr:
+            json.dump(saved, fileptr)
+        os.replace(temp_path, self.session_file)
+
+    def push(self, obj_in: I.Entity, summary: Optional[str]=None, maxlag_in: int=maxlag, bot: bool=False, full: bool=False,
+             journal: Optional['tfsl.journal.EditJournal']=None) -> Any:
+        """ Post data to Wikibase.
+            If the object was built from a retrieved revision, only its changes since that revision are sent,
+            unless full is set, and the edit is refused if the entity was changed since that revision.
+            In that case, the changes are moved onto the latest revision and sent again (see send_edit).
+            If a journal is provided, the edit is recorded in it before it is sent and once it is completed.
+        """
+        requestjson = self.build_push_request(obj_in, summary, maxlag_in, bot, full)
+        if journal is not None:
+            journal.record_planned(requestjson)
+        response = self.send_edit(requestjson, get_push_base(obj_in, full), retry_lag=True)
+        if journal is not None:
+            journal.record_completed(requestjson, response)
+        return response
+
+    def build_push_request(self, obj_in: I.Entity, summary: Optional[str]=None, maxlag_in: int=maxlag, bot: bool=False, full: bool=False) -> Dict[str, str]:
+        """ Returns the parameters of the wbeditentity request pushing the provided object (see push),
+            apart from the CSRF token, which is only added when the request is sent.
+        """
         data = obj_in.__jsonout__()
+        base_json = get_push_base(obj_in, full)
+        if base_json is not None:
+            data = tfsl.delta.lexeme_delta(data, base_json)
         requestjson = {"action": "wbeditentity", "format": "json"}
         if bot:
             requestjson["bot"] = ""
 
         if not data.get("id", False):
-            if data.get("lexicalCategory", False):
+            if data.get("type", False):
+                requestjson["new"] = data["type"]
+            elif data.get("lexicalCategory", False):
                 requestjson["new"] = "lexeme"
             elif data.get("glosses", False):
                 requestjson["new"] = "sense"
@@ -99,34 +314,65 @@ class WikibaseSession:
                 requestjson["new"] = "property"
         else:
             requestjson["id"] = data["id"]
+            if getattr(obj_in, "lastrevid", None) is not None:
+                requestjson["baserevid"] = str(obj_in.lastrevid)
 
         if summary is not None:
             requestjson["summary"] = summary
         if self.assert_user is not None:
             requestjson["assertuser"] = self.assert_user
 
-        requestjson["token"] = self.csrf_token
         requestjson["data"] = json.dumps(data)
         requestjson["maxlag"] = str(maxlag_in)
-
-        push_response = self.session.post(self.url,
-            data=requestjson, headers=self.headers, auth=None)
-        if push_response.status_code != 200:
-            error_msg = f"POST unsuccessful ({push_response.status_code}): {push_response.text}"
-            raise Exception(error_msg)
-
-        push_response_data = push_response.json()
-        if "error" in push_response_data:
-            if push_response_data["error"]["code"] == "maxlag":
-                sleepfor = float(push_response.headers.get("retry-after", 5))
-                logging.info("Maxlag hit, waiting for %.1f seconds", sleepfor)
-                time.sleep(sleepfor)
-                return self.push(obj_in)
-            else:
-                raise PermissionError("API returned error: " + str(push_response_data["error"]))
-
-        logging.debug("Post request succeed")
-        return push_response_data
+        return requestjson
+
+    def send_edit(self, requestjson: Dict[str, str], base_json: Optional[I.LexemeDict]=None, retry_lag: bool=False) -> Any:
+        """ Sends a request built by build_push_request,
+            raising a MaxlagError instead of waiting if the servers are lagged or throttle the request, unless retry_lag is set.
+            If the request only adds, changes or removes a single form, sense or statement,
+            it is sent to the API module dedicated to that instead of wbeditentity (see tfsl.planner),
+            whose response is then returned.
+
+            If the JSON of the revision the request's changes were made to is provided as base_json,
+            and the request is refused because the entity was changed since, the entity is retrieved again
+            and the changes are sent again on top of its latest revision,
+            provided none of them touch anything that was also changed in the meantime.
+            Otherwise an EditConflictError is raised.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.edit_budget is not None:
+                self.edit_budget.wait()
+            try:
+                return self.send_request("POST", tfsl.planner.plan_request(requestjson), with_token=True, retry_lag=retry_lag)
+            except EditConflictError:
+                if base_json is None or attempt >= self.retry_policy.max_attempts:
+                    raise
+                latest_json = self.refresh_entity(requestjson["id"])
+                if not I.is_LexemeDict(latest_json):
+                    raise
+                rebased = tfsl.delta.rebase_delta(json.loads(requestjson["data"]), base_json, latest_json)
+                if rebased is None:
+                    raise
+                logging.info("Edit conflict on %s, sending the changes again on top of revision %s",
+                             requestjson["id"], latest_json["lastrevid"])
+                requestjson = dict(requestjson, data=json.dumps(rebased), baserevid=str(latest_json["lastrevid"]))
+                base_json = latest_json
+
+    def refresh_entity(self, entity_id: I.EntityId) -> I.EntityPublishedSettings:
+        """ Retrieves the latest revision of the provided entity, replacing any stored copy of it. """
+        response = self.get({"action": "wbgetentities", "format": "json", "ids": entity_id})
+        entity_json = response["entities"][entity_id]
+        if not I.is_EntityPublishedSettings(entity_json):
+            raise ValueError(f"Retrieved data for {entity_id} was not an entity")
+        write_cached_entity(entity_id, entity_json)
+        return entity_json
+
+    def push_queue(self, max_in_flight: int=4, latency_target: float=10.0,
+                   journal: Optional['tfsl.journal.EditJournal']=None) -> 'PushQueue':
+        """ Returns a PushQueue sending edits through this session (see PushQueue for the arguments). """
+        return PushQueue(self, max_in_flight, latency_target, journal=journal)
 
     def post(self, data: Dict[str, str], maxlag_in: int=maxlag) -> Any:
         """ Post data to Wikibase. The CSRF token is automatically
@@ -135,29 +381,11 @@ class WikibaseSession:
             :param data: Parameters to send via POST
             :return: Answer from the server
         """
-        if data.get("token") == "__AUTO__":
-            data["token"] = self.csrf_token
+        with_token = data.get("token") == "__AUTO__"
         if "assertuser" not in data and self.assert_user is not None:
             data["assertuser"] = self.assert_user
         data["maxlag"] = str(maxlag_in)
-
-        post_response = self.session.post(self.url, data=data, headers=self.headers, auth=None)
-        if post_response.status_code != 200:
-            error_msg = f"POST unsuccessful ({post_response.status_code}): {post_response.text}"
-            raise Exception(error_msg)
-
-        post_response_data = post_response.json()
-        if "error" in post_response_data:
-            if post_response_data["error"]["code"] == "maxlag":
-                sleepfor = float(post_response.headers.get("retry-after", 5))
-                logging.info("Maxlag hit, waiting for %.1f seconds", sleepfor)
-                time.sleep(sleepfor)
-                return self.post(data)
-            else:
-                raise PermissionError("API returned error: " + str(post_response_data["error"]))
-
-        logging.debug("Post request succeed")
-        return post_response_data
+        return self.send_request("POST", data, with_token=with_token)
 
     def get(self, data: Dict[str, str]) -> Any:
         """ Send a GET request to Wikibase.
@@ -165,20 +393,392 @@ class WikibaseSession:
             :param data: Parameters to send via GET
             :return: Answer from the server
         """
-        get_response = self.session.get(self.url, params=data, headers=self.headers)
-        get_response_data = get_response.json()
-        if get_response.status_code != 200 or "error" in get_response_data:
-            # We do not set maxlag for GET requests – so this error can only
-            # occur if the users sets maxlag in the request data object
-            if get_response_data["error"]["code"] == "maxlag":
-                sleepfor = float(get_response.headers.get("retry-after", 5))
-                logging.info("Maxlag hit, waiting for %.1f seconds", sleepfor)
-                time.sleep(sleepfor)
-                return self.get(data)
+        return self.send_request("GET", data)
+
+    def send_request(self, method: str, data: Dict[str, str], with_token: bool=False, retry_lag: bool=True) -> Any:
+        """ Sends a GET or POST request to Wikibase, trying again as allowed by the session's retry policy.
+            If with_token is set, the session's CSRF token is added to the request, and renewed if it is rejected.
+            If retry_lag is not set, a MaxlagError is raised as soon as the servers are lagged or throttle the request.
+            Edits without a baserevid are not sent again after failures which do not show that they were not made
+            (see RetryPolicy).
+        """
+        policy = self.retry_policy
+        resendable = may_resend(method, data, with_token)
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            if with_token:
+                data["token"] = self.ensure_login()
+            failure: Exception
+            retry_after: Optional[float] = None
+            try:
+                if method == "GET":
+                    response = self.session.get(self.url, params=data, headers=self.headers, timeout=policy.timeout)
+                else:
+                    response = self.session.post(self.url, data=data, headers=self.headers, timeout=policy.timeout)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if not resendable and not was_not_sent(error):
+                    raise
+                failure = error
+            else:
+                retry_after = get_retry_after(response)
+                if response.status_code == 429:
+                    failure = MaxlagError(retry_after if retry_after is not None else policy.base_delay)
+                elif response.status_code >= 500 and resendable:
+                    failure = Exception(f"{method} unsuccessful ({response.status_code}): {response.text}")
+                elif response.status_code != 200:
+                    raise Exception(f"{method} unsuccessful ({response.status_code}): {response.text}")
+                else:
+                    response_data = response.json()
+                    if "error" not in response_data:
+                        logging.debug("%s request succeed", method.capitalize())
+                        return response_data
+                    error_code = response_data["error"].get("code")
+                    if error_code == "maxlag":
+                        failure = MaxlagError(retry_after if retry_after is not None else 5)
+                    elif error_code == "editconflict":
+                        raise EditConflictError("API returned error: " + str(response_data["error"]))
+                    elif error_code == "badtoken" and with_token:
+                        failure = PermissionError("API returned error: " + str(response_data["error"]))
+                        with self.auth_lock:
+                            if self.csrf_token == data["token"]:
+                                self.refresh_csrf_token()
+                    elif error_code in ("assertuserfailed", "assertnameduserfailed") and with_token:
+                        # the session expired on the server
+                        failure = PermissionError("API returned error: " + str(response_data["error"]))
+                        self.reauthenticate(data["token"])
+                    else:
+                        raise PermissionError("API returned error: " + str(response_data["error"]))
+
+            if isinstance(failure, MaxlagError):
+                if not retry_lag:
+                    raise failure
+                retry_after = failure.retry_after
+            delay = policy.get_delay(attempt, retry_after)
+            if not policy.allows(attempt, time.monotonic() - start, delay):
+                raise failure
+            logging.info("%s failed (%s), trying again in %.1f seconds", method, failure, delay)
+            time.sleep(delay)
+
+class EditEstimate(NamedTuple):
+    """ An edit a DryRunSession would have sent. """
+    entity_id: str
+    module: str
+    payload_bytes: int
+
+class DryRunReport(NamedTuple):
+    """ What a DryRunSession would have sent, and how long sending it would take (see DryRunSession). """
+    edits: List[EditEstimate]
+    estimated_seconds: float
+
+    @property
+    def edit_count(self) -> int:
+        """ Returns the number of edits. """
+        return len(self.edits)
+
+    @property
+    def payload_bytes(self) -> int:
+        """ Returns the total size of the edits' request bodies. """
+        return sum(edit.payload_bytes for edit in self.edits)
+
+    @property
+    def modules(self) -> 'Counter[str]':
+        """ Returns how many edits would be sent to each API module. """
+        return Counter(edit.module for edit in self.edits)
+
+    def __str__(self) -> str:
+        modules = ", ".join(f"{module}: {count}" for module, count in self.modules.most_common())
+        return (f"{self.edit_count} edits, {self.payload_bytes} bytes ({modules}), "
+                f"about {self.estimated_seconds:.0f} seconds")
+
+class DryRunSession(WikibaseSession):
+    """ Stands in for a WikibaseSession without logging in or sending anything,
+        recording instead which API module each pushed edit would use and how large its request would be.
+        Combined with Pipeline.fetch(cache_only=True), a bulk job can be reviewed without touching the network.
+
+        The time sending the edits would take is estimated from the time the servers take to answer each edit (latency),
+        the number of edits a PushQueue keeps in flight at once (max_in_flight),
+        and the number of edits the account may make per minute, if limited (edits_per_minute).
+    """
+    def __init__(self, username: Optional[str]=None, latency: float=1.0, max_in_flight: int=4,
+                 edits_per_minute: Optional[float]=None): # pylint: disable=super-init-not-called
+        self.url = WIKIDATA_API_URL
+        self.headers = {"User-Agent": DEFAULT_USER_AGENT}
+        self.retry_policy = RetryPolicy()
+        self.username = username
+        self.assert_user = username.split("@")[0] if username is not None else None
+        self.csrf_token = ANONYMOUS_TOKEN
+        self.latency = latency
+        self.max_in_flight = max_in_flight
+        self.edits_per_minute = edits_per_minute
+        self.lock = threading.Lock()
+        self.edits: List[EditEstimate] = []
+
+    def push(self, obj_in: I.Entity, summary: Optional[str]=None, maxlag_in: int=maxlag, bot: bool=False, full: bool=False,
+             journal: Optional['tfsl.journal.EditJournal']=None) -> Any:
+        """ Records the edit WikibaseSession.push would send. The journal, if any, is left alone. """
+        return super().push(obj_in, summary, maxlag_in, bot, full)
+
+    def push_queue(self, max_in_flight: int=4, latency_target: float=10.0,
+                   journal: Optional['tfsl.journal.EditJournal']=None) -> 'PushQueue':
+        """ Returns a PushQueue recording edits in this session. The journal, if any, is left alone. """
+        return PushQueue(self, max_in_flight, latency_target)
+
+    def send_edit(self, requestjson: Dict[str, str], base_json: Optional[I.LexemeDict]=None, retry_lag: bool=False) -> Any:
+        """ Records the edit the provided request would make, returning a response saying so. """
+        planned_request = dict(tfsl.planner.plan_request(requestjson), token=self.csrf_token)
+        edit = EditEstimate(requestjson.get("id", ""), planned_request["action"],
+                            len(urllib.parse.urlencode(planned_request).encode("utf-8")))
+        with self.lock:
+            self.edits.append(edit)
+        return {"success": 1, "dryrun": True}
+
+    def send_request(self, method: str, data: Dict[str, str], with_token: bool=False, retry_lag: bool=True) -> Any:
+        raise RuntimeError(f"A dry run does not send {method} requests")
+
+    def report(self) -> DryRunReport:
+        """ Returns what was recorded so far, with the estimated time sending it would take. """
+        with self.lock:
+            edits = list(self.edits)
+        estimated_seconds = len(edits) * self.latency / self.max_in_flight
+        if self.edits_per_minute is not None:
+            estimated_seconds = max(estimated_seconds, len(edits) * 60 / self.edits_per_minute)
+        return DryRunReport(edits, estimated_seconds)
+
+class PushJob:
+    """ :meta private: """
+    __slots__ = ('requestjson', 'base_json', 'future')
+
+    def __init__(self, requestjson: Dict[str, str], base_json: Optional[I.LexemeDict]):
+        self.requestjson = requestjson
+        self.base_json = base_json
+        self.future: 'Future[Any]' = Future()
+
+class PushQueue:
+    """ Pushes edits through a WikibaseSession with several of them in flight at once,
+        returning a Future for the response to each.
+
+        How many edits may be in flight (the window) is adjusted by additive increase, multiplicative decrease:
+        each edit answered within latency_target seconds widens the window a little, up to max_in_flight,
+        while a maxlag error or a slower answer halves it (down to a single edit).
+        After a maxlag error, no edit is sent until the time the servers asked to wait has passed,
+        and the refused edit is sent again ahead of any later edit to the same entity.
+        Edits to the same entity are always sent one at a time, in the order they were submitted,
+        and edit conflicts are dealt with as in WikibaseSession.push.
+
+        If a journal is provided, each edit is recorded in it when it is submitted and once it is completed.
+
+        The queue may be used as a context manager, waiting on leaving the block until every edit is done.
+    """
+    def __init__(self, session: WikibaseSession, max_in_flight: int=4, latency_target: float=10.0,
+                 increase: float=0.5, decrease: float=0.5, journal: Optional['tfsl.journal.EditJournal']=None):
+        self.session = session
+        self.journal = journal
+        self.max_in_flight = max_in_flight
+        self.latency_target = latency_target
+        self.increase = increase
+        self.decrease = decrease
+        self.window = 1.0
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.pending: Dict[Any, Deque[PushJob]] = {}
+        self.ready: Deque[Any] = deque()
+        self.lock = threading.RLock()
+        self.timer: Optional[threading.Timer] = None
+        self.executor = ThreadPoolExecutor(max_workers=max_in_flight)
+
+    def submit(self, obj_in: I.Entity, summary: Optional[str]=None, maxlag_in: int=maxlag, bot: bool=False, full: bool=False) -> 'Future[Any]':
+        """ Queues an edit pushing the provided object as it is now (see WikibaseSession.push for the arguments),
+            returning a Future for the response.
+        """
+        job = PushJob(self.session.build_push_request(obj_in, summary, maxlag_in, bot, full), get_push_base(obj_in, full))
+        key = job.requestjson.get("id", job)
+        if self.journal is not None:
+            self.journal.record_planned(job.requestjson)
+        with self.lock:
+            if key not in self.pending:
+                self.pending[key] = deque()
+                self.ready.append(key)
+            self.pending[key].append(job)
+        self.dispatch()
+        return job.future
+
+    def dispatch(self) -> None:
+        """ :meta private: """
+        with self.lock:
+            delay = self.paused_until - time.monotonic()
+            if delay > 0:
+                if self.timer is None:
+                    self.timer = threading.Timer(delay, self.resume)
+                    self.timer.daemon = True
+                    self.timer.start()
+                return
+            while self.ready and self.in_flight < int(self.window):
+                key = self.ready.popleft()
+                job = self.pending[key][0]
+                self.in_flight += 1
+                self.executor.submit(self.run, key, job)
+
+    def resume(self) -> None:
+        """ :meta private: """
+        with self.lock:
+            self.timer = None
+        self.dispatch()
+
+    def run(self, key: Any, job: PushJob) -> None:
+        """ :meta private: """
+        start = time.monotonic()
+        try:
+            response = self.session.send_edit(job.requestjson, job.base_json)
+        except MaxlagError as error:
+            logging.info("Maxlag hit, pausing the queue for %.1f seconds", error.retry_after)
+            with self.lock:
+                self.window = max(1.0, self.window * self.decrease)
+                self.paused_until = max(self.paused_until, time.monotonic() + error.retry_after)
+                self.in_flight -= 1
+                self.ready.appendleft(key)
+            self.dispatch()
+            return
+        except Exception as error: # pylint: disable=broad-except
+            self.finish(key)
+            job.future.set_exception(error)
+            return
+        latency = time.monotonic() - start
+        if self.journal is not None:
+            self.journal.record_completed(job.requestjson, response)
+        with self.lock:
+            if latency > self.latency_target:
+                self.window = max(1.0, self.window * self.decrease)
             else:
-                raise Exception(f"GET unsuccessful ({get_response.status_code}): {get_response.text}")
-        logging.debug("Get request succeed")
-        return get_response_data
+                self.window = min(float(self.max_in_flight), self.window + self.increase)
+        self.finish(key)
+        job.future.set_result(response)
+
+    def finish(self, key: Any) -> None:
+        """ :meta private: """
+        with self.lock:
+            self.in_flight -= 1
+            self.pending[key].popleft()
+            if self.pending[key]:
+                self.ready.append(key)
+            else:
+                del self.pending[key]
+        self.dispatch()
+
+    def join(self) -> None:
+        """ Waits until every edit submitted so far is done. """
+        while True:
+            with self.lock:
+                futures = [job.future for jobs in self.pending.values() for job in jobs]
+            if not futures:
+                return
+            wait(futures)
+
+    def close(self) -> None:
+        """ Waits until every edit is done, then stops the threads sending them. """
+        self.join()
+        self.executor.shutdown()
+
+    def __enter__(self) -> 'PushQueue':
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+class SessionPool:
+    """ Spreads edits over several sessions, typically logged in with different bot accounts,
+        each keeping its own tokens, cookies and, if edits_per_minute is provided, its own RateBudget.
+
+        Edits to an existing entity always go through the same session, chosen from a hash of the entity's ID,
+        so that edits to one entity are still made one after another; edits creating entities are spread in turn.
+        The pool offers push and push_queue as a WikibaseSession does, and may be used wherever one is pushed to.
+    """
+    def __init__(self, sessions: List[WikibaseSession], edits_per_minute: Optional[float]=None):
+        if not sessions:
+            raise ValueError("A session pool needs at least one session")
+        self.sessions = sessions
+        if edits_per_minute is not None:
+            for session in sessions:
+                session.edit_budget = RateBudget(edits_per_minute)
+        self.turn = 0
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_accounts(cls, accounts: List[Dict[str, str]], edits_per_minute: Optional[float]=None, **session_args: Any) -> 'SessionPool':
+        """ Returns a pool of sessions for the provided accounts (dictionaries with 'username', 'password'
+            and optionally 'session_file'), each logging in once it first edits (see WikibaseSession for the other arguments).
+        """
+        sessions = [WikibaseSession(account["username"], account["password"], session_file=account.get("session_file"), **session_args)
+                    for account in accounts]
+        return cls(sessions, edits_per_minute)
+
+    def get_session(self, entity_id: Optional[str]) -> WikibaseSession:
+        """ Returns the session through which edits to the entity with the provided ID are made.
+            Edits to a form or sense go through the same session as edits to its lexeme.
+        """
+        if not entity_id:
+            with self.lock:
+                self.turn = (self.turn + 1) % len(self.sessions)
+                return self.sessions[self.turn]
+        main_id = entity_id.split("-")[0]
+        return self.sessions[zlib.crc32(main_id.encode("utf-8")) % len(self.sessions)]
+
+    def push(self, obj_in: I.Entity, summary: Optional[str]=None, maxlag_in: int=maxlag, bot: bool=False, full: bool=False,
+             journal: Optional['tfsl.journal.EditJournal']=None) -> Any:
+        """ Pushes the provided object through the session for its entity (see WikibaseSession.push). """
+        return self.get_session(getattr(obj_in, "id", None)).push(obj_in, summary, maxlag_in, bot, full, journal)
+
+    def push_queue(self, max_in_flight: int=4, latency_target: float=10.0,
+                   journal: Optional['tfsl.journal.EditJournal']=None) -> 'PoolQueue':
+        """ Returns a PoolQueue with a PushQueue for each session (see PushQueue for the arguments, which apply to each). """
+        return PoolQueue(self, max_in_flight, latency_target, journal)
+
+class PoolQueue:
+    """ Hands each edit submitted to it to the PushQueue of the session its entity belongs to in a SessionPool.
+
+        The queue may be used as a context manager, waiting on leaving the block until every edit is done.
+    """
+    def __init__(self, pool: SessionPool, max_in_flight: int=4, latency_target: float=10.0,
+                 journal: Optional['tfsl.journal.EditJournal']=None):
+        self.pool = pool
+        self.queues = {id(session): session.push_queue(max_in_flight, latency_target, journal) for session in pool.sessions}
+
+    def submit(self, obj_in: I.Entity, summary: Optional[str]=None, maxlag_in: int=maxlag, bot: bool=False, full: bool=False) -> 'Future[Any]':
+        """ Queues an edit in the queue of the session for the provided object's entity (see PushQueue.submit). """
+        session = self.pool.get_session(getattr(obj_in, "id", None))
+        return self.queues[id(session)].submit(obj_in, summary, maxlag_in, bot, full)
+
+    def join(self) -> None:
+        """ Waits until every edit submitted so far is done. """
+        for queue in self.queues.values():
+            queue.join()
+
+    def close(self) -> None:
+        """ Waits until every edit is done, then stops the threads sending them. """
+        for queue in self.queues.values():
+            queue.close()
+
+    def __enter__(self) -> 'PoolQueue':
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+def get_push_base(obj_in: I.Entity, full: bool) -> Optional[I.LexemeDict]:
+    """ Returns the JSON of the revision the provided object was built from,
+        if only its changes since that revision are to be pushed.
+    """
+    base_json: Optional[I.LexemeDict] = getattr(obj_in, "base_json", None)
+    if full or base_json is None or obj_in.__jsonout__().get("id") != base_json.get("id"):
+        return None
+    return base_json
 
 def get_wikidata_entities(lids: List[I.EntityId], user_agent: str=DEFAULT_USER_AGENT) -> Dict[I.EntityId, I.EntityPublishedSettings]:
     """ Retrieves a list of entities using the Wikidata API. """
@@ -199,34 +799,111 @@ def get_wikidata_entities(lids: List[I.EntityId], user_agent: str=DEFAULT_USER_A
         return returned_entities
     raise ValueError(f"Response from retrieving {lids} not valid JSON")
 
-def read_config() -> Tuple[str, float]:
+config_path = (Path(__file__).parent / '../config.ini').resolve()
+
+current_config: Optional[Tuple[str, float]] = None
+cache_path_created: bool = False
+
+def read_config(path: Union[str, Path] = config_path) -> Tuple[str, float]:
     """ Reads the config file residing at /path/to/tfsl/config.ini. """
     config = configparser.ConfigParser()
-    current_config_path = (Path(__file__).parent / '../config.ini').resolve()
-    config.read(current_config_path)
+    config.read(path)
+    if not config.has_section('Tfsl'):
+        raise KeyError(f"No [Tfsl] section in {path}; create it or call tfsl.auth.set_config first")
     cpath = config['Tfsl']['CachePath']
     ttl = float(config['Tfsl']['TimeToLive'])
     return cpath, ttl
 
-cache_path, time_to_live = read_config()
-os.makedirs(cache_path,exist_ok=True)
+def set_config(cache_path_in: str, time_to_live_in: float) -> None:
+    """ Sets where retrieved entities should be stored and for how long (in seconds),
+        in place of the values in config.ini, which is then never read.
+    """
+    global current_config, cache_path_created # pylint: disable=global-statement
+    current_config = (cache_path_in, float(time_to_live_in))
+    cache_path_created = False
+
+def get_config() -> Tuple[str, float]:
+    """ Returns the cache path and time to live currently in use,
+        reading them from config.ini the first time if they have not been set otherwise.
+    """
+    global current_config # pylint: disable=global-statement
+    if current_config is None:
+        current_config = read_config()
+    return current_config
+
+def get_cache_path() -> str:
+    """ Returns the folder in which retrieved entities are stored, creating it if needed. """
+    global cache_path_created # pylint: disable=global-statement
+    cpath, _ = get_config()
+    if not cache_path_created:
+        os.makedirs(cpath, exist_ok=True)
+        cache_path_created = True
+    return cpath
+
+def __getattr__(name: str) -> Any:
+    # cache_path and time_to_live used to be read at import time
+    if name == "cache_path":
+        return get_config()[0]
+    elif name == "time_to_live":
+        return get_config()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_filename(entity_name: str) -> str:
     """ Constructs the name of a text file containing a sense subgraph based on a given property. """
-    return os.path.join(cache_path, f"{entity_name}.json")
+    return os.path.join(get_cache_path(), f"{entity_name}.json")
 
 def retrieve_single_entity(entity: Union[I.Qid, I.Pid, I.Lid]) -> I.EntityPublishedSettings:
     """ Retrieves the JSON for a single Wikibase entity. """
-    filename = get_filename(entity)
-    try:
-        assert time.time() - os.path.getmtime(filename) < time_to_live
-        with open(filename, encoding="utf-8") as fileptr:
-            current_output = json.load(fileptr)
-    except (FileNotFoundError, OSError, AssertionError):
+    current_output = read_cached_entity(entity)
+    if current_output is None:
         current_entities = get_wikidata_entities([entity])
         current_output = current_entities[entity]
-        with open(filename, "w", encoding="utf-8") as fileptr:
-            json.dump(current_output, fileptr)
+        write_cached_entity(entity, current_output)
     if not I.is_EntityPublishedSettings(current_output):
         raise ValueError(f"Retrieved data for {entity} was not an entity")
     return current_output
+
+def retrieve_entities(entities: List[I.EntityId], batch_size: int=50, cache_only: bool=False) -> Dict[I.EntityId, I.EntityPublishedSettings]:
+    """ Retrieves the JSON for several Wikibase entities, leaving out those which do not exist,
+        asking the API in batches of batch_size (at most 50) for those which are not stored or have expired.
+        If cache_only is set, only stored entities are returned, however old, and the API is never asked.
+    """
+    entities_out: Dict[I.EntityId, I.EntityPublishedSettings] = {}
+    missing = []
+    for entity in entities:
+        cached_output = read_cached_entity(entity, cache_only)
+        if cached_output is None:
+            missing.append(entity)
+        else:
+            entities_out[entity] = cached_output
+    if cache_only:
+        if missing:
+            logging.warning("%d entities are not stored and were left out: %s", len(missing), ", ".join(missing))
+        return entities_out
+    for start in range(0, len(missing), batch_size):
+        current_entities = get_wikidata_entities(missing[start:start + batch_size])
+        for entity, current_output in current_entities.items():
+            if "missing" in current_output:
+                logging.warning("Entity %s does not exist", entity)
+                continue
+            if not I.is_EntityPublishedSettings(current_output):
+                raise ValueError(f"Retrieved data for {entity} was not an entity")
+            write_cached_entity(entity, current_output)
+            entities_out[entity] = current_output
+    return entities_out
+
+def read_cached_entity(entity: str, ignore_expiry: bool=False) -> Optional[Any]:
+    """ Returns the stored JSON for an entity, or None if there is none or it has expired (unless ignore_expiry is set). """
+    filename = get_filename(entity)
+    _, time_to_live = get_config()
+    try:
+        assert ignore_expiry or time.time() - os.path.getmtime(filename) < time_to_live
+        with open(filename, encoding="utf-8") as fileptr:
+            return json.load(fileptr)
+    except (FileNotFoundError, OSError, AssertionError):
+        return None
+
+def write_cached_entity(entity: str, entity_json: Any) -> None:
+    """ Stores the JSON for an entity. """
+    with open(get_filename(entity), "w", encoding="utf-8") as fileptr:
+        json.dump(entity_json, fileptr)
@@ -0,0 +1,182 @@
+""" Holds the Pipeline class, which streams entities from a source through retrieval, transformation and pushing,
+    and functions providing sources of entities for it.
+
+    Every stage works on a bounded number of entities at a time and only asks the stage before it for more
+    once some of those are done, so that a job over many entities keeps only a few of them in memory at once.
+"""
+
+import bz2
+import gzip
+import json
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+import requests
+
+import tfsl.auth
+import tfsl.delta
+import tfsl.interfaces as I
+import tfsl.item
+import tfsl.journal
+import tfsl.lexeme
+import tfsl.property
+
+SPARQL_URL = "https://query.wikidata.org/sparql"
+ENTITY_URI_PREFIX = "http://www.wikidata.org/entity/"
+
+InputT = TypeVar('InputT')
+OutputT = TypeVar('OutputT')
+
+Source = Iterable[Union[I.EntityId, Dict[str, Any]]]
+
+def pipeline(source: Source) -> 'Pipeline':
+    """ Returns a Pipeline over the provided source, which yields entity IDs or entity JSON
+        (see sparql_source and dump_source for sources other than plain lists of IDs).
+    """
+    return Pipeline(source)
+
+class Pipeline:
+    """ A lazily evaluated sequence of stages applied to a stream of entities, such as
+
+        tfsl.pipeline(ids).fetch().transform(clean).skip_unchanged().push(session, "cleaning")
+
+        Each method other than push returns a new Pipeline with one more stage; nothing is retrieved or run
+        until push is called or the pipeline is iterated over.
+    """
+    def __init__(self, items: Iterable[Any]):
+        self.items = items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def skip_completed(self, journal: tfsl.journal.EditJournal) -> 'Pipeline':
+        """ Leaves out the entities (as IDs, JSON or objects) whose edits the provided journal records as completed. """
+        return Pipeline(item for item in self.items if not journal.is_completed(get_item_id(item)))
+
+    def fetch(self, batch_size: int=50, prefetch: int=2, lazy: bool=False, cache_only: bool=False) -> 'Pipeline':
+        """ Builds an entity from each ID or piece of JSON, retrieving the IDs batch_size at a time
+            while up to prefetch later batches are retrieved in the background.
+            If cache_only is set, only stored entities are used and the others are left out (see tfsl.auth.retrieve_entities).
+            (See tfsl.lexeme.build_lexeme for what setting lazy does.)
+        """
+        def fetch_batch(batch: List[Any]) -> List[Any]:
+            retrieved = tfsl.auth.retrieve_entities([item for item in batch if isinstance(item, str)], batch_size, cache_only)
+            return [build_entity(item if isinstance(item, dict) else retrieved[item], lazy)
+                    for item in batch if isinstance(item, dict) or item in retrieved]
+        batches = bounded_map(fetch_batch, chunked(self.items, batch_size), 1, prefetch + 1)
+        return Pipeline(entity for batch in batches for entity in batch)
+
+    def transform(self, function: Callable[[Any], Any], workers: int=4) -> 'Pipeline':
+        """ Applies the provided function to each entity on a pool of workers threads, keeping the order of the entities.
+            The function returns the entity to carry on with (which may be the one it was given, changed in place),
+            or None to leave it out.
+        """
+        results = bounded_map(function, self.items, workers, 2 * workers)
+        return Pipeline(result for result in results if result is not None)
+
+    def skip_unchanged(self) -> 'Pipeline':
+        """ Leaves out the entities which have no changes since the revision they were built from. """
+        return Pipeline(entity for entity in self.items if has_changes(entity))
+
+    def push(self, session: Union[tfsl.auth.WikibaseSession, tfsl.auth.SessionPool], summary: Optional[str]=None, maxlag_in: int=tfsl.auth.maxlag,
+             bot: bool=False, journal: Optional[tfsl.journal.EditJournal]=None, max_in_flight: int=4,
+             on_pushed: Optional[Callable[[Any, Any], None]]=None) -> int:
+        """ Pushes each entity through a PushQueue on the provided session or pool of sessions (see WikibaseSession.push for the arguments),
+            taking more entities from the stages before only while fewer than twice max_in_flight edits are waiting.
+            Each entity and the response to its edit are passed to on_pushed, if provided.
+            An edit which fails is logged and skipped. Returns the number of edits made.
+        """
+        pushed = 0
+        pending: Deque[Tuple[Any, 'Future[Any]']] = deque()
+        def finish_oldest() -> None:
+            nonlocal pushed
+            entity, future = pending.popleft()
+            try:
+                response = future.result()
+            except Exception: # pylint: disable=broad-except
+                logging.exception("Pushing %s failed", getattr(entity, "id", entity))
+                return
+            pushed += 1
+            if on_pushed is not None:
+                on_pushed(entity, response)
+
+        with session.push_queue(max_in_flight, journal=journal) as queue:
+            for entity in self.items:
+                pending.append((entity, queue.submit(entity, summary, maxlag_in, bot)))
+                while len(pending) > 2 * max_in_flight:
+                    finish_oldest()
+            while pending:
+                finish_oldest()
+        return pushed
+
+def sparql_source(query: str, variable: str="lexeme", user_agent: str=tfsl.auth.DEFAULT_USER_AGENT) -> Iterator[I.EntityId]:
+    """ Yields the IDs of the entities bound to the provided variable in the results of a query to the Wikidata Query Service. """
+    response = requests.get(SPARQL_URL, params={"query": query, "format": "json"}, headers={"User-Agent": user_agent})
+    if response.status_code != 200:
+        raise Exception(f"SPARQL query unsuccessful ({response.status_code}): {response.text}")
+    for binding in response.json()["results"]["bindings"]:
+        if variable in binding:
+            yield binding[variable]["value"].replace(ENTITY_URI_PREFIX, "")
+
+def dump_source(path: str) -> Iterator[Dict[str, Any]]:
+    """ Yields the JSON of each entity in a Wikibase JSON dump (one entity per line), which may be compressed with gzip or bzip2. """
+    opener: Callable[..., Any] = open
+    if path.endswith(".gz"):
+        opener = gzip.open
+    elif path.endswith(".bz2"):
+        opener = bz2.open
+    with opener(path, "rt", encoding="utf-8") as fileptr:
+        for line in fileptr:
+            line = line.strip().rstrip(",")
+            if line not in ("", "[", "]"):
+                yield json.loads(line)
+
+def bounded_map(function: Callable[[InputT], OutputT], items: Iterable[InputT], workers: int, window: int) -> Iterator[OutputT]:
+    """ Applies the provided function to each item on a pool of workers threads, yielding the results in order,
+        with at most window items being worked on or waiting to be taken at any time.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures: Deque['Future[OutputT]'] = deque()
+        for item in items:
+            futures.append(executor.submit(function, item))
+            if len(futures) >= window:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+
+def chunked(items: Iterable[InputT], size: int) -> Iterator[List[InputT]]:
+    """ :meta private: """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def build_entity(entity_json: Any, lazy: bool=False) -> Any:
+    """ Builds a Lexeme, Item or Property from its JSON. """
+    if entity_json.get("type") == "item":
+        return tfsl.item.build_item(entity_json)
+    elif entity_json.get("type") == "property":
+        return tfsl.property.build_property(entity_json)
+    return tfsl.lexeme.build_lexeme(entity_json, lazy)
+
+def get_item_id(item: Any) -> str:
+    """ :meta private: """
+    if isinstance(item, str):
+        return item
+    elif isinstance(item, dict):
+        return str(item.get("id", ""))
+    return str(getattr(item, "id", ""))
+
+def has_changes(entity: Any) -> bool:
+    """ Checks whether an entity differs from the revision it was built from (always true if it was not built from one). """
+    base_json = getattr(entity, "base_json", None)
+    if base_json is None:
+        return True
+    delta = tfsl.delta.lexeme_delta(entity.__jsonout__(), base_json)
+    return any(key not in ("id", "lastrevid") for key in delta)
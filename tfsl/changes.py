@@ -0,0 +1,329 @@
+""" Holds the diff function, which lists the changes between two versions of an entity, and the records it returns.
+
+    Each record has a 'location', which is None for changes to the entity itself
+    and the ID of the form or sense concerned otherwise.
+"""
+
+from collections import Counter, defaultdict
+from functools import singledispatch
+from typing import (Any, Callable, Dict, FrozenSet, Hashable, Iterable, List,
+                    NamedTuple, Optional, Sequence, Set, Tuple, TypeVar, Union)
+
+import tfsl.interfaces as I
+import tfsl.claim
+import tfsl.item
+import tfsl.lexeme
+import tfsl.lexemeform
+import tfsl.lexemesense
+import tfsl.monolingualtext
+import tfsl.monolingualtextholder as MTH
+import tfsl.property
+import tfsl.reference
+import tfsl.statement
+import tfsl.statementholder as STH
+
+class TextChange(NamedTuple):
+    """ A lemma, label, description, representation or gloss (as indicated by 'field') added, changed or removed. """
+    location: Optional[str]
+    field: str
+    old: Optional[tfsl.monolingualtext.MonolingualText]
+    new: Optional[tfsl.monolingualtext.MonolingualText]
+
+class ValueChange(NamedTuple):
+    """ A change to the lexical category or language of a lexeme or the datatype of a property. """
+    location: Optional[str]
+    field: str
+    old: Any
+    new: Any
+
+class AliasChange(NamedTuple):
+    """ Aliases in one language added to or removed from an item or property. """
+    location: Optional[str]
+    language: I.LanguageCode
+    added: FrozenSet[str]
+    removed: FrozenSet[str]
+
+class SitelinkChange(NamedTuple):
+    """ A sitelink of an item added, changed or removed. """
+    location: Optional[str]
+    site: str
+    old: Optional[I.SitelinkDict]
+    new: Optional[I.SitelinkDict]
+
+class FeatureChange(NamedTuple):
+    """ Grammatical features added to or removed from a form. """
+    location: Optional[str]
+    added: FrozenSet[I.Qid]
+    removed: FrozenSet[I.Qid]
+
+class FormAdded(NamedTuple):
+    """ A form added to a lexeme. """
+    location: Optional[str]
+    form: tfsl.lexemeform.LexemeForm
+
+class FormRemoved(NamedTuple):
+    """ A form removed from a lexeme. """
+    location: Optional[str]
+    form: tfsl.lexemeform.LexemeForm
+
+class SenseAdded(NamedTuple):
+    """ A sense added to a lexeme. """
+    location: Optional[str]
+    sense: tfsl.lexemesense.LexemeSense
+
+class SenseRemoved(NamedTuple):
+    """ A sense removed from a lexeme. """
+    location: Optional[str]
+    sense: tfsl.lexemesense.LexemeSense
+
+class StatementAdded(NamedTuple):
+    """ A statement added, including one whose property or value has changed. """
+    location: Optional[str]
+    statement: tfsl.statement.Statement
+
+class StatementRemoved(NamedTuple):
+    """ A statement removed, including one whose property or value has changed. """
+    location: Optional[str]
+    statement: tfsl.statement.Statement
+
+class RankChange(NamedTuple):
+    """ A change to the rank of a statement, which is given in its new version. """
+    location: Optional[str]
+    statement: tfsl.statement.Statement
+    old: tfsl.statement.Rank
+    new: tfsl.statement.Rank
+
+class QualifierAdded(NamedTuple):
+    """ A qualifier added to a statement, which is given in its new version. """
+    location: Optional[str]
+    statement: tfsl.statement.Statement
+    qualifier: tfsl.claim.Claim
+
+class QualifierRemoved(NamedTuple):
+    """ A qualifier removed from a statement, which is given in its new version. """
+    location: Optional[str]
+    statement: tfsl.statement.Statement
+    qualifier: tfsl.claim.Claim
+
+class ReferenceAdded(NamedTuple):
+    """ A reference added to a statement, which is given in its new version. """
+    location: Optional[str]
+    statement: tfsl.statement.Statement
+    reference: tfsl.reference.Reference
+
+class ReferenceRemoved(NamedTuple):
+    """ A reference removed from a statement, which is given in its new version. """
+    location: Optional[str]
+    statement: tfsl.statement.Statement
+    reference: tfsl.reference.Reference
+
+Change = Union[TextChange, ValueChange, AliasChange, SitelinkChange, FeatureChange,
+               FormAdded, FormRemoved, SenseAdded, SenseRemoved,
+               StatementAdded, StatementRemoved, RankChange,
+               QualifierAdded, QualifierRemoved, ReferenceAdded, ReferenceRemoved]
+
+def content_key(component: Any) -> str:
+    """ Returns a key identifying the content of a statement, reference, form or sense. """
+    return str(component.fingerprint)
+
+MatchT = TypeVar('MatchT')
+def remove_shared(components: Sequence[MatchT], others: Sequence[MatchT]) -> List[MatchT]:
+    """ :meta private: """
+    other_counts = Counter(id(component) for component in others)
+    remaining = []
+    for component in components:
+        if other_counts[id(component)] > 0:
+            other_counts[id(component)] -= 1
+        else:
+            remaining.append(component)
+    return remaining
+
+def match_components(old: Sequence[MatchT], new: Sequence[MatchT],
+                     get_id: Callable[[MatchT], Optional[str]],
+                     get_key: Callable[[MatchT], Hashable]) -> Tuple[List[Tuple[MatchT, MatchT]], List[MatchT], List[MatchT]]:
+    """ Pairs up the components in two lists, first by identity, then by ID, then by content key,
+        returning the pairs found, the components only in the old list and the components only in the new list.
+        Components paired by identity are left out, since they cannot have changed.
+    """
+    old_remaining = remove_shared(old, new)
+    new_remaining = remove_shared(new, old)
+
+    old_by_id: Dict[str, MatchT] = {}
+    old_by_key: Dict[Hashable, List[MatchT]] = defaultdict(list)
+    for component in old_remaining:
+        component_id = get_id(component)
+        if component_id is not None and component_id not in old_by_id:
+            old_by_id[component_id] = component
+        else:
+            old_by_key[get_key(component)].append(component)
+
+    pairs: List[Tuple[MatchT, MatchT]] = []
+    added: List[MatchT] = []
+    for component in new_remaining:
+        component_id = get_id(component)
+        if component_id is not None and component_id in old_by_id:
+            pairs.append((old_by_id.pop(component_id), component))
+            continue
+        same_content = old_by_key.get(get_key(component))
+        if same_content:
+            same_content.pop()
+        else:
+            added.append(component)
+
+    removed = list(old_by_id.values())
+    removed.extend(component for components in old_by_key.values() for component in components)
+    return pairs, removed, added
+
+def diff_texts(old: MTH.MonolingualTextHolder, new: MTH.MonolingualTextHolder,
+               field: str, location: Optional[str]=None) -> List[Change]:
+    """ Lists the texts added, changed or removed between two MonolingualTextHolders. """
+    if old.text_map is new.text_map:
+        return []
+    changes: List[Change] = []
+    for code, new_text in new.text_map.items():
+        old_text = old.text_map.get(code)
+        if old_text != new_text:
+            changes.append(TextChange(location, field, old_text, new_text))
+    for code, old_text in old.text_map.items():
+        if code not in new.text_map:
+            changes.append(TextChange(location, field, old_text, None))
+    return changes
+
+def diff_statement(old: tfsl.statement.Statement, new: tfsl.statement.Statement,
+                   location: Optional[str]=None) -> List[Change]:
+    """ Lists the changes between two versions of a statement with the same ID. """
+    if old.property != new.property or old.value != new.value:
+        return [StatementRemoved(location, old), StatementAdded(location, new)]
+    changes: List[Change] = []
+    if old.rank != new.rank:
+        changes.append(RankChange(location, new, old.rank, new.rank))
+    if old.qualifiers is not new.qualifiers:
+        old_qualifiers = [claim for claims in old.qualifiers.values() for claim in claims]
+        new_qualifiers = [claim for claims in new.qualifiers.values() for claim in claims]
+        _, removed, added = match_components(old_qualifiers, new_qualifiers, lambda claim: None, lambda claim: claim)
+        changes.extend(QualifierRemoved(location, new, claim) for claim in removed)
+        changes.extend(QualifierAdded(location, new, claim) for claim in added)
+    if old.references is not new.references:
+        _, removed_refs, added_refs = match_components(old.references, new.references, lambda ref: None, content_key)
+        changes.extend(ReferenceRemoved(location, new, ref) for ref in removed_refs)
+        changes.extend(ReferenceAdded(location, new, ref) for ref in added_refs)
+    return changes
+
+def diff_statements(old: STH.StatementHolder, new: STH.StatementHolder, location: Optional[str]=None) -> List[Change]:
+    """ Lists the statements added, changed or removed between two StatementHolders. """
+    if old.statement_map is new.statement_map:
+        return []
+    changes: List[Change] = []
+    properties = list(old.statement_map) + [prop for prop in new.statement_map if prop not in old.statement_map]
+    for prop in properties:
+        if old.statement_map.get(prop) is new.statement_map.get(prop):
+            continue
+        pairs, removed, added = match_components(old.view_statements(prop), new.view_statements(prop),
+                                                 lambda stmt: stmt.id, content_key)
+        for old_stmt, new_stmt in pairs:
+            changes.extend(diff_statement(old_stmt, new_stmt, location))
+        changes.extend(StatementRemoved(location, stmt) for stmt in removed)
+        changes.extend(StatementAdded(location, stmt) for stmt in added)
+    return changes
+
+def diff_aliases(old: Dict[I.LanguageCode, Set[str]], new: Dict[I.LanguageCode, Set[str]]) -> List[Change]:
+    """ Lists the aliases added or removed in each language. """
+    changes: List[Change] = []
+    for code in list(old) + [code for code in new if code not in old]:
+        old_aliases = old.get(code, set())
+        new_aliases = new.get(code, set())
+        if old_aliases != new_aliases:
+            changes.append(AliasChange(None, code, frozenset(new_aliases - old_aliases), frozenset(old_aliases - new_aliases)))
+    return changes
+
+def diff_values(fields: Iterable[str], old: Any, new: Any) -> List[Change]:
+    """ :meta private: """
+    return [ValueChange(None, field, getattr(old, field), getattr(new, field))
+            for field in fields if getattr(old, field) != getattr(new, field)]
+
+@singledispatch
+def diff(old: Any, new: Any) -> List[Change]:
+    """ Lists the changes between two versions of a Lexeme, LexemeForm, LexemeSense, Item or Property,
+        matching their forms, senses, statements and references by identity, then by ID, then by content,
+        so that an empty list means that pushing the new version would change nothing.
+    """
+    raise TypeError(f"Can't diff {type(old)}")
+
+def check_same_type(old: Any, new: Any) -> None:
+    """ :meta private: """
+    if type(old) is not type(new):
+        raise TypeError(f"Can't diff {type(old)} against {type(new)}")
+
+@diff.register
+def _(old: tfsl.lexemeform.LexemeForm, new: tfsl.lexemeform.LexemeForm) -> List[Change]:
+    check_same_type(old, new)
+    if old is new:
+        return []
+    location = new.id
+    changes = diff_texts(old.representations, new.representations, "representations", location)
+    if old.features != new.features:
+        changes.append(FeatureChange(location, frozenset(new.features - old.features), frozenset(old.features - new.features)))
+    changes.extend(diff_statements(old.statements, new.statements, location))
+    return changes
+
+@diff.register
+def _(old: tfsl.lexemesense.LexemeSense, new: tfsl.lexemesense.LexemeSense) -> List[Change]:
+    check_same_type(old, new)
+    if old is new:
+        return []
+    location = new.id
+    changes = diff_texts(old.glosses, new.glosses, "glosses", location)
+    changes.extend(diff_statements(old.statements, new.statements, location))
+    return changes
+
+@diff.register
+def _(old: tfsl.lexeme.Lexeme, new: tfsl.lexeme.Lexeme) -> List[Change]:
+    check_same_type(old, new)
+    if old is new:
+        return []
+    changes = diff_values(["category", "language"], old, new)
+    changes.extend(diff_texts(old.lemmata, new.lemmata, "lemmas"))
+    changes.extend(diff_statements(old.statements, new.statements))
+
+    if old.view_forms() is not new.view_forms():
+        form_pairs, removed_forms, added_forms = match_components(old.view_forms(), new.view_forms(), lambda form: form.id, content_key)
+        for old_form, new_form in form_pairs:
+            changes.extend(diff(old_form, new_form))
+        changes.extend(FormRemoved(None, form) for form in removed_forms)
+        changes.extend(FormAdded(None, form) for form in added_forms)
+
+    if old.view_senses() is not new.view_senses():
+        sense_pairs, removed_senses, added_senses = match_components(old.view_senses(), new.view_senses(), lambda sense: sense.id, content_key)
+        for old_sense, new_sense in sense_pairs:
+            changes.extend(diff(old_sense, new_sense))
+        changes.extend(SenseRemoved(None, sense) for sense in removed_senses)
+        changes.extend(SenseAdded(None, sense) for sense in added_senses)
+    return changes
+
+@diff.register
+def _(old: tfsl.item.Item, new: tfsl.item.Item) -> List[Change]:
+    check_same_type(old, new)
+    if old is new:
+        return []
+    changes = diff_texts(old.labels, new.labels, "labels")
+    changes.extend(diff_texts(old.descriptions, new.descriptions, "descriptions"))
+    changes.extend(diff_aliases(old.aliases, new.aliases))
+    for site in list(old.sitelinks) + [site for site in new.sitelinks if site not in old.sitelinks]:
+        old_sitelink = old.sitelinks.get(site)
+        new_sitelink = new.sitelinks.get(site)
+        if old_sitelink != new_sitelink:
+            changes.append(SitelinkChange(None, site, old_sitelink, new_sitelink))
+    changes.extend(diff_statements(old.statements, new.statements))
+    return changes
+
+@diff.register
+def _(old: tfsl.property.Property, new: tfsl.property.Property) -> List[Change]:
+    check_same_type(old, new)
+    if old is new:
+        return []
+    changes = diff_values(["datatype"], old, new)
+    changes.extend(diff_texts(old.labels, new.labels, "labels"))
+    changes.extend(diff_texts(old.descriptions, new.descriptions, "descriptions"))
+    changes.extend(diff_aliases(old.aliases, new.aliases))
+    changes.extend(diff_statements(old.statements, new.statements))
+    return changes
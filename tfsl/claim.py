@@ -51,34 +51,19 @@ class Claim:
     def __str__(self) -> str:
         return f'{self.property}: {self.value}'
 
+    @property
+    def fingerprint(self) -> str:
+        """ Returns a digest of the claim's property and value, which is the same for equal claims. """
+        parts = (self.property, self.value)
+        if (fingerprint := tfsl.utils.get_cached_fragment(self, parts, '_fingerprint')) is not None:
+            return fingerprint
+        return tfsl.utils.set_cached_fragment(self, parts, claim_fingerprint(self.property, self.value), '_fingerprint')
+
     def __jsonout__(self) -> I.ClaimDict:
-        snaktype: str = "value"
-        value_out: Optional[I.ClaimDictValue] = None
-        datavalue_out: Optional[I.ClaimDictDatavalue] = None
-
-        if isinstance(self.value, bool):
-            if self.value is False:
-                snaktype = "novalue"
-            elif self.value is True:
-                snaktype = "somevalue"
-        elif isinstance(self.value, str):
-            value_out = self.value
-        else:
-            value_out = self.value.__jsonout__()
-        if value_out is not None:
-            datavalue_out = {
-                "value": value_out,
-                "type": tfsl.utils.values_type(self.property)
-            }
-
-        claimdict_out: I.ClaimDict = {
-            "snaktype": snaktype,
-            "property": self.property,
-            "datatype": tfsl.utils.values_datatype(self.property),
-        }
-        if datavalue_out is not None:
-            claimdict_out["datavalue"] = datavalue_out
-        return claimdict_out
+        parts = (self.property, self.value, self.datatype)
+        if (fragment := tfsl.utils.get_cached_fragment(self, parts)) is not None:
+            return fragment
+        return tfsl.utils.set_cached_fragment(self, parts, build_snak(self.property, self.value, self.datatype))
 
     def get_ItemValue(self, # pylint: disable=invalid-name
                       novalue: Optional[tfsl.itemvalue.ItemValue]=None,
@@ -128,6 +113,38 @@ class Claim:
             return novalue
         raise TypeError(f"{self.property} statement did not yield a string")
 
+def claim_fingerprint(property_in: I.Pid, value: I.ClaimValue) -> str:
+    """ Returns a digest of the provided property and value (see Claim.fingerprint). """
+    value_out: Union[str, I.ClaimDictValue]
+    if value is False:
+        value_out = "novalue"
+    elif value is True:
+        value_out = "somevalue"
+    elif isinstance(value, str):
+        value_out = value
+    else:
+        value_out = value.__jsonout__()
+    return tfsl.utils.make_fingerprint("claim", property_in, type(value).__name__, value_out)
+
+def build_snak(property_in: I.Pid, value: I.ClaimValue, datatype: str) -> I.ClaimDict:
+    """ Builds the Wikibase JSON for a snak with the provided property, value and outward-facing datatype. """
+    claimdict_out: I.ClaimDict = {
+        "snaktype": "value",
+        "property": property_in,
+        "datatype": datatype,
+    }
+    if value is False:
+        claimdict_out["snaktype"] = "novalue"
+    elif value is True:
+        claimdict_out["snaktype"] = "somevalue"
+    else:
+        value_out: I.ClaimDictValue = value if isinstance(value, str) else value.__jsonout__()
+        claimdict_out["datavalue"] = {
+            "value": value_out,
+            "type": tfsl.utils.external_to_internal_type_mapping[datatype]
+        }
+    return claimdict_out
+
 @overload
 def build_value(actual_value: I.QuantityValueDict) -> tfsl.quantityvalue.QuantityValue: ...
 @overload
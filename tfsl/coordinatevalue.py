@@ -17,6 +17,15 @@ class CoordinateValue:
         self.alt: Optional[float] = altitude
         self.globe: str = globe
 
+    def __eq__(self, rhs: object) -> bool:
+        if not isinstance(rhs, CoordinateValue):
+            return NotImplemented
+        positions_equal = self.lat == rhs.lat and self.lon == rhs.lon and self.alt == rhs.alt
+        return positions_equal and self.prec == rhs.prec and self.globe == rhs.globe
+
+    def __hash__(self) -> int:
+        return hash((self.lat, self.lon, self.alt, self.prec, self.globe))
+
     def __jsonout__(self) -> I.CoordinateValueDict:
         base_dict: I.CoordinateValueDict = {
             "latitude": self.lat,
@@ -0,0 +1,146 @@
+""" Holds functions reducing the JSON of an entity to those parts of it which differ from the revision it was loaded from,
+    and moving such changes onto a later revision of the entity.
+
+    Since wbeditentity leaves alone any lemma, form, sense or statement not mentioned in the data it is given,
+    sending the reduced JSON makes the same changes to the entity as sending all of it.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import tfsl.interfaces as I
+
+def matches_base(current: Any, base: Any) -> bool:
+    """ Checks whether a piece of output JSON says nothing other than what the matching piece of retrieved JSON says.
+        Hashes present only in the retrieved JSON are ignored, since they are never part of the output,
+        as are empty lists and dictionaries present only in the output.
+    """
+    if current is base:
+        return True
+    if isinstance(current, dict):
+        if not isinstance(base, dict):
+            return False
+        if any(key not in current and key != "hash" for key in base):
+            return False
+        return all(matches_base(value, base[key]) if key in base else is_empty_container(value)
+                   for key, value in current.items())
+    if isinstance(current, list):
+        if not isinstance(base, list) or len(current) != len(base):
+            return False
+        return all(matches_base(current_value, base_value) for current_value, base_value in zip(current, base))
+    return bool(current == base)
+
+def is_empty_container(value: Any) -> bool:
+    """ :meta private: """
+    return isinstance(value, (list, dict)) and not value
+
+def texts_delta(current: I.LemmaDictSet, base: I.LemmaDictSet) -> I.LemmaDictSet:
+    """ Returns those lemmata, representations or glosses which were added, changed or marked for removal. """
+    if current is base:
+        return {}
+    return {code: text for code, text in current.items() if not matches_base(text, base.get(code))}
+
+def statements_delta(current: I.StatementDictSet, base: I.StatementDictSet) -> I.StatementDictSet:
+    """ Returns those statements which were added, changed or marked for removal, grouped by property. """
+    if current is base:
+        return {}
+    base_by_id = {stmt["id"]: stmt for stmts in base.values() for stmt in stmts if "id" in stmt}
+    delta: I.StatementDictSet = {}
+    for prop, stmts in current.items():
+        if stmts is base.get(prop):
+            continue
+        changed_stmts = [stmt for stmt in stmts
+                         if "id" not in stmt or "remove" in stmt
+                         or not matches_base(stmt, base_by_id.get(stmt["id"]))]
+        if changed_stmts:
+            delta[prop] = changed_stmts
+    return delta
+
+def subentity_delta(current: Dict[str, Any], base: Optional[Dict[str, Any]], texts_key: str) -> Optional[Dict[str, Any]]:
+    """ Returns the changes to a form (with texts_key "representations") or a sense (with texts_key "glosses"),
+        which is the whole form or sense if it is new, or None if it is unchanged.
+    """
+    if current is base:
+        return None
+    if base is None or "id" not in current:
+        return current
+    delta: Dict[str, Any] = {"id": current["id"]}
+    if texts := texts_delta(current[texts_key], base.get(texts_key, {})):
+        delta[texts_key] = texts
+    if "grammaticalFeatures" in current and set(current["grammaticalFeatures"]) != set(base.get("grammaticalFeatures", [])):
+        delta["grammaticalFeatures"] = current["grammaticalFeatures"]
+    if claims := statements_delta(current.get("claims", {}), base.get("claims", {})):
+        delta["claims"] = claims
+    if len(delta) == 1:
+        return None
+    return delta
+
+def subentities_delta(current: List[Dict[str, Any]], base: List[Dict[str, Any]], texts_key: str) -> List[Dict[str, Any]]:
+    """ Returns the changes to each of a list of forms or senses, leaving out the unchanged ones. """
+    if current is base:
+        return []
+    base_by_id = {subentity["id"]: subentity for subentity in base}
+    delta = []
+    for subentity in current:
+        subentity_out = subentity_delta(subentity, base_by_id.get(subentity.get("id", "")), texts_key)
+        if subentity_out is not None:
+            delta.append(subentity_out)
+    return delta
+
+def lexeme_delta(current: I.LexemeDict, base: I.LexemeDict) -> I.LexemeDict:
+    """ Returns the JSON of a lexeme reduced to its changes relative to the JSON it was built from. """
+    delta: Dict[str, Any] = {key: current[key] for key in ("id", "lastrevid") if key in current}
+    for key in ("lexicalCategory", "language"):
+        if current[key] != base.get(key):
+            delta[key] = current[key]
+    if lemmas := texts_delta(current["lemmas"], base.get("lemmas", {})):
+        delta["lemmas"] = lemmas
+    if claims := statements_delta(current["claims"], base.get("claims", {})):
+        delta["claims"] = claims
+    if forms := subentities_delta(current["forms"], base.get("forms", []), "representations"):
+        delta["forms"] = forms
+    if senses := subentities_delta(current["senses"], base.get("senses", []), "glosses"):
+        delta["senses"] = senses
+    return delta # type: ignore[return-value]
+
+def statements_unchanged(delta: I.StatementDictSet, base: I.StatementDictSet, latest: I.StatementDictSet) -> bool:
+    """ Checks whether every statement with an ID in the provided delta is the same in the latest revision as in the base one. """
+    base_by_id = {stmt["id"]: stmt for stmts in base.values() for stmt in stmts if "id" in stmt}
+    latest_by_id = {stmt["id"]: stmt for stmts in latest.values() for stmt in stmts if "id" in stmt}
+    return all(stmt["id"] in latest_by_id and latest_by_id[stmt["id"]] == base_by_id.get(stmt["id"])
+               for stmts in delta.values() for stmt in stmts if "id" in stmt)
+
+def subentity_unchanged(delta: Dict[str, Any], base: Optional[Dict[str, Any]], latest: Optional[Dict[str, Any]], texts_key: str) -> bool:
+    """ Checks whether those parts of a form or sense changed by the provided delta are the same in the latest revision as in the base one. """
+    if "id" not in delta:
+        return True
+    if base is None or latest is None:
+        return False
+    if "remove" in delta:
+        return bool(latest == base)
+    if any(latest[texts_key].get(code) != base[texts_key].get(code) for code in delta.get(texts_key, {})):
+        return False
+    if "grammaticalFeatures" in delta and set(latest["grammaticalFeatures"]) != set(base["grammaticalFeatures"]):
+        return False
+    return statements_unchanged(delta.get("claims", {}), base.get("claims", {}), latest.get("claims", {}))
+
+def rebase_delta(delta: I.LexemeDict, base: I.LexemeDict, latest: I.LexemeDict) -> Optional[I.LexemeDict]:
+    """ Returns the provided delta, made relative to the base revision, updated to apply to the latest revision of the lexeme instead,
+        or None if anything it changes was also changed between those two revisions.
+    """
+    for key in ("lexicalCategory", "language"):
+        if key in delta and latest[key] != base[key]:
+            return None
+    if any(latest["lemmas"].get(code) != base["lemmas"].get(code) for code in delta.get("lemmas", {})):
+        return None
+    if not statements_unchanged(delta.get("claims", {}), base["claims"], latest["claims"]):
+        return None
+    for key, texts_key in (("forms", "representations"), ("senses", "glosses")):
+        base_by_id = {subentity["id"]: subentity for subentity in base[key]} # type: ignore[literal-required]
+        latest_by_id = {subentity["id"]: subentity for subentity in latest[key]} # type: ignore[literal-required]
+        for subentity in delta.get(key, []):
+            subentity_id = subentity.get("id", "")
+            if not subentity_unchanged(subentity, base_by_id.get(subentity_id), latest_by_id.get(subentity_id), texts_key):
+                return None
+    rebased: Dict[str, Any] = dict(delta)
+    rebased["lastrevid"] = latest["lastrevid"]
+    return rebased # type: ignore[return-value]
@@ -0,0 +1,157 @@
+""" Holds functions defining rules which rewrite the grammatical features of forms,
+    and the FeatureRules class applying a compiled set of such rules to lexemes.
+
+    Compiling a rule set gives each grammatical feature mentioned in it a bit,
+    so that checking and rewriting the features of a form takes a few integer operations per rule
+    instead of set operations on Qid strings. Features not mentioned in any rule are left as they are.
+"""
+
+import re
+from typing import Collection, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Set, Tuple
+
+import tfsl.bulk
+import tfsl.changes
+import tfsl.interfaces as I
+import tfsl.lexeme
+import tfsl.lexemeform
+
+class FeatureRule(NamedTuple):
+    """ A rule which, for each form having every feature in 'when', none of the features in 'unless'
+        and (if a pattern is provided) a representation matching that regular expression,
+        removes the features in 'remove' and then adds those in 'add'.
+    """
+    remove: FrozenSet[I.Qid] = frozenset()
+    add: FrozenSet[I.Qid] = frozenset()
+    when: FrozenSet[I.Qid] = frozenset()
+    unless: FrozenSet[I.Qid] = frozenset()
+    pattern: Optional[str] = None
+
+def replace(feature: I.Qid, replacements: Iterable[I.Qid], pattern: Optional[str]=None) -> FeatureRule:
+    """ Returns a rule replacing a feature with the provided features wherever it occurs. """
+    return FeatureRule(remove=frozenset([feature]), add=frozenset(replacements), when=frozenset([feature]), pattern=pattern)
+
+def require(features: Iterable[I.Qid], when: Iterable[I.Qid]=(), unless: Iterable[I.Qid]=(), pattern: Optional[str]=None) -> FeatureRule:
+    """ Returns a rule adding the provided features to any form matching the conditions which lacks them. """
+    return FeatureRule(add=frozenset(features), when=frozenset(when), unless=frozenset(unless), pattern=pattern)
+
+def forbid(features: Iterable[I.Qid], when: Iterable[I.Qid]=(), unless: Iterable[I.Qid]=(), pattern: Optional[str]=None) -> FeatureRule:
+    """ Returns a rule removing the provided features from any form matching the conditions. """
+    return FeatureRule(remove=frozenset(features), when=frozenset(when), unless=frozenset(unless), pattern=pattern)
+
+def replacements_to_rules(replacements: Dict[I.Qid, List[I.Qid]]) -> List[FeatureRule]:
+    """ Returns a rule for each entry of a dictionary mapping features to the features replacing them. """
+    return [replace(feature, targets) for feature, targets in replacements.items()]
+
+class CompiledRule(NamedTuple):
+    """ :meta private: """
+    when_mask: int
+    unless_mask: int
+    remove_mask: int
+    add_mask: int
+    pattern: Optional[Pattern[str]]
+
+class FeatureRules:
+    """ A set of FeatureRules compiled for applying to many lexemes. Rules are applied in the order they were provided,
+        each one to the features left by the ones before it.
+    """
+    def __init__(self, rules: Iterable[FeatureRule]):
+        self.bits: Dict[I.Qid, int] = {}
+        self.features_by_bit: List[I.Qid] = []
+        self.rules: List[CompiledRule] = []
+        for rule in rules:
+            pattern = re.compile(rule.pattern) if rule.pattern is not None else None
+            self.rules.append(CompiledRule(self.intern(rule.when), self.intern(rule.unless),
+                                           self.intern(rule.remove), self.intern(rule.add), pattern))
+        self.vocabulary = frozenset(self.bits)
+        # without patterns, the outcome only depends on which features mentioned in the rules a form has,
+        # and few distinct combinations of those occur in practice
+        self.memoize = all(rule.pattern is None for rule in self.rules)
+        self.outcomes: Dict[FrozenSet[I.Qid], Tuple[FrozenSet[I.Qid], FrozenSet[I.Qid]]] = {}
+
+    def intern(self, features: Iterable[I.Qid]) -> int:
+        """ :meta private: """
+        mask = 0
+        for feature in features:
+            if feature not in self.bits:
+                self.bits[feature] = len(self.features_by_bit)
+                self.features_by_bit.append(feature)
+            mask |= 1 << self.bits[feature]
+        return mask
+
+    def to_mask(self, features: Collection[I.Qid]) -> int:
+        """ Returns the mask of those of the provided features which are mentioned in the rules. """
+        mask = 0
+        for feature in features:
+            bit = self.bits.get(feature)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def to_features(self, mask: int) -> Set[I.Qid]:
+        """ Returns the features whose bits are set in the provided mask. """
+        features = set()
+        while mask:
+            lowest_bit = mask & -mask
+            features.add(self.features_by_bit[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return features
+
+    def rewrite_mask(self, mask: int, texts: Iterable[str]) -> int:
+        """ Applies the rules to the provided mask of a form with the provided representations. """
+        text_list: Optional[List[str]] = None
+        for rule in self.rules:
+            if mask & rule.when_mask != rule.when_mask or mask & rule.unless_mask:
+                continue
+            if rule.pattern is not None:
+                if text_list is None:
+                    text_list = list(texts)
+                if not any(rule.pattern.search(text) for text in text_list):
+                    continue
+            mask = (mask & ~rule.remove_mask) | rule.add_mask
+        return mask
+
+    def form_changes(self, form: tfsl.lexemeform.LexemeForm) -> Optional[tfsl.changes.FeatureChange]:
+        """ Returns the change the rules make to the features of the provided form, or None if they make none. """
+        known_features = self.vocabulary.intersection(form.features)
+        outcome = self.outcomes.get(known_features) if self.memoize else None
+        if outcome is None:
+            old_mask = self.to_mask(known_features)
+            new_mask = self.rewrite_mask(old_mask, (text.text for text in form.representations))
+            outcome = (frozenset(self.to_features(new_mask & ~old_mask)), frozenset(self.to_features(old_mask & ~new_mask)))
+            if self.memoize:
+                self.outcomes[known_features] = outcome
+        added, removed = outcome
+        if not added and not removed:
+            return None
+        return tfsl.changes.FeatureChange(form.id, added, removed)
+
+    def changes(self, lexeme: tfsl.lexeme.Lexeme) -> List[tfsl.changes.FeatureChange]:
+        """ Returns the changes the rules make to the features of the forms of the provided lexeme, without making them. """
+        return [change for form in lexeme.view_forms() if (change := self.form_changes(form)) is not None]
+
+    def apply(self, lexeme: tfsl.lexeme.Lexeme) -> List[tfsl.changes.FeatureChange]:
+        """ Applies the rules to the forms of the provided lexeme in place, returning the changes made. """
+        changes = []
+        for form in lexeme.forms:
+            change = self.form_changes(form)
+            if change is not None:
+                form.features.difference_update(change.removed)
+                form.features.update(change.added)
+                changes.append(change)
+        return changes
+
+    def rewrite(self, lexeme: tfsl.lexeme.Lexeme) -> tfsl.lexeme.Lexeme:
+        """ Applies the rules to the provided lexeme in place and returns it, for use as a Pipeline transform. """
+        self.apply(lexeme)
+        return lexeme
+
+    def apply_all(self, lexemes: Iterable[tfsl.lexeme.Lexeme],
+                  workers: int=1) -> Iterator[Tuple[tfsl.lexeme.Lexeme, List[tfsl.changes.FeatureChange]]]:
+        """ Applies the rules to each of the provided lexemes in place, on a pool of workers threads if more than one,
+            yielding each lexeme with the changes made to it.
+        """
+        if workers <= 1:
+            for lexeme in lexemes:
+                yield lexeme, self.apply(lexeme)
+        else:
+            yield from tfsl.bulk.bounded_map(lambda lexeme: (lexeme, self.apply(lexeme)), lexemes, workers, 2 * workers)
@@ -0,0 +1,223 @@
+""" Holds the FormIndex class, which looks up the forms of a lexeme by ID and by grammatical feature. """
+
+from typing import Callable, Collection, Dict, FrozenSet, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+import tfsl.interfaces as I
+from tfsl.persistent import EMPTY_VECTOR, PMap, PVector
+
+FormT = TypeVar('FormT')
+
+# the ID and the grammatical features a form was indexed under
+IndexKeys = Tuple[Optional[str], FrozenSet[I.Qid]]
+
+class ChangeLog:
+    """ The serial numbers of forms whose IDs or features were reported as changed in place,
+        shared by a FormIndex and every index derived from it.
+        A form is told its serial number and the log of each index it is added to
+        through its watch(log, serial) method, if it has one, and calls mark(serial) on the log when it changes.
+    """
+    def __init__(self) -> None:
+        self.serials: List[int] = []
+
+    def mark(self, serial: int) -> None:
+        """ Records that the form with the provided serial number was changed. """
+        self.serials.append(serial)
+
+class FormIndex(Generic[FormT]):
+    """ Immutable index over a list of forms, mapping each form ID to its form
+        and each grammatical feature to the forms having that feature.
+
+        Each form is given a serial number when it is added, and queries return forms in order of serial number,
+        which is the order of the list of forms the index was built from.
+        Adding or removing a form returns a new index sharing most of its structure with the original,
+        together with the matching PVector of forms (as the 'forms' attribute).
+        The ID and features each form was indexed under are kept, so that a form whose ID or features
+        were changed in place can still be removed. Forms which report such changes to the index's ChangeLog
+        (as LexemeForms do) can then be indexed again under their current ones by refresh(),
+        which only looks at the forms reported since the index was last refreshed.
+        Forms which do not report changes are assumed not to change in place.
+    """
+    def __init__(self,
+                 get_id: Callable[[FormT], Optional[str]],
+                 get_features: Callable[[FormT], Iterable[I.Qid]],
+                 forms: Iterable[FormT]=()):
+        self.get_id = get_id
+        self.get_features = get_features
+        self.forms: PVector[FormT] = EMPTY_VECTOR
+        self.entries: PMap[int, FormT] = PMap()
+        self.keys: PMap[int, IndexKeys] = PMap()
+        self.by_id: PMap[str, int] = PMap()
+        self.by_feature: PMap[I.Qid, PMap[int, FormT]] = PMap()
+        self.next_serial = 0
+        self.change_log = ChangeLog()
+        self.changes_seen = 0
+        # dicts of the forms with each feature, in order, as of the PMap they were made from;
+        # these are shared with the indexes derived from this one
+        self.materialized: Dict[I.Qid, Tuple[PMap[int, FormT], Dict[int, FormT]]] = {}
+        for form in forms:
+            self.insert(form)
+        if isinstance(forms, PVector):
+            self.forms = forms
+
+    def copy(self) -> 'FormIndex[FormT]':
+        """ :meta private: """
+        index_out: FormIndex[FormT] = FormIndex.__new__(FormIndex)
+        index_out.__dict__.update(self.__dict__)
+        return index_out
+
+    def get_keys(self, form: FormT) -> IndexKeys:
+        """ :meta private: """
+        return self.get_id(form), frozenset(self.get_features(form))
+
+    def insert(self, form: FormT) -> None:
+        """ :meta private: """
+        serial = self.next_serial
+        self.next_serial += 1
+        self.forms = self.forms.appended(form)
+        self.entries = self.entries.set(serial, form)
+        self.index_entry(serial, form)
+        watch = getattr(form, 'watch', None)
+        if watch is not None:
+            watch(self.change_log, serial)
+
+    def index_entry(self, serial: int, form: FormT) -> None:
+        """ :meta private: """
+        keys = self.get_keys(form)
+        self.keys = self.keys.set(serial, keys)
+        self.index_id(serial, keys[0])
+        self.index_features(serial, form, keys[1])
+
+    def unindex_entry(self, serial: int) -> None:
+        """ :meta private: """
+        form_id, features = self.keys[serial]
+        self.keys = self.keys.discard(serial)
+        self.unindex_features(serial, features)
+        self.unindex_id(serial, form_id)
+
+    def reindex_entry(self, serial: int, form: FormT, keys: IndexKeys) -> None:
+        """ :meta private: """
+        old_id, old_features = self.keys[serial]
+        new_id, new_features = keys
+        self.keys = self.keys.set(serial, keys)
+        self.unindex_features(serial, old_features - new_features)
+        self.index_features(serial, form, new_features - old_features)
+        if old_id != new_id:
+            self.unindex_id(serial, old_id)
+            self.index_id(serial, new_id)
+
+    def index_id(self, serial: int, form_id: Optional[str]) -> None:
+        """ :meta private: """
+        if form_id is not None and self.by_id.get(form_id, serial) >= serial:
+            self.by_id = self.by_id.set(form_id, serial)
+
+    def unindex_id(self, serial: int, form_id: Optional[str]) -> None:
+        """ :meta private: """
+        if form_id is not None and self.by_id.get(form_id) == serial:
+            self.by_id = self.by_id.discard(form_id)
+            for other_serial, (other_id, _) in self.keys.items():
+                if other_id == form_id:
+                    self.by_id = self.by_id.set(form_id, other_serial)
+                    break
+
+    def index_features(self, serial: int, form: FormT, features: Iterable[I.Qid]) -> None:
+        """ :meta private: """
+        for feature in features:
+            with_feature = self.by_feature.get(feature, PMap())
+            self.by_feature = self.by_feature.set(feature, with_feature.set(serial, form))
+
+    def unindex_features(self, serial: int, features: Iterable[I.Qid]) -> None:
+        """ :meta private: """
+        for feature in features:
+            with_feature = self.by_feature[feature].discard(serial)
+            if with_feature:
+                self.by_feature = self.by_feature.set(feature, with_feature)
+            else:
+                self.by_feature = self.by_feature.discard(feature)
+
+    def add(self, form: FormT) -> 'FormIndex[FormT]':
+        """ Returns an index which also includes the provided form, placed after every other form. """
+        index_out = self.copy()
+        index_out.insert(form)
+        return index_out
+
+    def remove(self, form: FormT) -> 'FormIndex[FormT]':
+        """ Returns an index without any form equal to the provided form. """
+        serials = [serial for serial in self.entries if self.entries[serial] == form]
+        if not serials:
+            return self
+        index_out = self.copy()
+        index_out.forms = self.forms.without(form)
+        for serial in serials:
+            index_out.entries = index_out.entries.discard(serial)
+            index_out.unindex_entry(serial)
+        return index_out
+
+    def map_forms(self, function: Callable[[FormT], FormT]) -> 'FormIndex[FormT]':
+        """ Returns an index of the results of calling the provided function on each form, in the same order,
+            without looking up their IDs and features again, so each result must have the same ones as its form
+            (as copies of the forms do) and this index should be refreshed first.
+        """
+        index_out: FormIndex[FormT] = FormIndex(self.get_id, self.get_features)
+        index_out.keys = self.keys
+        index_out.by_id = self.by_id
+        index_out.next_serial = self.next_serial
+        for serial, form in self.entries.items():
+            new_form = function(form)
+            index_out.forms = index_out.forms.appended(new_form)
+            index_out.entries = index_out.entries.set(serial, new_form)
+            index_out.index_features(serial, new_form, self.keys[serial][1])
+            watch = getattr(new_form, 'watch', None)
+            if watch is not None:
+                watch(index_out.change_log, serial)
+        return index_out
+
+    def refresh(self) -> 'FormIndex[FormT]':
+        """ Returns an index in which the forms reported as changed in place since this index was last refreshed
+            are indexed under their current IDs and features, which is this index itself if there are no such forms.
+        """
+        changed_serials = self.change_log.serials[self.changes_seen:]
+        if not changed_serials:
+            return self
+        index_out = self.copy()
+        index_out.changes_seen += len(changed_serials)
+        # serial numbers may be shared with forms of other indexes derived from the same one
+        for serial in set(changed_serials):
+            form = self.entries.get(serial)
+            if form is not None:
+                keys = self.get_keys(form)
+                if keys != self.keys[serial]:
+                    index_out.reindex_entry(serial, form, keys)
+        return index_out
+
+    def get(self, form_id: str) -> FormT:
+        """ Returns the form with the provided ID, raising a KeyError if there is none. """
+        return self.entries[self.by_id[form_id]]
+
+    def query(self, inflections: Collection[I.Qid], exclusions: Optional[Collection[I.Qid]]=None) -> List[FormT]:
+        """ Returns the forms with all of the provided inflectional features
+            and none of the features in the exclusions list, in their original order.
+        """
+        candidates = [self.get_with_feature(feature) for feature in set(inflections)]
+        if any(candidate is None for candidate in candidates):
+            return []
+        candidates.sort(key=len)
+        if candidates:
+            smallest = candidates[0]
+        else:
+            smallest = {serial: self.entries[serial] for serial in self.entries}
+        excluded = [self.get_with_feature(feature) for feature in set(exclusions or []) if feature in self.by_feature]
+        return [form for serial, form in smallest.items()
+                if all(serial in candidate for candidate in candidates[1:])
+                and not any(serial in candidate for candidate in excluded)]
+
+    def get_with_feature(self, feature: I.Qid) -> Optional[Dict[int, FormT]]:
+        """ :meta private: """
+        with_feature = self.by_feature.get(feature)
+        if with_feature is None:
+            return None
+        materialized = self.materialized.get(feature)
+        if materialized is None or materialized[0] is not with_feature:
+            # forms indexed again by refresh() come after the others in the PMaps of their features
+            materialized = (with_feature, {serial: with_feature[serial] for serial in sorted(with_feature)})
+            self.materialized[feature] = materialized
+        return materialized[1]
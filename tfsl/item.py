@@ -1,6 +1,7 @@
 """ Holds the Item class and a function to build one given a JSON representation of it. """
 
-from typing import Dict, Optional, Set, Union
+from types import TracebackType
+from typing import Dict, Optional, Set, Type, Union
 
 import tfsl.interfaces as I
 import tfsl.auth
@@ -12,6 +13,7 @@ import tfsl.monolingualtextholder
 import tfsl.statement
 import tfsl.statementholder
 import tfsl.utils
+from tfsl.persistent import PVector
 
 class Item:
     """ Container for a Wikidata item. """
@@ -127,7 +129,7 @@ class Item:
         """
         published_settings = self.get_published_settings()
         item_out = Item(self.labels + arg, self.descriptions, self.aliases,
-                      self.statements, self.sitelinks)
+                      self.statements.copy(), self.sitelinks)
         item_out.set_published_settings(published_settings)
         return item_out
 
@@ -137,7 +139,7 @@ class Item:
         """
         published_settings = self.get_published_settings()
         item_out = Item(self.labels, self.descriptions + arg, self.aliases,
-                      self.statements, self.sitelinks)
+                      self.statements.copy(), self.sitelinks)
         item_out.set_published_settings(published_settings)
         return item_out
 
@@ -158,7 +160,7 @@ class Item:
         """
         published_settings = self.get_published_settings()
         item_out = Item(self.labels - arg, self.descriptions, self.aliases,
-                      self.statements, self.sitelinks)
+                      self.statements.copy(), self.sitelinks)
         item_out.set_published_settings(published_settings)
         return item_out
 
@@ -168,10 +170,96 @@ class Item:
         """
         published_settings = self.get_published_settings()
         item_out = Item(self.labels, self.descriptions - arg, self.aliases,
-                      self.statements, self.sitelinks)
+                      self.statements.copy(), self.sitelinks)
         item_out.set_published_settings(published_settings)
         return item_out
 
+    def edit(self) -> 'ItemEditor':
+        """ Returns an ItemEditor for making many changes to this item at once:
+
+            with item.edit() as editor:
+                editor += statement
+                editor.add_label(label)
+            item = editor.result
+        """
+        return ItemEditor(self)
+
+class ItemEditor:
+    """ Applies additions and removals to an item in place against mutable containers,
+        then freezes them into a single new Item, either by calling freeze()
+        or on leaving a 'with' block (after which the Item is available as 'result').
+
+        The Item the editor was created from is never modified.
+    """
+    def __init__(self, item: Item):
+        self.published_settings = item.get_published_settings()
+        self.labels = item.labels
+        self.descriptions = item.descriptions
+        self.aliases: Dict[I.LanguageCode, Set[str]] = {lang: set(aliases) for lang, aliases in item.aliases.items()}
+        self.statements = item.statements.edit()
+        self.sitelinks: Dict[str, I.SitelinkDict] = dict(item.sitelinks)
+        self.result: Optional[Item] = None
+
+    def add(self, arg: object) -> None:
+        """ Adds a statement, just as Item.__add__ would. """
+        if isinstance(arg, tfsl.statement.Statement):
+            self.statements.add(arg)
+        elif isinstance(arg, tfsl.monolingualtext.MonolingualText):
+            raise NotImplementedError("Adding MonolingualText to Item is ambiguous")
+        else:
+            raise NotImplementedError(f"Can't add {type(arg)} to Item")
+
+    def sub(self, arg: object) -> None:
+        """ Removes a statement, just as Item.__sub__ would. """
+        if isinstance(arg, tfsl.statement.Statement):
+            self.statements.sub(arg)
+        elif isinstance(arg, tfsl.monolingualtext.MonolingualText):
+            raise NotImplementedError("Subtracting MonolingualText from Item is ambiguous")
+        else:
+            raise NotImplementedError(f"Can't subtract {type(arg)} from Item")
+
+    def __iadd__(self, arg: object) -> 'ItemEditor':
+        self.add(arg)
+        return self
+
+    def __isub__(self, arg: object) -> 'ItemEditor':
+        self.sub(arg)
+        return self
+
+    def add_label(self, arg: tfsl.monolingualtext.MonolingualText) -> None:
+        """ (See Item.add_label for what this method does.) """
+        self.labels = self.labels + arg
+
+    def add_description(self, arg: tfsl.monolingualtext.MonolingualText) -> None:
+        """ (See Item.add_description for what this method does.) """
+        self.descriptions = self.descriptions + arg
+
+    def sub_label(self, arg: I.LanguageOrMT) -> None:
+        """ (See Item.sub_label for what this method does.) """
+        self.labels = self.labels - arg
+
+    def sub_description(self, arg: I.LanguageOrMT) -> None:
+        """ (See Item.sub_description for what this method does.) """
+        self.descriptions = self.descriptions - arg
+
+    def freeze(self) -> Item:
+        """ Returns a new Item with all changes made so far. """
+        item_out = Item(self.labels, self.descriptions,
+                    {lang: set(aliases) for lang, aliases in self.aliases.items()},
+                    self.statements.freeze(), dict(self.sitelinks))
+        item_out.set_published_settings(self.published_settings)
+        return item_out
+
+    def __enter__(self) -> 'ItemEditor':
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        if exc_type is None:
+            self.result = self.freeze()
+
 def build_item(item_in: I.ItemDict) -> Item:
     """ Builds an Item from the JSON dictionary describing it. """
     labels = tfsl.monolingualtextholder.build_text_list(item_in["labels"])
@@ -204,26 +292,31 @@ def Q(qid: Union[int, I.Qid]) -> Item: # pylint: disable=invalid-name
     item_json = retrieve_item_json(qid)
     return build_item(item_json)
 
-class Q_: # pylint: disable=invalid-name
+class Q_(tfsl.utils.MemoizedViews): # pylint: disable=invalid-name
     """ An Item, but labels/descriptions are not auto-converted to MonolingualTexts
         and statements are only assembled into Statements when accessed.
+        Anything assembled from the JSON is kept and returned again on later access
+        (see MemoizedViews for how to drop these if the JSON is changed in place).
     """
     def __init__(self, input_arg: I.Qid):
         self.item_json: I.ItemDict = retrieve_item_json(input_arg)
 
+    @tfsl.utils.memoized_view
     def get_label(self, lang: tfsl.languages.Language) -> tfsl.monolingualtext.MonolingualText:
         """ Assembles a MonolingualText containing the label with the given language code. """
         label_dict: I.LemmaDict = self.item_json["labels"][lang.code]
         return label_dict["value"] @ lang
 
+    @tfsl.utils.memoized_view
     def get_description(self, lang: tfsl.languages.Language) -> tfsl.monolingualtext.MonolingualText:
         """ Assembles a MonolingualText containing the description with the given language code. """
         description_dict: I.LemmaDict = self.item_json["descriptions"][lang.code]
         return description_dict["value"] @ lang
 
-    def get_stmts(self, prop: I.Pid) -> I.StatementList:
+    @tfsl.utils.memoized_view
+    def get_stmts(self, prop: I.Pid) -> PVector[tfsl.statement.Statement]:
         """ Assembles a list of Statements present on the item with the given property. """
-        return [tfsl.statement.build_statement(stmt) for stmt in self.item_json["claims"].get(prop,[])]
+        return PVector(tfsl.statement.build_statement(stmt) for stmt in self.item_json["claims"].get(prop,[]))
 
     def __getitem__(self, prop: I.Pid) -> I.StatementList:
         return self.get_stmts(prop)
@@ -0,0 +1,131 @@
+""" Holds the EditJournal class, which records edits on disk so that a bulk-editing job can be resumed after a crash. """
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from types import TracebackType
+from typing import Any, Dict, Optional, Type, TypedDict
+
+class JournalRecord(TypedDict):
+    """ :meta private: """
+    event: str
+    id: str
+    baserevid: Optional[int]
+    hash: str
+    revid: Optional[int]
+
+class EditJournal:
+    """ An append-only file of JSON lines recording, for each edit, when it is about to be sent ('planned')
+        and when the server accepted it ('completed'), along with the ID of the edited entity,
+        the revision the edit was based on, a hash of what was sent and the revision the edit created.
+
+        Each record is flushed to disk before the edit goes on, so a job restarted with the same journal
+        can skip the entities whose edits were completed without retrieving them again.
+        An edit planned but never completed may or may not have been made,
+        so its entity should be retrieved again and checked.
+
+        Journals may be passed to WikibaseSession.push and WikibaseSession.push_queue,
+        and may be used as context managers, closing the file on leaving the block.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.planned: Dict[str, JournalRecord] = {}
+        self.completed: Dict[str, JournalRecord] = {}
+        ends_in_newline = True
+        if os.path.exists(path):
+            ends_in_newline = self.load()
+        self.file = open(path, "a", encoding="utf-8") # pylint: disable=consider-using-with
+        if not ends_in_newline:
+            # end the line cut short by a crash, so that the next record starts on a line of its own
+            self.file.write("\n")
+            self.file.flush()
+
+    def load(self) -> bool:
+        """ :meta private: """
+        ends_in_newline = True
+        with open(self.path, encoding="utf-8") as fileptr:
+            for line in fileptr:
+                ends_in_newline = line.endswith("\n")
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # the last line may have been cut short by a crash
+                    logging.warning("Skipping unreadable line in edit journal %s", self.path)
+                    continue
+                if record["event"] == "completed":
+                    self.completed[record["id"]] = record
+                    self.planned.pop(record["id"], None)
+                else:
+                    self.planned[record["id"]] = record
+        return ends_in_newline
+
+    def is_completed(self, entity_id: str, payload_hash: Optional[str]=None) -> bool:
+        """ Checks whether an edit to the entity with the provided ID was completed,
+            which must also have had the provided payload hash if one is given.
+        """
+        record = self.completed.get(entity_id)
+        return record is not None and (payload_hash is None or record["hash"] == payload_hash)
+
+    def get_unfinished(self) -> Dict[str, JournalRecord]:
+        """ Returns the records of edits which were planned but not completed, by entity ID. """
+        return dict(self.planned)
+
+    def record_planned(self, requestjson: Dict[str, str]) -> None:
+        """ Records that the provided request (as built by WikibaseSession.build_push_request) is about to be sent. """
+        record = build_record("planned", requestjson)
+        with self.lock:
+            self.planned[record["id"]] = record
+            self.write(record)
+
+    def record_completed(self, requestjson: Dict[str, str], response: Any) -> None:
+        """ Records that the provided request was accepted with the provided response. """
+        record = build_record("completed", requestjson, get_response_revid(response))
+        with self.lock:
+            self.planned.pop(record["id"], None)
+            self.completed[record["id"]] = record
+            self.write(record)
+
+    def write(self, record: JournalRecord) -> None:
+        """ :meta private: """
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self) -> None:
+        """ Closes the journal file. """
+        self.file.close()
+
+    def __enter__(self) -> 'EditJournal':
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+def get_payload_hash(requestjson: Dict[str, str]) -> str:
+    """ Returns the hash recorded in an EditJournal for what the provided request sends. """
+    serialized = json.dumps([requestjson.get("data")], sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(serialized.encode('utf-8'), digest_size=16).hexdigest()
+
+def build_record(event: str, requestjson: Dict[str, str], revid: Optional[int]=None) -> JournalRecord:
+    """ :meta private: """
+    baserevid = requestjson.get("baserevid")
+    return {
+        "event": event,
+        "id": requestjson.get("id", ""),
+        "baserevid": int(baserevid) if baserevid is not None else None,
+        "hash": get_payload_hash(requestjson),
+        "revid": revid
+    }
+
+def get_response_revid(response: Any) -> Optional[int]:
+    """ Returns the ID of the revision created by an edit, as found in the server's response to it. """
+    for container in (response.get("entity", {}), response.get("pageinfo", {}), response):
+        if "lastrevid" in container:
+            return int(container["lastrevid"])
+    return None
@@ -1,10 +1,13 @@
 """ Holds the Lexeme class and a function to build one given a JSON representation of it. """
 
+from operator import attrgetter
 from textwrap import indent
-from typing import Collection, Optional, List, Protocol, Sequence, Union, overload
+from types import TracebackType
+from typing import Collection, Dict, Iterable, Optional, List, Protocol, Sequence, Type, Union, overload
 
 import tfsl.interfaces as I
 import tfsl.auth
+import tfsl.formindex
 import tfsl.itemvalue
 import tfsl.languages
 import tfsl.lexemeform
@@ -14,6 +17,7 @@ import tfsl.monolingualtextholder as MTH
 import tfsl.statement
 import tfsl.statementholder as STH
 import tfsl.utils
+from tfsl.persistent import PVector, pvector
 
 class LexemeLike(I.MTST, Protocol):
     """ Defines methods that may be expected when reading from an object representing a Wikibase lexeme,
@@ -63,6 +67,15 @@ class LexemeLike(I.MTST, Protocol):
 class Lexeme:
     """ Container for a Wikidata lexeme.
 
+        A lexeme built from retrieved JSON keeps that JSON as 'base_json' (as do lexemes derived from it),
+        so that WikibaseSession.push only needs to send what has changed since (see tfsl.delta).
+
+        Its forms and senses are kept in PVectors, which can't be added to or removed from in place
+        (use + and - or edit() for that), and which are shared with the lexemes derived from it by + and -.
+        The forms and senses themselves may be changed in place; those shared with another lexeme
+        are copied the first time they are handed out (through 'forms', 'senses' or the methods returning them),
+        so that changing them through one lexeme leaves the other alone.
+
         See the documentation of LexemeLike methods for general information about
         what certain methods do.
     """
@@ -71,8 +84,8 @@ class Lexeme:
                 lang_in: tfsl.languages.Language,
                 cat_in: I.Qid,
                 statements: Optional[Union[STH.StatementHolder, I.StatementHolderInput]]=None,
-                senses: Optional[I.LexemeSenseList]=None,
-                forms: Optional[I.LexemeFormList]=None):
+                senses: Optional[Sequence[tfsl.lexemesense.LexemeSense]]=None,
+                forms: Optional[Sequence[tfsl.lexemeform.LexemeForm]]=None):
         super().__init__()
         if isinstance(lemmata, MTH.MonolingualTextHolder):
             self.lemmata = lemmata
@@ -87,15 +100,12 @@ class Lexeme:
         self.language = lang_in
         self.category = cat_in
 
-        if senses is None:
-            self.senses = []
-        else:
-            self.senses = senses
-
-        if forms is None:
-            self.forms = []
-        else:
-            self.forms = forms
+        self._senses: PVector[tfsl.lexemesense.LexemeSense] = pvector(senses)
+        self._forms: PVector[tfsl.lexemeform.LexemeForm] = pvector(forms)
+        self._form_index: Optional[tfsl.formindex.FormIndex[tfsl.lexemeform.LexemeForm]] = None
+        # whether the forms (or senses) are shared with another lexeme, and so have to be copied before being handed out
+        self._forms_shared = False
+        self._senses_shared = False
 
         self.pageid: Optional[int] = None
         self.namespace: Optional[int] = None
@@ -104,6 +114,7 @@ class Lexeme:
         self.modified: Optional[str] = None
         self.type: Optional[str] = None
         self.id: Optional[I.Lid] = None # pylint: disable=invalid-name
+        self.base_json: Optional[I.LexemeDict] = None
 
     def get_published_settings(self) -> I.LexemePublishedSettings:
         """ Returns a dictionary containing those portions of the Lexeme JSON dictionary
@@ -139,29 +150,47 @@ class Lexeme:
             published_settings = self.get_published_settings()
             lexeme_out = Lexeme(self.lemmata, self.language, self.category,
                         self.statements + arg,
-                        self.senses, self.forms)
+                        self._senses, self._forms)
             lexeme_out.set_published_settings(published_settings)
+            lexeme_out.base_json = self.base_json
+            self.mark_shared()
+            lexeme_out.mark_shared()
             return lexeme_out
         elif isinstance(arg, tfsl.lexemesense.LexemeSense):
             published_settings = self.get_published_settings()
             lexeme_out = Lexeme(self.lemmata, self.language, self.category,
-                        self.statements, tfsl.utils.add_to_list(self.senses, arg),
-                        self.forms)
+                        self.statements.copy(), tfsl.utils.add_to_list(self._senses, arg),
+                        self._forms)
             lexeme_out.set_published_settings(published_settings)
+            lexeme_out.base_json = self.base_json
+            self.mark_shared()
+            lexeme_out.mark_shared()
             return lexeme_out
         elif isinstance(arg, tfsl.lexemeform.LexemeForm):
             published_settings = self.get_published_settings()
+            form_index = self.get_built_form_index()
+            if form_index is not None:
+                form_index = form_index.add(arg)
+                new_forms = form_index.forms
+            else:
+                new_forms = tfsl.utils.add_to_list(self._forms, arg)
             lexeme_out = Lexeme(self.lemmata, self.language, self.category,
-                        self.statements, self.senses,
-                        tfsl.utils.add_to_list(self.forms, arg))
+                        self.statements.copy(), self._senses, new_forms)
+            lexeme_out._form_index = form_index
             lexeme_out.set_published_settings(published_settings)
+            lexeme_out.base_json = self.base_json
+            self.mark_shared()
+            lexeme_out.mark_shared()
             return lexeme_out
         elif isinstance(arg, tfsl.monolingualtext.MonolingualText):
             published_settings = self.get_published_settings()
             lexeme_out = Lexeme(self.lemmata + arg,
-                        self.language, self.category, self.statements,
-                        self.senses, self.forms)
+                        self.language, self.category, self.statements.copy(),
+                        self._senses, self._forms)
             lexeme_out.set_published_settings(published_settings)
+            lexeme_out.base_json = self.base_json
+            self.mark_shared()
+            lexeme_out.mark_shared()
             return lexeme_out
         raise NotImplementedError(f"Can't add {type(arg)} to Lexeme")
 
@@ -170,49 +199,138 @@ class Lexeme:
             published_settings = self.get_published_settings()
             lexeme_out = Lexeme(self.lemmata, self.language, self.category,
                         self.statements - arg,
-                        self.senses, self.forms)
+                        self._senses, self._forms)
             lexeme_out.set_published_settings(published_settings)
+            lexeme_out.base_json = self.base_json
+            self.mark_shared()
+            lexeme_out.mark_shared()
             return lexeme_out
         elif isinstance(arg, tfsl.lexemesense.LexemeSense):
             published_settings = self.get_published_settings()
             lexeme_out = Lexeme(self.lemmata, self.language, self.category,
-                        self.statements,
-                        tfsl.utils.sub_from_list(self.senses, arg),
-                        self.forms)
+                        self.statements.copy(),
+                        tfsl.utils.sub_from_list(self._senses, arg),
+                        self._forms)
             lexeme_out.set_published_settings(published_settings)
+            lexeme_out.base_json = self.base_json
+            self.mark_shared()
+            lexeme_out.mark_shared()
             return lexeme_out
         elif isinstance(arg, tfsl.lexemeform.LexemeForm):
             published_settings = self.get_published_settings()
+            form_index = self.get_built_form_index()
+            if form_index is not None:
+                form_index = form_index.remove(arg)
+                new_forms = form_index.forms
+            else:
+                new_forms = tfsl.utils.sub_from_list(self._forms, arg)
             lexeme_out = Lexeme(self.lemmata, self.language, self.category,
-                        self.statements, self.senses,
-                        tfsl.utils.sub_from_list(self.forms, arg))
+                        self.statements.copy(), self._senses, new_forms)
+            lexeme_out._form_index = form_index
             lexeme_out.set_published_settings(published_settings)
+            lexeme_out.base_json = self.base_json
+            self.mark_shared()
+            lexeme_out.mark_shared()
             return lexeme_out
         elif isinstance(arg, tfsl.monolingualtext.MonolingualText):
             published_settings = self.get_published_settings()
             lexeme_out = Lexeme(self.lemmata - arg,
-                        self.language, self.category, self.statements,
-                        self.senses, self.forms)
+                        self.language, self.category, self.statements.copy(),
+                        self._senses, self._forms)
             lexeme_out.set_published_settings(published_settings)
+            lexeme_out.base_json = self.base_json
+            self.mark_shared()
+            lexeme_out.mark_shared()
             return lexeme_out
         raise NotImplementedError(f"Can't subtract {type(arg)} from Lexeme")
 
-    def get_forms(self, inflections: Optional[Collection[I.Qid]]=None, exclusions: Optional[Collection[I.Qid]]=None) -> I.LexemeFormList:
+    def edit(self) -> 'LexemeEditor':
+        """ Returns a LexemeEditor for making many changes to this lexeme at once:
+
+            with lexeme.edit() as editor:
+                editor += form
+                editor -= statement
+            lexeme = editor.result
+        """
+        return LexemeEditor(self)
+
+    @property
+    def forms(self) -> PVector[tfsl.lexemeform.LexemeForm]:
+        """ Returns the lexeme's forms, which may be changed in place (but not added to or removed from). """
+        if self._forms_shared:
+            form_index = self.get_built_form_index()
+            if form_index is not None:
+                self._form_index = form_index.refresh().map_forms(tfsl.lexemeform.LexemeForm.copy)
+                self._forms = self._form_index.forms
+            else:
+                self._forms = PVector(form.copy() for form in self._forms)
+            self._forms_shared = False
+        return self._forms
+
+    @forms.setter
+    def forms(self, forms: Iterable[tfsl.lexemeform.LexemeForm]) -> None:
+        self._forms = pvector(forms)
+        self._forms_shared = False
+
+    @property
+    def senses(self) -> PVector[tfsl.lexemesense.LexemeSense]:
+        """ Returns the lexeme's senses, which may be changed in place (but not added to or removed from). """
+        if self._senses_shared:
+            self._senses = PVector(sense.copy() for sense in self._senses)
+            self._senses_shared = False
+        return self._senses
+
+    @senses.setter
+    def senses(self, senses: Iterable[tfsl.lexemesense.LexemeSense]) -> None:
+        self._senses = pvector(senses)
+        self._senses_shared = False
+
+    def view_forms(self) -> PVector[tfsl.lexemeform.LexemeForm]:
+        """ Returns the lexeme's forms without copying any shared with another lexeme, so these should only be read. """
+        return self._forms
+
+    def view_senses(self) -> PVector[tfsl.lexemesense.LexemeSense]:
+        """ Returns the lexeme's senses without copying any shared with another lexeme, so these should only be read. """
+        return self._senses
+
+    def mark_shared(self, forms: bool=True, senses: bool=True) -> None:
+        """ :meta private: """
+        self._forms_shared = self._forms_shared or forms
+        self._senses_shared = self._senses_shared or senses
+
+    def get_built_form_index(self) -> Optional[tfsl.formindex.FormIndex[tfsl.lexemeform.LexemeForm]]:
+        """ :meta private: """
+        if self._form_index is not None and self._form_index.forms is self._forms:
+            return self._form_index
+        return None
+
+    @property
+    def form_index(self) -> tfsl.formindex.FormIndex[tfsl.lexemeform.LexemeForm]:
+        """ Returns an index of the lexeme's forms by ID and by grammatical feature.
+            It is built on first use, carried over to lexemes derived by adding or removing forms
+            (and to the copies of their forms, once these are made), and rebuilt if the 'forms' attribute is reassigned.
+            Forms whose IDs or features were changed in place are indexed again on the next use.
+        """
+        forms = self.forms
+        form_index = self.get_built_form_index()
+        if form_index is None:
+            form_index = tfsl.formindex.FormIndex(attrgetter('id'), attrgetter('features'), forms)
+        else:
+            form_index = form_index.refresh()
+        self._form_index = form_index
+        return form_index
+
+    def get_forms(self, inflections: Optional[Collection[I.Qid]]=None, exclusions: Optional[Collection[I.Qid]]=None) -> Sequence[tfsl.lexemeform.LexemeForm]:
         """ (See LexemeLike.get_forms for what this method does.)
             The forms here are returned as LexemeForm objects.
         """
         if inflections is None:
             return self.forms
-        initial_form_list = [form for form in self.forms
-                if all(i in form.features for i in inflections)]
-        if exclusions is None:
-            return initial_form_list
-        return [form for form in initial_form_list
-                if all(i not in form.features for i in exclusions)]
-
-    def get_senses(self) -> I.LexemeSenseList:
+        return self.form_index.query(inflections, exclusions)
+
+    def get_senses(self) -> Sequence[tfsl.lexemesense.LexemeSense]:
         """ (See LexemeLike.get_senses for what this method does.)
-            The senses here are returned as LS_ objects.
+            The senses here are returned as LexemeSense objects.
         """
         return self.senses
 
@@ -252,10 +370,7 @@ class Lexeme:
 
     def getitem_fid(self, key: I.LFid) -> tfsl.lexemeform.LexemeForm:
         """ :meta private: """
-        for form in self.forms:
-            if form.id == key:
-                return form
-        raise KeyError
+        return self.form_index.get(key)
 
     def getitem_sid(self, key: I.LSid) -> tfsl.lexemesense.LexemeSense:
         """ :meta private: """
@@ -292,18 +407,18 @@ class Lexeme:
         stmts_str = str(self.statements)
 
         senses_str = ""
-        if len(self.senses) != 0:
+        if len(self._senses) != 0:
             prefix = "{\n"
             suffix = "\n}"
-            sense_strings = [str(sense) for sense in self.senses]
+            sense_strings = [str(sense) for sense in self._senses]
             base_str_sense = indent('\n'.join(sense_strings), tfsl.utils.DEFAULT_INDENT)
             senses_str = prefix + base_str_sense + suffix
 
         forms_str = ""
-        if len(self.forms) != 0:
+        if len(self._forms) != 0:
             prefix = "(\n"
             suffix = "\n)"
-            form_strings = [str(form) for form in self.forms]
+            form_strings = [str(form) for form in self._forms]
             base_str_form = indent('\n'.join(form_strings), tfsl.utils.DEFAULT_INDENT)
             forms_str = prefix + base_str_form + suffix
 
@@ -321,9 +436,13 @@ class Lexeme:
 
         statement_dict: I.StatementDictSet = self.statements.__jsonout__()
 
-        form_list: List[I.LexemeFormDict] = [form.__jsonout__() for form in self.forms]
+        form_list: List[I.LexemeFormDict] = [form.__jsonout__() for form in self._forms]
+
+        sense_list: List[I.LexemeSenseDict] = [sense.__jsonout__() for sense in self._senses]
 
-        sense_list: List[I.LexemeSenseDict] = [sense.__jsonout__() for sense in self.senses]
+        parts = (self.category, self.language, self.id, self.lastrevid, lemma_dict, statement_dict, *form_list, *sense_list)
+        if (fragment := tfsl.utils.get_cached_fragment(self, parts)) is not None:
+            return fragment
 
         base_dict: I.LexemeDict = {
             "lexicalCategory": self.category,
@@ -339,23 +458,115 @@ class Lexeme:
             base_dict["id"] = self.id
             base_dict["lastrevid"] = self.lastrevid
 
-        return base_dict
+        return tfsl.utils.set_cached_fragment(self, parts, base_dict)
 
+class LexemeEditor:
+    """ Applies additions and removals to a lexeme in place against mutable containers,
+        then freezes them into a single new Lexeme, either by calling freeze()
+        or on leaving a 'with' block (after which the Lexeme is available as 'result').
 
-def build_lexeme(lexeme_in: I.LexemeDict) -> Lexeme:
-    """ Builds a Lexeme from the JSON dictionary describing it. """
+        The Lexeme the editor was created from is never modified.
+        The forms and senses in the editor's lists are shared with it, so they should be replaced rather than changed in place.
+    """
+    def __init__(self, lexeme: Lexeme):
+        self.published_settings = lexeme.get_published_settings()
+        self.base_json = lexeme.base_json
+        self.lemmata = lexeme.lemmata
+        self.language = lexeme.language
+        self.category = lexeme.category
+        self.statements = lexeme.statements.edit()
+        self.original_senses = lexeme.view_senses()
+        self.original_forms = lexeme.view_forms()
+        self.senses: List[tfsl.lexemesense.LexemeSense] = list(self.original_senses)
+        self.forms: List[tfsl.lexemeform.LexemeForm] = list(self.original_forms)
+        lexeme.mark_shared()
+        self.result: Optional[Lexeme] = None
+
+    def add(self, arg: object) -> None:
+        """ Adds a statement, sense, form or lemma, just as Lexeme.__add__ would. """
+        if isinstance(arg, tfsl.statement.Statement):
+            self.statements.add(arg)
+        elif isinstance(arg, tfsl.lexemesense.LexemeSense):
+            self.senses.append(arg)
+        elif isinstance(arg, tfsl.lexemeform.LexemeForm):
+            self.forms.append(arg)
+        elif isinstance(arg, tfsl.monolingualtext.MonolingualText):
+            self.lemmata = self.lemmata + arg
+        else:
+            raise NotImplementedError(f"Can't add {type(arg)} to Lexeme")
+
+    def sub(self, arg: object) -> None:
+        """ Removes a statement, sense, form or lemma, just as Lexeme.__sub__ would. """
+        if isinstance(arg, tfsl.statement.Statement):
+            self.statements.sub(arg)
+        elif isinstance(arg, tfsl.lexemesense.LexemeSense):
+            self.senses = [sense for sense in self.senses if sense != arg]
+        elif isinstance(arg, tfsl.lexemeform.LexemeForm):
+            self.forms = [form for form in self.forms if form != arg]
+        elif isinstance(arg, tfsl.monolingualtext.MonolingualText):
+            self.lemmata = self.lemmata - arg
+        else:
+            raise NotImplementedError(f"Can't subtract {type(arg)} from Lexeme")
+
+    def __iadd__(self, arg: object) -> 'LexemeEditor':
+        self.add(arg)
+        return self
+
+    def __isub__(self, arg: object) -> 'LexemeEditor':
+        self.sub(arg)
+        return self
+
+    def freeze(self) -> Lexeme:
+        """ Returns a new Lexeme with all changes made so far. """
+        lexeme_out = Lexeme(self.lemmata, self.language, self.category,
+                    self.statements.freeze(), self.senses, self.forms)
+        lexeme_out.set_published_settings(self.published_settings)
+        lexeme_out.base_json = self.base_json
+        # forms and senses only added through the editor are not shared with the original lexeme
+        lexeme_out.mark_shared(forms=shares_any(self.forms, self.original_forms),
+                               senses=shares_any(self.senses, self.original_senses))
+        return lexeme_out
+
+    def __enter__(self) -> 'LexemeEditor':
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        if exc_type is None:
+            self.result = self.freeze()
+
+def shares_any(components: Iterable[object], original_components: Iterable[object]) -> bool:
+    """ Checks whether any of the provided components is one of the original components. """
+    original_ids = {id(component) for component in original_components}
+    return any(id(component) in original_ids for component in components)
+
+def build_lexeme(lexeme_in: I.LexemeDict, lazy: bool=False) -> Lexeme:
+    """ Builds a Lexeme from the JSON dictionary describing it.
+
+        If lazy is set, statements (on the lexeme and on each form and sense) are only built
+        once the statements with a given property are first needed, and the statements, forms and senses
+        which are never changed are output as their original JSON, so that loading and editing a lexeme
+        costs little more than the parts of it which are actually used.
+    """
     lemmas = MTH.build_text_list(lexeme_in["lemmas"])
 
     lexemecat = lexeme_in["lexicalCategory"]
     language = tfsl.languages.get_first_lang(lexeme_in["language"])
 
-    statements = STH.build_statement_list(lexeme_in["claims"])
+    statements: Union[STH.StatementHolder, I.StatementSet]
+    if lazy:
+        statements = STH.StatementHolder.from_json(lexeme_in["claims"])
+    else:
+        statements = STH.build_statement_list(lexeme_in["claims"])
 
-    forms = [tfsl.lexemeform.build_form(form) for form in lexeme_in["forms"]]
-    senses = [tfsl.lexemesense.build_sense(sense) for sense in lexeme_in["senses"]]
+    forms = [tfsl.lexemeform.build_form(form, lazy) for form in lexeme_in["forms"]]
+    senses = [tfsl.lexemesense.build_sense(sense, lazy) for sense in lexeme_in["senses"]]
 
     lexeme_out = Lexeme(lemmas, language, lexemecat, statements, senses, forms)
     lexeme_out.set_published_settings(lexeme_in)
+    lexeme_out.base_json = lexeme_in
     return lexeme_out
 
 def get_Lid(value_in: Union[I.PossibleLexemeReference, tfsl.itemvalue.ItemValue]) -> I.Lid: # pylint: disable=invalid-name
@@ -381,23 +592,46 @@ def retrieve_lexeme_json(lid_in: Union[I.PossibleLexemeReference, tfsl.itemvalue
         return lexeme_dict
     raise ValueError(f'Returned JSON for {lid_in} is not a lexeme')
 
-def L(lid_in: Union[int, I.Lid, I.LFid, I.LSid, tfsl.itemvalue.ItemValue]) -> Lexeme: # pylint: disable=invalid-name
-    """ Retrieves and returns the lexeme with the provided Lid. """
+def L(lid_in: Union[int, I.Lid, I.LFid, I.LSid, tfsl.itemvalue.ItemValue], lazy: bool=False) -> Lexeme: # pylint: disable=invalid-name
+    """ Retrieves and returns the lexeme with the provided Lid.
+        (See build_lexeme for what setting lazy does.)
+    """
     lexeme_json = retrieve_lexeme_json(lid_in)
-    return build_lexeme(lexeme_json)
+    return build_lexeme(lexeme_json, lazy)
 
-class L_: # pylint: disable=invalid-name
+class L_(tfsl.utils.MemoizedViews): # pylint: disable=invalid-name
     """ A Lexeme, but lemmata/form representations are not auto-converted to MonolingualTexts,
         statements are only assembled into Statements when accessed,
         and forms and senses are returned as LF_ and LS_ objects instead of LexemeForms and LexemeSenses.
+        Anything assembled from the JSON is kept and returned again on later access
+        (see MemoizedViews for how to drop these if the JSON is changed in place).
 
         See the documentation of LexemeLike methods for general information about
         what certain methods do.
     """
     def __init__(self, input_arg: Union[int, I.Lid, I.LFid, I.LSid, tfsl.itemvalue.ItemValue]):
-        self.lexeme_json: I.LexemeDict = retrieve_lexeme_json(input_arg)
+        self.set_json(retrieve_lexeme_json(input_arg))
+
+    @classmethod
+    def from_json(cls, lexeme_json: I.LexemeDict) -> 'L_':
+        """ Returns an L_ wrapping the provided lexeme JSON, without retrieving anything. """
+        lexeme_out = cls.__new__(cls)
+        lexeme_out.set_json(lexeme_json)
+        return lexeme_out
+
+    def set_json(self, lexeme_json: I.LexemeDict) -> None:
+        """ Replaces the JSON wrapped by this object, dropping anything assembled from the old JSON. """
+        self.lexeme_json: I.LexemeDict = lexeme_json
+        self.clear_views()
+
+    @property
+    @tfsl.utils.memoized_view
+    def form_index(self) -> tfsl.formindex.FormIndex[tfsl.lexemeform.LF_]:
+        """ Returns an index of the lexeme's forms by ID and by grammatical feature. """
+        return tfsl.formindex.FormIndex(attrgetter('id'), attrgetter('features'), self.get_all_forms())
 
     @property
+    @tfsl.utils.memoized_view
     def lemmata(self) -> MTH.MonolingualTextHolder:
         """ (See LexemeLike.lemmata for what this method does.) """
         return MTH.MonolingualTextHolder(MTH.build_text_list(self.lexeme_json["lemmas"]))
@@ -424,28 +658,43 @@ class L_: # pylint: disable=invalid-name
         """ :meta private: """
         return " / ".join(f"{x['value']}@{x['language']}" for _, x in self.lexeme_json["lemmas"].items()) + ": " + self.lexeme_json['id'] + f" ({self.lexeme_json['language']})"
 
-    def get_stmts(self, prop: I.Pid) -> I.StatementList:
+    @tfsl.utils.memoized_view
+    def get_stmts(self, prop: I.Pid) -> PVector[tfsl.statement.Statement]:
         """ Assembles a list of Statements present on the item with the given property. """
-        return [tfsl.statement.build_statement(stmt) for stmt in self.lexeme_json["claims"].get(prop,[])]
+        return PVector(tfsl.statement.build_statement(stmt) for stmt in self.lexeme_json["claims"].get(prop,[]))
 
-    def get_forms(self, inflections: Optional[Collection[I.Qid]]=None, exclusions: Optional[Collection[I.Qid]]=None) -> List[tfsl.lexemeform.LF_]:
+    @tfsl.utils.memoized_view
+    def get_all_forms(self) -> PVector[tfsl.lexemeform.LF_]:
+        """ :meta private: """
+        return PVector(tfsl.lexemeform.LF_(form) for form in self.lexeme_json["forms"])
+
+    def get_forms(self, inflections: Optional[Collection[I.Qid]]=None, exclusions: Optional[Collection[I.Qid]]=None) -> Sequence[tfsl.lexemeform.LF_]:
         """ (See LexemeLike.get_forms for what this method does.)
             The forms here are returned as LF_ objects.
         """
         if inflections is None:
-            return [tfsl.lexemeform.LF_(form) for form in self.lexeme_json["forms"]]
-        initial_form_list = [tfsl.lexemeform.LF_(form) for form in self.lexeme_json["forms"]
-                if all(i in form["grammaticalFeatures"] for i in inflections)]
-        if exclusions is None:
-            return initial_form_list
-        return [form for form in initial_form_list
-                if all(i not in form.features for i in exclusions)]
-
-    def get_senses(self) -> List[tfsl.lexemesense.LS_]:
+            return self.get_all_forms()
+        return self.form_index.query(inflections, exclusions)
+
+    @tfsl.utils.memoized_view
+    def get_senses(self) -> PVector[tfsl.lexemesense.LS_]:
         """ (See LexemeLike.get_senses for what this method does.)
             The senses here are returned as LS_ objects.
         """
-        return [tfsl.lexemesense.LS_(sense) for sense in self.lexeme_json["senses"]]
+        return PVector(tfsl.lexemesense.LS_(sense) for sense in self.lexeme_json["senses"])
+
+    @tfsl.utils.memoized_view
+    def get_senses_by_id(self) -> Dict[I.LSid, tfsl.lexemesense.LS_]:
+        """ :meta private: """
+        senses_by_id: Dict[I.LSid, tfsl.lexemesense.LS_] = {}
+        for sense in self.get_senses():
+            senses_by_id.setdefault(sense.json["id"], sense)
+        return senses_by_id
+
+    @tfsl.utils.memoized_view
+    def get_lemma(self, lang_code: I.LanguageCode) -> tfsl.monolingualtext.MonolingualText:
+        """ :meta private: """
+        return tfsl.monolingualtext.build_lemma(self.lexeme_json["lemmas"][lang_code])
 
     def get_language(self) -> tfsl.languages.Language:
         """ Returns the language of the lexeme. """
@@ -474,11 +723,9 @@ class L_: # pylint: disable=invalid-name
 
     def __getitem__(self, key: object) -> Union[I.StatementList, tfsl.lexemeform.LF_, tfsl.lexemesense.LS_, tfsl.monolingualtext.MonolingualText]:
         if isinstance(key, tfsl.languages.Language):
-            return MTH.get_lang_from_mtlist(self.lexeme_json["lemmas"], key)
+            return self.get_lemma(key.code)
         elif isinstance(key, tfsl.monolingualtext.MonolingualText):
-            lang = key.language
-            lang_code = lang.code
-            return tfsl.monolingualtext.build_lemma(self.lexeme_json["lemmas"][lang_code])
+            return self.get_lemma(key.language.code)
         elif isinstance(key, str):
             return self.getitem_str(key)
         elif isinstance(key, tfsl.itemvalue.ItemValue):
@@ -491,17 +738,11 @@ class L_: # pylint: disable=invalid-name
 
     def getitem_fid(self, key: I.LFid) -> tfsl.lexemeform.LF_:
         """ :meta private: """
-        for form in self.lexeme_json["forms"]:
-            if form["id"] == key:
-                return tfsl.lexemeform.LF_(form)
-        raise KeyError
+        return self.form_index.get(key)
 
     def getitem_sid(self, key: I.LSid) -> tfsl.lexemesense.LS_:
         """ :meta private: """
-        for sense in self.lexeme_json["senses"]:
-            if sense["id"] == key:
-                return tfsl.lexemesense.LS_(sense)
-        raise KeyError
+        return self.get_senses_by_id()[key]
 
     def getitem_str(self, key: str) -> Union[I.StatementList, tfsl.lexemeform.LF_, tfsl.lexemesense.LS_]:
         """ :meta private: """
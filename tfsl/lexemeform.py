@@ -1,8 +1,10 @@
 """ Holds the LexemeForm class and a function to build one given a JSON representation of it. """
 
+import weakref
 from functools import singledispatchmethod
-from typing import Collection, List, Optional, Protocol, Set, Union, overload
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Protocol, Set, Tuple, Union, overload
 
+import tfsl.formindex
 import tfsl.interfaces as I
 import tfsl.languages
 import tfsl.monolingualtext
@@ -10,6 +12,7 @@ import tfsl.monolingualtextholder as MTH
 import tfsl.statement
 import tfsl.statementholder as STH
 import tfsl.utils
+from tfsl.persistent import PVector
 
 class LexemeFormLike(I.MTST, Protocol):
     """ Defines methods that may be expected when reading from an object representing a Wikibase lexeme form,
@@ -25,6 +28,69 @@ class LexemeFormLike(I.MTST, Protocol):
     def id(self) -> Optional[str]: # pylint: disable=invalid-name
         """ Returns the form's LFid. """
 
+class FeatureSet(Set[I.Qid]):
+    """ The set of grammatical features of a LexemeForm, which tells the form whenever it is changed in place. """
+    def __init__(self, features: Iterable[I.Qid], on_change: Callable[[], None]):
+        super().__init__(features)
+        self.on_change = on_change
+
+    def add(self, element: I.Qid) -> None:
+        super().add(element)
+        self.on_change()
+
+    def discard(self, element: I.Qid) -> None:
+        super().discard(element)
+        self.on_change()
+
+    def remove(self, element: I.Qid) -> None:
+        super().remove(element)
+        self.on_change()
+
+    def pop(self) -> I.Qid:
+        element = super().pop()
+        self.on_change()
+        return element
+
+    def clear(self) -> None:
+        super().clear()
+        self.on_change()
+
+    def update(self, *others: Iterable[Any]) -> None:
+        super().update(*others)
+        self.on_change()
+
+    def difference_update(self, *others: Iterable[Any]) -> None:
+        super().difference_update(*others)
+        self.on_change()
+
+    def intersection_update(self, *others: Iterable[Any]) -> None:
+        super().intersection_update(*others)
+        self.on_change()
+
+    def symmetric_difference_update(self, other: Iterable[I.Qid]) -> None:
+        super().symmetric_difference_update(other)
+        self.on_change()
+
+    def __ior__(self, other: Any) -> 'FeatureSet':
+        super().__ior__(other)
+        self.on_change()
+        return self
+
+    def __iand__(self, other: Any) -> 'FeatureSet':
+        super().__iand__(other)
+        self.on_change()
+        return self
+
+    def __isub__(self, other: Any) -> 'FeatureSet':
+        super().__isub__(other)
+        self.on_change()
+        return self
+
+    def __ixor__(self, other: Any) -> 'FeatureSet':
+        super().__ixor__(other)
+        self.on_change()
+        return self
+
 class LexemeForm:
     """ Container for a Wikidata lexeme form.
 
@@ -50,13 +116,73 @@ class LexemeForm:
         else:
             self.statements = STH.StatementHolder(statements)
 
-        self.features: Set[I.Qid]
-        if features is None:
-            self.features = set()
-        else:
-            self.features = set(features)
+        # the change logs of the FormIndexes this form is in, with its serial number in each
+        self.watchers: List[Tuple['weakref.ref[tfsl.formindex.ChangeLog]', int]] = []
+
+        self._features = FeatureSet(features or (), self.report_change)
+        self._id: Optional[str] = None
+
+        # the JSON this form was built from, with the parts built from it, if built by build_form(lazy=True)
+        self.source: Optional[Tuple[I.LexemeFormDict, MTH.MonolingualTextHolder, STH.StatementHolder]] = None
+
+    @property
+    def features(self) -> Set[I.Qid]:
+        """ Returns the form's grammatical features, which may be changed in place. """
+        return self._features
+
+    @features.setter
+    def features(self, features: Iterable[I.Qid]) -> None:
+        self._features = FeatureSet(features, self.report_change)
+        self.report_change()
+
+    @property
+    def id(self) -> Optional[str]: # pylint: disable=invalid-name
+        """ Returns the form's LFid. """
+        return self._id
+
+    @id.setter
+    def id(self, form_id: Optional[str]) -> None: # pylint: disable=invalid-name
+        self._id = form_id
+        self.report_change()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the FormIndexes watching this form are not copied along with it
+        return dict(self.__dict__, watchers=[], _features=set(self._features))
 
-        self.id: Optional[str] = None # pylint: disable=invalid-name
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._features = FeatureSet(state['_features'], self.report_change)
+
+    def watch(self, change_log: tfsl.formindex.ChangeLog, serial: int) -> None:
+        """ :meta private: """
+        self.watchers = [(log_ref, log_serial) for log_ref, log_serial in self.watchers if log_ref() is not None]
+        self.watchers.append((weakref.ref(change_log), serial))
+
+    def report_change(self) -> None:
+        """ :meta private: """
+        for log_ref, serial in self.watchers:
+            change_log = log_ref()
+            if change_log is not None:
+                change_log.mark(serial)
+
+    def copy(self) -> 'LexemeForm':
+        """ Returns a copy of this form with features of its own,
+            whose statements are copied as they are handed out (see StatementHolder.copy).
+        """
+        form_out = LexemeForm(self.representations, self.features, self.statements.copy())
+        form_out.set_published_settings(self.get_published_settings())
+        if self.source is not None and self.source[2] is self.statements:
+            form_out.source = (self.source[0], self.source[1], form_out.statements)
+        tfsl.utils.copy_cached_fragments(self, form_out)
+        return form_out
+
+    def is_unchanged_from_source(self) -> bool:
+        """ Checks whether this form still matches the JSON it was built from by build_form(lazy=True). """
+        if self.source is None:
+            return False
+        form_in, representations, statements = self.source
+        parts_unchanged = self.representations is representations and self.statements is statements and statements.is_unbuilt()
+        return parts_unchanged and self.id == form_in["id"] and self.features == set(form_in["grammaticalFeatures"])
 
     def get_published_settings(self) -> I.LexemeFormPublishedSettings:
         """ Returns a dictionary containing those portions of the LexemeForm JSON dictionary
@@ -100,13 +226,13 @@ class LexemeForm:
     def __add__(self, arg: object) -> 'LexemeForm':
         if isinstance(arg, tfsl.monolingualtext.MonolingualText):
             published_settings = self.get_published_settings()
-            form_out = LexemeForm(self.representations + arg, self.features, self.statements)
+            form_out = LexemeForm(self.representations + arg, self.features, self.statements.copy())
             form_out.set_published_settings(published_settings)
             return form_out
         elif isinstance(arg, str):
             published_settings = self.get_published_settings()
             if I.is_Qid(arg):
-                form_out = LexemeForm(self.representations, self.features | set([arg]), self.statements)
+                form_out = LexemeForm(self.representations, self.features | set([arg]), self.statements.copy())
             form_out.set_published_settings(published_settings)
             return form_out
         elif isinstance(arg, tfsl.statement.Statement):
@@ -119,13 +245,13 @@ class LexemeForm:
     def __sub__(self, arg: object) -> 'LexemeForm':
         if isinstance(arg, tfsl.languages.Language) or isinstance(arg, tfsl.monolingualtext.MonolingualText):
             published_settings = self.get_published_settings()
-            form_out = LexemeForm(self.representations - arg, self.features, self.statements)
+            form_out = LexemeForm(self.representations - arg, self.features, self.statements.copy())
             form_out.set_published_settings(published_settings)
             return form_out
         elif isinstance(arg, str):
             published_settings = self.get_published_settings()
             if I.is_Qid(arg):
-                form_out = LexemeForm(self.representations, self.features - set([arg]), self.statements)
+                form_out = LexemeForm(self.representations, self.features - set([arg]), self.statements.copy())
             elif I.is_Pid(arg):
                 form_out = LexemeForm(self.representations, self.features, self.statements - arg)
             form_out.set_published_settings(published_settings)
@@ -166,10 +292,25 @@ class LexemeForm:
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, LexemeForm):
             return NotImplemented
-        representations_equal = self.representations == rhs.representations
-        features_equal = self.features == rhs.features
-        statements_equal = self.statements == rhs.statements
-        return representations_equal and features_equal and statements_equal
+        if self.features != rhs.features or self.representations.fingerprint != rhs.representations.fingerprint:
+            return False
+        return self.statements.has_same_statements(rhs.statements)
+
+    # equality depends on content which may be changed in place
+    __hash__ = None # type: ignore[assignment]
+
+    @property
+    def fingerprint(self) -> str:
+        """ Returns a digest of the form's representations, grammatical features and statements (but not its ID),
+            computed from the fingerprints of those parts and kept until one of them changes.
+        """
+        features = sorted(self.features)
+        parts = (self.representations, self.statements.fingerprint)
+        cached = tfsl.utils.get_cached_fragment(self, parts, '_fingerprint')
+        if cached is not None and cached[0] == features:
+            return cached[1]
+        fingerprint = tfsl.utils.make_fingerprint("form", self.representations.fingerprint, features, self.statements.fingerprint)
+        return tfsl.utils.set_cached_fragment(self, parts, (features, fingerprint), '_fingerprint')[1]
 
     def __str__(self) -> str:
         base_str = str(self.representations)
@@ -178,33 +319,53 @@ class LexemeForm:
         return "\n".join([base_str + feat_str, stmt_str])
 
     def __jsonout__(self) -> I.LexemeFormDict:
+        if self.source is not None and self.is_unchanged_from_source():
+            return self.source[0]
         reps_dict = self.representations.__jsonout__()
-        base_dict: I.LexemeFormDict = {"representations": reps_dict, "grammaticalFeatures": list(self.features)}
+        statement_dict = self.statements.__jsonout__()
+        features = list(self.features)
+        parts = (self.id, reps_dict, statement_dict)
+        fragment = tfsl.utils.get_cached_fragment(self, parts)
+        if fragment is not None and fragment["grammaticalFeatures"] == features:
+            return fragment
+
+        base_dict: I.LexemeFormDict = {"representations": reps_dict, "grammaticalFeatures": features}
 
         if self.id is not None:
             base_dict["id"] = self.id
         else:
             base_dict["add"] = ""
 
-        if (statement_dict := self.statements.__jsonout__()) is not None:
+        if statement_dict is not None:
             base_dict["claims"] = statement_dict
 
-        return base_dict
+        return tfsl.utils.set_cached_fragment(self, parts, base_dict)
 
-def build_form(form_in: I.LexemeFormDict) -> LexemeForm:
-    """ Builds a LexemeForm from the JSON dictionary describing it. """
-    reps = MTH.build_text_list(form_in["representations"])
+def build_form(form_in: I.LexemeFormDict, lazy: bool=False) -> LexemeForm:
+    """ Builds a LexemeForm from the JSON dictionary describing it.
+        If lazy is set, the statements of each property are only built when first needed,
+        and the form is output as the original JSON for as long as it is unchanged
+        and none of its statements have been built.
+    """
+    reps = MTH.MonolingualTextHolder(MTH.build_text_list(form_in["representations"]))
     feats = form_in["grammaticalFeatures"]
-    claims = STH.build_statement_list(form_in["claims"])
+    if lazy:
+        claims = STH.StatementHolder.from_json(form_in["claims"])
+    else:
+        claims = STH.StatementHolder(STH.build_statement_list(form_in["claims"]))
 
     form_out = LexemeForm(reps, feats, claims)
     form_out.set_published_settings(form_in)
+    if lazy:
+        form_out.source = (form_in, reps, claims)
 
     return form_out
 
-class LF_: # pylint: disable=invalid-name
+class LF_(tfsl.utils.MemoizedViews): # pylint: disable=invalid-name
     """ A LexemeForm, but form representations are not auto-converted to MonolingualTexts
         and statements are only assembled into Statements when accessed.
+        Anything assembled from the JSON is kept and returned again on later access
+        (see MemoizedViews for how to drop these if the JSON is changed in place).
 
         See the documentation of LexemeLike methods for general information about
         what certain methods do.
@@ -222,10 +383,16 @@ class LF_: # pylint: disable=invalid-name
         return self.json["grammaticalFeatures"]
 
     @property
+    @tfsl.utils.memoized_view
     def representations(self) -> MTH.MonolingualTextHolder:
         """ (See LexemeFormLike.representations for what this method does.) """
         return MTH.MonolingualTextHolder(MTH.build_text_list(self.json["representations"]))
 
+    @tfsl.utils.memoized_view
+    def get_representation(self, lang_code: I.LanguageCode) -> tfsl.monolingualtext.MonolingualText:
+        """ :meta private: """
+        return tfsl.monolingualtext.build_lemma(self.json["representations"][lang_code])
+
     @property
     def id(self) -> str:
         """ (See LexemeFormLike.id for what this method does.) """
@@ -249,11 +416,9 @@ class LF_: # pylint: disable=invalid-name
         elif isinstance(arg, tfsl.itemvalue.ItemValue):
             return self.getitem_str(arg.id)
         elif isinstance(arg, tfsl.languages.Language):
-            return MTH.get_lang_from_mtlist(self.json["representations"], arg)
+            return self.get_representation(arg.code)
         elif isinstance(arg, tfsl.monolingualtext.MonolingualText):
-            lang = arg.language
-            lang_code = lang.code
-            return tfsl.monolingualtext.build_lemma(self.json["representations"][lang_code])
+            return self.get_representation(arg.language.code)
         raise KeyError(f"Can't get {type(arg)} from LexemeSense")
 
     def getitem_str(self, key: str) -> I.StatementList:
@@ -266,6 +431,7 @@ class LF_: # pylint: disable=invalid-name
         """ :meta private: """
         return self.get_stmts(key)
 
-    def get_stmts(self, prop: I.Pid) -> I.StatementList:
+    @tfsl.utils.memoized_view
+    def get_stmts(self, prop: I.Pid) -> PVector[tfsl.statement.Statement]:
         """ Assembles a list of Statements present on the item with the given property. """
-        return [tfsl.statement.build_statement(stmt) for stmt in self.json["claims"].get(prop,[])]
+        return PVector(tfsl.statement.build_statement(stmt) for stmt in self.json["claims"].get(prop,[]))
@@ -1,7 +1,7 @@
 """ Holds the LexemeSense class and a function to build one given a JSON representation of it. """
 
 from functools import singledispatchmethod
-from typing import Optional, Protocol, Union, overload
+from typing import Optional, Protocol, Tuple, Union, overload
 
 import tfsl.interfaces as I
 import tfsl.monolingualtext
@@ -9,6 +9,7 @@ import tfsl.monolingualtextholder as MTH
 import tfsl.statement
 import tfsl.statementholder as STH
 import tfsl.utils
+from tfsl.persistent import PVector
 
 class LexemeSenseLike(I.MTST, Protocol):
     """ Defines methods that may be expected when reading from an object representing a Wikibase lexeme sense,
@@ -41,6 +42,26 @@ class LexemeSense:
 
         self.id: Optional[str] = None # pylint: disable=invalid-name
 
+        # the JSON this sense was built from, with the parts built from it, if built by build_sense(lazy=True)
+        self.source: Optional[Tuple[I.LexemeSenseDict, MTH.MonolingualTextHolder, STH.StatementHolder]] = None
+
+    def copy(self) -> 'LexemeSense':
+        """ Returns a copy of this sense whose statements are copied as they are handed out (see StatementHolder.copy). """
+        sense_out = LexemeSense(self.glosses, self.statements.copy())
+        sense_out.set_published_settings(self.get_published_settings())
+        if self.source is not None and self.source[2] is self.statements:
+            sense_out.source = (self.source[0], self.source[1], sense_out.statements)
+        tfsl.utils.copy_cached_fragments(self, sense_out)
+        return sense_out
+
+    def is_unchanged_from_source(self) -> bool:
+        """ Checks whether this sense still matches the JSON it was built from by build_sense(lazy=True). """
+        if self.source is None:
+            return False
+        sense_in, glosses, statements = self.source
+        parts_unchanged = self.glosses is glosses and self.statements is statements and statements.is_unbuilt()
+        return parts_unchanged and self.id == sense_in["id"]
+
     def get_published_settings(self) -> I.LexemeSensePublishedSettings:
         """ Returns a dictionary containing those portions of the LexemeSense JSON dictionary
             which are only significant at editing time for existing lexeme senses.
@@ -83,7 +104,7 @@ class LexemeSense:
     def __add__(self, arg: object) -> 'LexemeSense':
         if isinstance(arg, tfsl.monolingualtext.MonolingualText):
             published_settings = self.get_published_settings()
-            sense_out = LexemeSense(self.glosses + arg, self.statements)
+            sense_out = LexemeSense(self.glosses + arg, self.statements.copy())
             sense_out.set_published_settings(published_settings)
             return sense_out
         elif isinstance(arg, tfsl.statement.Statement):
@@ -96,7 +117,7 @@ class LexemeSense:
     def __sub__(self, arg: object) -> 'LexemeSense':
         if isinstance(arg, tfsl.languages.Language) or isinstance(arg, tfsl.monolingualtext.MonolingualText):
             published_settings = self.get_published_settings()
-            sense_out = LexemeSense(self.glosses - arg, self.statements)
+            sense_out = LexemeSense(self.glosses - arg, self.statements.copy())
             sense_out.set_published_settings(published_settings)
             return sense_out
         elif isinstance(arg, str):
@@ -137,9 +158,23 @@ class LexemeSense:
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, LexemeSense):
             return NotImplemented
-        glosses_equal = self.glosses == rhs.glosses
-        statements_equal = self.statements == rhs.statements
-        return glosses_equal and statements_equal
+        if self.glosses.fingerprint != rhs.glosses.fingerprint:
+            return False
+        return self.statements.has_same_statements(rhs.statements)
+
+    # equality depends on content which may be changed in place
+    __hash__ = None # type: ignore[assignment]
+
+    @property
+    def fingerprint(self) -> str:
+        """ Returns a digest of the sense's glosses and statements (but not its ID),
+            computed from the fingerprints of those parts and kept until one of them changes.
+        """
+        parts = (self.glosses, self.statements.fingerprint)
+        if (fingerprint := tfsl.utils.get_cached_fragment(self, parts, '_fingerprint')) is not None:
+            return fingerprint
+        fingerprint = tfsl.utils.make_fingerprint("sense", self.glosses.fingerprint, self.statements.fingerprint)
+        return tfsl.utils.set_cached_fragment(self, parts, fingerprint, '_fingerprint')
 
     def __str__(self) -> str:
         gloss_str = str(self.glosses)
@@ -147,7 +182,14 @@ class LexemeSense:
         return "\n".join([gloss_str, stmt_str])
 
     def __jsonout__(self) -> I.LexemeSenseDict:
+        if self.source is not None and self.is_unchanged_from_source():
+            return self.source[0]
         glosses_dict = self.glosses.__jsonout__()
+        statement_dict = self.statements.__jsonout__()
+        parts = (self.id, glosses_dict, statement_dict)
+        if (fragment := tfsl.utils.get_cached_fragment(self, parts)) is not None:
+            return fragment
+
         base_dict: I.LexemeSenseDict = {"glosses": glosses_dict}
 
         if self.id is not None:
@@ -155,23 +197,34 @@ class LexemeSense:
         else:
             base_dict["add"] = ""
 
-        if (statement_dict := self.statements.__jsonout__()):
+        if statement_dict:
             base_dict["claims"] = statement_dict
 
-        return base_dict
+        return tfsl.utils.set_cached_fragment(self, parts, base_dict)
 
-def build_sense(sense_in: I.LexemeSenseDict) -> LexemeSense:
-    """ Builds a LexemeSense from the JSON dictionary describing it. """
-    glosses = MTH.build_text_list(sense_in["glosses"])
-    statements = STH.build_statement_list(sense_in["claims"])
+def build_sense(sense_in: I.LexemeSenseDict, lazy: bool=False) -> LexemeSense:
+    """ Builds a LexemeSense from the JSON dictionary describing it.
+        If lazy is set, the statements of each property are only built when first needed,
+        and the sense is output as the original JSON for as long as it is unchanged
+        and none of its statements have been built.
+    """
+    glosses = MTH.MonolingualTextHolder(MTH.build_text_list(sense_in["glosses"]))
+    if lazy:
+        statements = STH.StatementHolder.from_json(sense_in["claims"])
+    else:
+        statements = STH.StatementHolder(STH.build_statement_list(sense_in["claims"]))
 
     sense_out = LexemeSense(glosses, statements)
     sense_out.id = sense_in["id"]
+    if lazy:
+        sense_out.source = (sense_in, glosses, statements)
     return sense_out
 
-class LS_: # pylint: disable=invalid-name
+class LS_(tfsl.utils.MemoizedViews): # pylint: disable=invalid-name
     """ A LexemeSense, but sense glosses are not auto-converted to MonolingualTexts
         and statements are only assembled into Statements when accessed.
+        Anything assembled from the JSON is kept and returned again on later access
+        (see MemoizedViews for how to drop these if the JSON is changed in place).
 
         See the documentation of LexemeSenseLike methods for general information about
         what certain methods do.
@@ -188,10 +241,16 @@ class LS_: # pylint: disable=invalid-name
         raise ValueError("Somehow the sense ID is not a valid sense ID")
 
     @property
+    @tfsl.utils.memoized_view
     def glosses(self) -> MTH.MonolingualTextHolder:
         """ (See LexemeSenseLike.glosses for what this method does.) """
         return MTH.MonolingualTextHolder(MTH.build_text_list(self.json["glosses"]))
 
+    @tfsl.utils.memoized_view
+    def get_gloss(self, lang_code: I.LanguageCode) -> tfsl.monolingualtext.MonolingualText:
+        """ :meta private: """
+        return tfsl.monolingualtext.build_lemma(self.json["glosses"][lang_code])
+
     def __repr__(self) -> str:
         return f"<{self.id}: {len(self.json['glosses'])} glosses, {sum(len(y) for x, y in self.json['claims'].items())} statements>"
 
@@ -214,20 +273,19 @@ class LS_: # pylint: disable=invalid-name
         elif isinstance(arg, tfsl.itemvalue.ItemValue):
             return self.getitem_str(arg.id)
         elif isinstance(arg, tfsl.languages.Language):
-            return MTH.get_lang_from_mtlist(self.json["glosses"], arg)
+            return self.get_gloss(arg.code)
         elif isinstance(arg, tfsl.monolingualtext.MonolingualText):
-            lang = arg.language
-            lang_code = lang.code
-            return tfsl.monolingualtext.build_lemma(self.json["glosses"][lang_code])
+            return self.get_gloss(arg.language.code)
         raise KeyError(f"Can't get {type(arg)} from LexemeSense")
 
     def getitem_pid(self, key: I.Pid) -> I.StatementList:
         """ :meta private: """
         return self.get_stmts(key)
 
-    def get_stmts(self, prop: I.Pid) -> I.StatementList:
+    @tfsl.utils.memoized_view
+    def get_stmts(self, prop: I.Pid) -> PVector[tfsl.statement.Statement]:
         """ Assembles a list of Statements present on the item with the given property. """
-        return [tfsl.statement.build_statement(stmt) for stmt in self.json["claims"].get(prop,[])]
+        return PVector(tfsl.statement.build_statement(stmt) for stmt in self.json["claims"].get(prop,[]))
 
     def getitem_str(self, key: str) -> I.StatementList:
         """ Common handling of __getitem__ for inputs as strings or the ids of ItemValues. """
@@ -1,12 +1,15 @@
-""" Holds the StatementHolder class and a function to build one given a JSON representation of it. """
+""" Holds the MonolingualTextHolder class and functions to build one given a JSON representation of it. """
 
-from copy import deepcopy
 from functools import singledispatchmethod
-from typing import Callable, Iterator, Optional
+from typing import Callable, Iterator, Optional, Sequence, Tuple, Union
 
 import tfsl.interfaces as I
 import tfsl.languages
 import tfsl.monolingualtext
+import tfsl.utils
+from tfsl.persistent import PMap, PVector, pvector
+
+TextMap = PMap[I.LanguageCode, 'tfsl.monolingualtext.MonolingualText']
 
 def rep_language_is(desired_language: tfsl.languages.Language) -> Callable[[tfsl.monolingualtext.MonolingualText], bool]:
     """ Returns a function checking that the provided MonolingualText is in a certain language. """
@@ -15,46 +18,75 @@ def rep_language_is(desired_language: tfsl.languages.Language) -> Callable[[tfsl
     return is_desired_language
 
 class MonolingualTextHolder(object):
-    """ Holds a set of strings with languages attached to them. """
+    """ Holds a set of strings with languages attached to them.
+        The strings are kept in an insertion-ordered PMap keyed by language code,
+        so that finding, replacing or removing the string in a given language
+        does not involve scanning or copying all of the others.
+    """
     def __init__(self,
-                 texts: Optional[I.MonolingualTextHolderInput]=None,
-                 removed_texts: Optional[I.MonolingualTextList]=None):
+                 texts: Optional[Union[TextMap, I.MonolingualTextHolderInput]]=None,
+                 removed_texts: Optional[Sequence[tfsl.monolingualtext.MonolingualText]]=None):
         super().__init__()
 
-        self.texts: I.MonolingualTextList
-        if isinstance(texts, tfsl.monolingualtext.MonolingualText):
-            self.texts = [texts.text @ texts.language]
+        self.text_map: TextMap
+        if isinstance(texts, PMap):
+            self.text_map = texts
+        elif isinstance(texts, tfsl.monolingualtext.MonolingualText):
+            self.text_map = PMap([(texts.language.code, texts)])
         elif texts is None:
-            self.texts = []
+            self.text_map = PMap()
         else:
-            self.texts = texts
+            self.text_map = PMap((text.language.code, text) for text in texts)
 
-        if removed_texts is None:
-            self.removed_texts: I.MonolingualTextList = []
-        else:
-            self.removed_texts = removed_texts
+        self.removed_texts: PVector[tfsl.monolingualtext.MonolingualText] = pvector(removed_texts)
+
+    @property
+    def texts(self) -> Tuple[tfsl.monolingualtext.MonolingualText, ...]:
+        """ Returns the strings held, in the order they were added.
+            This is a read-only snapshot: to add, replace or remove a string, use + and - on the holder instead.
+        """
+        return tuple(self.text_map.values())
+
+    def get_text(self, language: tfsl.languages.Language) -> Optional[tfsl.monolingualtext.MonolingualText]:
+        """ Returns the string in the provided language, if there is one. """
+        text = self.text_map.get(language.code)
+        if text is not None and text.language == language:
+            return text
+        return None
 
     def __jsonout__(self) -> I.LemmaDictSet:
+        parts = (self.text_map, self.removed_texts)
+        if (fragment := tfsl.utils.get_cached_fragment(self, parts)) is not None:
+            return fragment
         base_dict: I.LemmaDictSet = {text.language.code: {"value": text.text, "language": text.language.code, "remove": ""} for text in self.removed_texts}
-        for text in self.texts:
+        for text in self.text_map.values():
             base_dict[text.language.code] = {"value": text.text, "language": text.language.code}
-        return base_dict
+        return tfsl.utils.set_cached_fragment(self, parts, base_dict)
+
+    @property
+    def fingerprint(self) -> str:
+        """ Returns a digest of the texts held (but not those marked for removal), regardless of their order. """
+        parts = (self.text_map,)
+        if (fingerprint := tfsl.utils.get_cached_fragment(self, parts, '_fingerprint')) is not None:
+            return fingerprint
+        texts = sorted((text.language.code, text.text) for text in self.text_map.values())
+        return tfsl.utils.set_cached_fragment(self, parts, tfsl.utils.make_fingerprint("texts", texts), '_fingerprint')
 
     def __eq__(self, rhs: object) -> bool:
         if isinstance(rhs, MonolingualTextHolder):
             return self.texts == rhs.texts
         elif isinstance(rhs, list):
-            return set(self.texts) == set(rhs)
+            return set(self.text_map.values()) == set(rhs)
         return NotImplemented
 
     def __contains__(self, arg: object) -> bool:
         return self.contains(arg)
 
     def __len__(self) -> int:
-        return len(self.texts)
+        return len(self.text_map)
 
     def __iter__(self) -> Iterator[tfsl.monolingualtext.MonolingualText]:
-        return iter(self.texts)
+        return iter(self.text_map.values())
 
     @singledispatchmethod
     def contains(self, arg: object) -> bool:
@@ -63,11 +95,11 @@ class MonolingualTextHolder(object):
 
     @contains.register
     def _(self, arg: tfsl.languages.Language) -> bool:
-        return any((text.language == arg) for text in self.texts)
+        return self.get_text(arg) is not None
 
     @contains.register
     def _(self, arg: tfsl.monolingualtext.MonolingualText) -> bool:
-        return arg in self.texts
+        return self.text_map.get(arg.language.code) == arg
 
     def __getitem__(self, arg: object) -> tfsl.monolingualtext.MonolingualText:
         return self.get_mt(arg)
@@ -79,38 +111,38 @@ class MonolingualTextHolder(object):
 
     @get_mt.register
     def _(self, arg: tfsl.languages.Language) -> tfsl.monolingualtext.MonolingualText:
-        return next(filter(rep_language_is(arg), self.texts))
+        text = self.get_text(arg)
+        if text is None:
+            raise KeyError(f"No text in {arg.code} in MonolingualTextHolder")
+        return text
 
     @get_mt.register
     def _(self, arg: tfsl.monolingualtext.MonolingualText) -> tfsl.monolingualtext.MonolingualText:
-        return next(filter(lambda text: text == arg, self.texts))
+        if self.text_map.get(arg.language.code) != arg:
+            raise KeyError(f"{arg} not in MonolingualTextHolder")
+        return arg
 
     def __str__(self) -> str:
-        return ' / '.join([f"{text.text}@{text.language.code}" for text in self.texts])
+        return ' / '.join([f"{text.text}@{text.language.code}" for text in self.text_map.values()])
 
     def __add__(self, rhs: object) -> 'MonolingualTextHolder':
         if isinstance(rhs, tfsl.monolingualtext.MonolingualText):
-            newtexts = deepcopy(self.texts)
-            newtexts = [rep for rep in newtexts if rep.language != rhs.language]
-            newtexts.append(rhs)
-            return MonolingualTextHolder(newtexts)
+            # the replaced string is dropped first so that the new one goes last, as it did in a list
+            newtexts = self.text_map.discard(rhs.language.code).set(rhs.language.code, rhs)
+            return MonolingualTextHolder(newtexts, self.removed_texts)
         raise TypeError(f"Can't add {type(rhs)} to MonolingualTextHolder")
 
     def __sub__(self, rhs: object) -> 'MonolingualTextHolder':
         if isinstance(rhs, tfsl.languages.Language):
-            newtexts = []
-            for rep in self.texts:
-                if rep.language == rhs:
-                    self.removed_texts.append(rep)
-                else:
-                    newtexts.append(rep)
-            return MonolingualTextHolder(newtexts, self.removed_texts)
+            removed_text = self.get_text(rhs)
         elif isinstance(rhs, tfsl.monolingualtext.MonolingualText):
-            newtexts = [rep for rep in self.texts if rep != rhs]
-            if rhs in self.texts:
-                self.removed_texts.append(rhs)
-            return MonolingualTextHolder(newtexts, self.removed_texts)
-        raise TypeError(f"Can't subtract {type(rhs)} from MonolingualTextHolder")
+            removed_text = rhs if rhs in self else None
+        else:
+            raise TypeError(f"Can't subtract {type(rhs)} from MonolingualTextHolder")
+        if removed_text is None:
+            return MonolingualTextHolder(self.text_map, self.removed_texts)
+        return MonolingualTextHolder(self.text_map.discard(removed_text.language.code),
+                                     self.removed_texts.appended(removed_text))
 
 def build_text_list(text_dict: I.LemmaDictSet) -> I.MonolingualTextList:
     """ Builds a statement set from a JSON dictionary of statements. """
@@ -0,0 +1,443 @@
+""" Holds the PVector and PMap classes, immutable collections which share structure between versions.
+
+    Adding an element to either of these returns a new collection in O(log n) time,
+    copying only the path to the changed element and sharing everything else with the original.
+    These back the containers inside entities so that their '+' and '-' operators
+    do not have to copy the entire container each time.
+
+    Neither can be changed in place: the methods named after those of lists and dicts which would do so
+    raise a TypeError, and the methods returning a changed copy have names of their own (appended, extended, updated).
+"""
+
+from typing import Any, Iterable, Iterator, Mapping, NoReturn, Optional, Sequence, Tuple, TypeVar, Union, overload
+
+T = TypeVar('T')
+K = TypeVar('K')
+V = TypeVar('V')
+PMapT = TypeVar('PMapT', bound='PMap[Any, Any]')
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+# Python hashes have 64 bits plus a sign, so after this shift two keys
+# with the same path through a PMap have exactly the same hash
+HASH_SHIFT_LIMIT = 65
+
+def new_path(level: int, node: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """ Wraps the provided node in single-child nodes until it sits at the provided level. """
+    while level > 0:
+        node = (node,)
+        level -= BITS
+    return node
+
+class PVector(Sequence[T]):
+    """ Immutable sequence implemented as a 32-way trie with a tail,
+        after the persistent vectors of Clojure.
+    """
+    __slots__ = ('_count', '_shift', '_root', '_tail')
+
+    _count: int
+    _shift: int
+    _root: Tuple[Any, ...]
+    _tail: Tuple[T, ...]
+
+    def __init__(self, items: Iterable[T]=()):
+        items = list(items)
+        count = len(items)
+        tail_offset = PVector.get_tail_offset(count)
+
+        nodes = [tuple(items[i:i+WIDTH]) for i in range(0, tail_offset, WIDTH)]
+        shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [tuple(nodes[i:i+WIDTH]) for i in range(0, len(nodes), WIDTH)]
+            shift += BITS
+
+        self._count = count
+        self._shift = shift
+        self._root = tuple(nodes)
+        self._tail = tuple(items[tail_offset:])
+
+    @staticmethod
+    def get_tail_offset(count: int) -> int:
+        """ Returns the index of the first element stored in the tail of a vector of the provided length. """
+        if count < WIDTH:
+            return 0
+        return ((count - 1) >> BITS) << BITS
+
+    @classmethod
+    def from_parts(cls, count: int, shift: int, root: Tuple[Any, ...], tail: Tuple[T, ...]) -> 'PVector[T]':
+        """ :meta private: """
+        vector_out: PVector[T] = cls.__new__(cls)
+        vector_out._count = count
+        vector_out._shift = shift
+        vector_out._root = root
+        vector_out._tail = tail
+        return vector_out
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> 'PVector[T]': ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, 'PVector[T]']:
+        if isinstance(index, slice):
+            return PVector(list(self)[index])
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("PVector index out of range")
+        tail_offset = PVector.get_tail_offset(self._count)
+        if index >= tail_offset:
+            return self._tail[index - tail_offset]
+        node = self._root
+        level = self._shift
+        while level > 0:
+            node = node[(index >> level) & MASK]
+            level -= BITS
+        return node[index & MASK]
+
+    def __iter__(self) -> Iterator[T]:
+        stack = [(self._root, self._shift)]
+        while stack:
+            node, level = stack.pop()
+            if level == 0:
+                yield from node
+            else:
+                stack.extend((child, level - BITS) for child in reversed(node))
+        yield from self._tail
+
+    def __eq__(self, rhs: object) -> bool:
+        if rhs is self:
+            return True
+        if not isinstance(rhs, (PVector, list, tuple)):
+            return NotImplemented
+        return len(self) == len(rhs) and all(lhs_item == rhs_item for lhs_item, rhs_item in zip(self, rhs))
+
+    __hash__ = None # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PVector({list(self)!r})"
+
+    def __copy__(self) -> 'PVector[T]':
+        return self
+
+    def append(self, arg: T) -> NoReturn:
+        """ :meta private: """
+        raise TypeError("PVector can't be changed in place; appended() returns a new PVector with the element added")
+
+    def extend(self, args: Iterable[T]) -> NoReturn:
+        """ :meta private: """
+        raise TypeError("PVector can't be changed in place; extended() returns a new PVector with the elements added")
+
+    def appended(self, arg: T) -> 'PVector[T]':
+        """ Returns a new vector with the provided element at the end. """
+        if len(self._tail) < WIDTH:
+            return PVector.from_parts(self._count + 1, self._shift, self._root, self._tail + (arg,))
+
+        shift = self._shift
+        if (self._count >> BITS) > (1 << shift):
+            root = (self._root, new_path(shift, self._tail))
+            shift += BITS
+        else:
+            root = self.push_tail(shift, self._root, self._tail)
+        return PVector.from_parts(self._count + 1, shift, root, (arg,))
+
+    def push_tail(self, level: int, parent: Tuple[Any, ...], tail: Tuple[T, ...]) -> Tuple[Any, ...]:
+        """ :meta private: """
+        subindex = ((self._count - 1) >> level) & MASK
+        if level == BITS:
+            node_to_insert: Tuple[Any, ...] = tail
+        elif subindex < len(parent):
+            node_to_insert = self.push_tail(level - BITS, parent[subindex], tail)
+        else:
+            node_to_insert = new_path(level - BITS, tail)
+        return parent[:subindex] + (node_to_insert,) + parent[subindex+1:]
+
+    def extended(self, args: Iterable[T]) -> 'PVector[T]':
+        """ Returns a new vector with the provided elements at the end. """
+        vector_out = self
+        for arg in args:
+            vector_out = vector_out.appended(arg)
+        return vector_out
+
+    def set(self, index: int, arg: T) -> 'PVector[T]':
+        """ Returns a new vector with the element at the provided index replaced. """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("PVector index out of range")
+        tail_offset = PVector.get_tail_offset(self._count)
+        if index >= tail_offset:
+            tail_index = index - tail_offset
+            new_tail = self._tail[:tail_index] + (arg,) + self._tail[tail_index+1:]
+            return PVector.from_parts(self._count, self._shift, self._root, new_tail)
+        return PVector.from_parts(self._count, self._shift, PVector.assoc(self._shift, self._root, index, arg), self._tail)
+
+    @staticmethod
+    def assoc(level: int, node: Tuple[Any, ...], index: int, arg: Any) -> Tuple[Any, ...]:
+        """ :meta private: """
+        if level == 0:
+            subindex = index & MASK
+            return node[:subindex] + (arg,) + node[subindex+1:]
+        subindex = (index >> level) & MASK
+        new_child = PVector.assoc(level - BITS, node[subindex], index, arg)
+        return node[:subindex] + (new_child,) + node[subindex+1:]
+
+    def without(self, arg: object) -> 'PVector[T]':
+        """ Returns a vector lacking every element equal to the provided one,
+            or this same vector if there are no such elements.
+        """
+        for element in self:
+            if element == arg:
+                return PVector(element for element in self if element != arg)
+        return self
+
+EMPTY_VECTOR: PVector[Any] = PVector()
+
+def pvector(items: Optional[Iterable[T]]=None) -> PVector[T]:
+    """ Returns the provided iterable as a PVector, without copying it if it is one already. """
+    if isinstance(items, PVector):
+        return items
+    if items is None:
+        return EMPTY_VECTOR
+    return PVector(items)
+
+def popcount(arg: int) -> int:
+    """ Counts the set bits in the provided integer. """
+    return bin(arg).count("1")
+
+class HashNode:
+    """ :meta private:
+        A node of a hash array mapped trie whose entries are either (key, value) pairs or subnodes.
+    """
+    __slots__ = ('bitmap', 'array')
+
+    def __init__(self, bitmap: int, array: Tuple[Any, ...]):
+        self.bitmap = bitmap
+        self.array = array
+
+    def find(self, shift: int, key_hash: int, key: Any) -> Optional[Tuple[Any, Any]]:
+        """ Returns the (key, value) pair with the provided key, if present. """
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            return None
+        entry = self.array[popcount(self.bitmap & (bit - 1))]
+        if isinstance(entry, (HashNode, CollisionNode)):
+            return entry.find(shift + BITS, key_hash, key)
+        if entry[0] is key or entry[0] == key:
+            return entry
+        return None
+
+    def assoc(self, shift: int, key_hash: int, entry_in: Tuple[Any, Any]) -> Tuple['HashNode', bool]:
+        """ Returns a node with the provided pair and whether the key is new to the node. """
+        bit = 1 << ((key_hash >> shift) & MASK)
+        index = popcount(self.bitmap & (bit - 1))
+        if not self.bitmap & bit:
+            return HashNode(self.bitmap | bit, self.array[:index] + (entry_in,) + self.array[index:]), True
+
+        entry = self.array[index]
+        if isinstance(entry, (HashNode, CollisionNode)):
+            new_child, added = entry.assoc(shift + BITS, key_hash, entry_in)
+            if new_child is entry:
+                return self, False
+            new_entry: Any = new_child
+        elif entry[0] is entry_in[0] or entry[0] == entry_in[0]:
+            if entry[1] is entry_in[1]:
+                return self, False
+            new_entry, added = entry_in, False
+        else:
+            new_entry, added = make_node(shift + BITS, entry, hash(entry[0]), entry_in, key_hash), True
+        return HashNode(self.bitmap, self.array[:index] + (new_entry,) + self.array[index+1:]), added
+
+    def dissoc(self, shift: int, key_hash: int, key: Any) -> Optional['HashNode']:
+        """ Returns a node without the provided key, or None if that node would be empty. """
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            return self
+        index = popcount(self.bitmap & (bit - 1))
+        entry = self.array[index]
+        if isinstance(entry, (HashNode, CollisionNode)):
+            new_child = entry.dissoc(shift + BITS, key_hash, key)
+            if new_child is entry:
+                return self
+            if new_child is not None:
+                return HashNode(self.bitmap, self.array[:index] + (new_child,) + self.array[index+1:])
+        elif not (entry[0] is key or entry[0] == key):
+            return self
+        if self.bitmap == bit:
+            return None
+        return HashNode(self.bitmap ^ bit, self.array[:index] + self.array[index+1:])
+
+class CollisionNode:
+    """ :meta private:
+        A node holding (key, value) pairs whose keys have exactly the same hash.
+    """
+    __slots__ = ('entries',)
+
+    def __init__(self, entries: Tuple[Tuple[Any, Any], ...]):
+        self.entries = entries
+
+    def find(self, shift: int, key_hash: int, key: Any) -> Optional[Tuple[Any, Any]]:
+        """ Returns the (key, value) pair with the provided key, if present. """
+        for entry in self.entries:
+            if entry[0] is key or entry[0] == key:
+                return entry
+        return None
+
+    def assoc(self, shift: int, key_hash: int, entry_in: Tuple[Any, Any]) -> Tuple['CollisionNode', bool]:
+        """ Returns a node with the provided pair and whether the key is new to the node. """
+        for index, entry in enumerate(self.entries):
+            if entry[0] is entry_in[0] or entry[0] == entry_in[0]:
+                return CollisionNode(self.entries[:index] + (entry_in,) + self.entries[index+1:]), False
+        return CollisionNode(self.entries + (entry_in,)), True
+
+    def dissoc(self, shift: int, key_hash: int, key: Any) -> Optional['CollisionNode']:
+        """ Returns a node without the provided key, or None if that node would be empty. """
+        remaining = tuple(entry for entry in self.entries if not (entry[0] is key or entry[0] == key))
+        if len(remaining) == len(self.entries):
+            return self
+        if not remaining:
+            return None
+        return CollisionNode(remaining)
+
+def make_node(shift: int, entry1: Tuple[Any, Any], hash1: int, entry2: Tuple[Any, Any], hash2: int) -> Union[HashNode, CollisionNode]:
+    """ Builds a node holding two pairs whose keys share a path up to the provided shift. """
+    if shift >= HASH_SHIFT_LIMIT:
+        return CollisionNode((entry1, entry2))
+    index1 = (hash1 >> shift) & MASK
+    index2 = (hash2 >> shift) & MASK
+    if index1 == index2:
+        return HashNode(1 << index1, (make_node(shift + BITS, entry1, hash1, entry2, hash2),))
+    if index1 < index2:
+        return HashNode((1 << index1) | (1 << index2), (entry1, entry2))
+    return HashNode((1 << index1) | (1 << index2), (entry2, entry1))
+
+EMPTY_NODE = HashNode(0, ())
+
+class Tombstone:
+    """ :meta private:
+        Placeholder for a removed key in the insertion order of a PMap.
+    """
+    def __repr__(self) -> str:
+        return "<removed>"
+
+TOMBSTONE = Tombstone()
+
+class PMap(Mapping[K, V]):
+    """ Immutable mapping implemented as a hash array mapped trie.
+        As with dicts, iteration follows the order in which keys were first inserted.
+    """
+    __slots__ = ('_root', '_count', '_order')
+
+    _root: HashNode
+    _count: int
+    _order: PVector[Any]
+
+    def __init__(self, items: Optional[Union[Mapping[K, V], Iterable[Tuple[K, V]]]]=None):
+        self._root = EMPTY_NODE
+        self._count = 0
+        self._order = EMPTY_VECTOR
+        if items is None:
+            return
+        pairs = items.items() if isinstance(items, Mapping) else items
+        current = self
+        for key, value in pairs:
+            current = current.set(key, value)
+        self._root = current._root
+        self._count = current._count
+        self._order = current._order
+
+    def from_parts(self: PMapT, root: HashNode, count: int, order: PVector[Any]) -> PMapT:
+        """ :meta private: """
+        cls = type(self)
+        map_out = cls.__new__(cls)
+        map_out._root = root
+        map_out._count = count
+        map_out._order = order
+        return map_out
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[K]:
+        for key in self._order:
+            if key is not TOMBSTONE:
+                yield key
+
+    def __getitem__(self, key: K) -> V:
+        entry = self._root.find(0, hash(key), key)
+        if entry is None:
+            raise KeyError(key)
+        return entry[1][1]
+
+    def __contains__(self, key: object) -> bool:
+        return self._root.find(0, hash(key), key) is not None
+
+    def get(self, key: K, default: Any=None) -> Any:
+        entry = self._root.find(0, hash(key), key)
+        if entry is None:
+            return default
+        return entry[1][1]
+
+    def __eq__(self, rhs: object) -> bool:
+        if rhs is self:
+            return True
+        if not isinstance(rhs, Mapping):
+            return NotImplemented
+        if len(self) != len(rhs):
+            return False
+        for key, value in self.items():
+            if key not in rhs or not value == rhs[key]:
+                return False
+        return True
+
+    __hash__ = None # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __copy__(self: PMapT) -> PMapT:
+        return self
+
+    def set(self: PMapT, key: K, value: V) -> PMapT:
+        """ Returns a new map in which the provided key maps to the provided value. """
+        key_hash = hash(key)
+        entry = self._root.find(0, key_hash, key)
+        if entry is not None:
+            position, old_value = entry[1]
+            if old_value is value:
+                return self
+            new_root, _ = self._root.assoc(0, key_hash, (key, (position, value)))
+            return self.from_parts(new_root, self._count, self._order)
+        new_root, _ = self._root.assoc(0, key_hash, (key, (len(self._order), value)))
+        return self.from_parts(new_root, self._count + 1, self._order.appended(key))
+
+    def discard(self: PMapT, key: K) -> PMapT:
+        """ Returns a new map without the provided key, or this same map if the key is absent. """
+        key_hash = hash(key)
+        entry = self._root.find(0, key_hash, key)
+        if entry is None:
+            return self
+        new_root = self._root.dissoc(0, key_hash, key) or EMPTY_NODE
+        count = self._count - 1
+        order = self._order.set(entry[1][0], TOMBSTONE)
+        if len(order) > WIDTH and len(order) > 2 * count:
+            # too many removed keys are being skipped over, so start the order afresh
+            return self.from_parts(EMPTY_NODE, 0, EMPTY_VECTOR).updated((other_key, self[other_key]) for other_key in self if other_key != entry[0])
+        return self.from_parts(new_root, count, order)
+
+    def update(self, items: Union[Mapping[K, V], Iterable[Tuple[K, V]]]) -> NoReturn:
+        """ :meta private: """
+        raise TypeError(f"{type(self).__name__} can't be changed in place; updated() returns a new one with the pairs added")
+
+    def updated(self: PMapT, items: Union[Mapping[K, V], Iterable[Tuple[K, V]]]) -> PMapT:
+        """ Returns a new map with the provided pairs added. """
+        pairs = items.items() if isinstance(items, Mapping) else items
+        map_out = self
+        for key, value in pairs:
+            map_out = map_out.set(key, value)
+        return map_out
@@ -0,0 +1,80 @@
+""" Holds functions choosing the smallest API module able to make the changes in a wbeditentity request.
+
+    wbeditentity has the whole of the data it is given checked and applied to the entity,
+    while the modules of WikibaseLexeme and the claim modules of Wikibase only handle one form, sense or statement at a time.
+    A request which only changes one such part is therefore replaced with a request to the module dedicated to it.
+    Requests changing several parts are kept as they are, so that their changes are still made in a single revision.
+"""
+
+import json
+import uuid
+from typing import Any, Dict, List, Optional
+
+import tfsl.interfaces as I
+
+# parameters of a wbeditentity request which mean the same to every other module
+shared_parameters = ("format", "bot", "summary", "assertuser", "maxlag", "baserevid")
+
+def plan_request(requestjson: Dict[str, str]) -> Dict[str, str]:
+    """ Returns the cheapest request making the same changes as the provided wbeditentity request
+        (as built by WikibaseSession.build_push_request), which may be that request itself.
+    """
+    if requestjson.get("action") != "wbeditentity" or "id" not in requestjson:
+        return requestjson
+    data = json.loads(requestjson["data"])
+    calls = plan_lexeme_delta(data)
+    if calls is None or len(calls) != 1:
+        return requestjson
+    planned_request = {key: requestjson[key] for key in shared_parameters if key in requestjson}
+    planned_request.update(calls[0])
+    return planned_request
+
+def plan_lexeme_delta(delta: I.LexemeDict) -> Optional[List[Dict[str, str]]]:
+    """ Returns the module-specific parameters of each request needed to make the changes in the provided lexeme delta
+        (see tfsl.delta.lexeme_delta), or None if some of those changes can only be made with wbeditentity.
+    """
+    if any(key not in ("id", "lastrevid", "claims", "forms", "senses") for key in delta):
+        return None
+    calls = plan_statements(delta["id"], delta.get("claims", {}))
+    for key, texts_key, module_suffix in (("forms", "representations", "form"), ("senses", "glosses", "sense")):
+        for subentity in delta.get(key, []): # type: ignore[literal-required]
+            subentity_calls = plan_subentity(delta["id"], subentity, texts_key, module_suffix)
+            if subentity_calls is None:
+                return None
+            calls.extend(subentity_calls)
+    return calls
+
+def plan_subentity(lid: I.Lid, subentity: Dict[str, Any], texts_key: str, module_suffix: str) -> Optional[List[Dict[str, str]]]:
+    """ Returns the requests needed to make the changes to a form (with texts_key "representations" and module_suffix "form")
+        or a sense (with texts_key "glosses" and module_suffix "sense"), or None if wbeditentity is needed.
+    """
+    elements = {key: subentity[key] for key in (texts_key, "grammaticalFeatures") if key in subentity}
+    if "id" not in subentity:
+        if subentity.get("claims"):
+            return None
+        return [{"action": "wbladd" + module_suffix, "lexemeId": lid, "data": json.dumps(elements)}]
+    if "remove" in subentity:
+        return [{"action": "wblremove" + module_suffix, "id": subentity["id"]}]
+    calls = plan_statements(subentity["id"], subentity.get("claims", {}))
+    if elements:
+        calls.append({"action": f"wbledit{module_suffix}elements", module_suffix + "Id": subentity["id"],
+                      "data": json.dumps(elements)})
+    return calls
+
+def plan_statements(entity_id: str, statements: I.StatementDictSet) -> List[Dict[str, str]]:
+    """ Returns the requests needed to add, change or remove the provided statements on the entity with the provided ID,
+        giving a new GUID to each statement being added.
+    """
+    calls = []
+    removed_ids = []
+    for stmts in statements.values():
+        for stmt in stmts:
+            if "remove" in stmt:
+                removed_ids.append(stmt["id"])
+            else:
+                if "id" not in stmt:
+                    stmt = dict(stmt, id=f"{entity_id}${uuid.uuid4()}") # type: ignore[assignment]
+                calls.append({"action": "wbsetclaim", "claim": json.dumps(stmt)})
+    if removed_ids:
+        calls.append({"action": "wbremoveclaims", "claim": "|".join(removed_ids)})
+    return calls
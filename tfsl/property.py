@@ -12,6 +12,7 @@ import tfsl.monolingualtextholder
 import tfsl.statement
 import tfsl.statementholder
 import tfsl.utils
+from tfsl.persistent import PVector
 
 class Property:
     """ Container for a Wikidata property. """
@@ -125,7 +126,7 @@ class Property:
         """
         published_settings = self.get_published_settings()
         property_out = Property(self.datatype, self.labels + arg, self.descriptions, self.aliases,
-                      self.statements)
+                      self.statements.copy())
         property_out.set_published_settings(published_settings)
         return property_out
 
@@ -135,7 +136,7 @@ class Property:
         """
         published_settings = self.get_published_settings()
         property_out = Property(self.datatype, self.labels, self.descriptions + arg, self.aliases,
-                      self.statements)
+                      self.statements.copy())
         property_out.set_published_settings(published_settings)
         return property_out
 
@@ -156,7 +157,7 @@ class Property:
         """
         published_settings = self.get_published_settings()
         property_out = Property(self.datatype, self.labels - arg, self.descriptions, self.aliases,
-                      self.statements)
+                      self.statements.copy())
         property_out.set_published_settings(published_settings)
         return property_out
 
@@ -166,7 +167,7 @@ class Property:
         """
         published_settings = self.get_published_settings()
         property_out = Property(self.datatype, self.labels, self.descriptions - arg, self.aliases,
-                      self.statements)
+                      self.statements.copy())
         property_out.set_published_settings(published_settings)
         return property_out
 
@@ -200,26 +201,31 @@ def P(pid: Union[int, I.Pid]) -> Property: # pylint: disable=invalid-name
     property_json = retrieve_property_json(pid)
     return build_property(property_json)
 
-class P_: # pylint: disable=invalid-name
+class P_(tfsl.utils.MemoizedViews): # pylint: disable=invalid-name
     """ A Property, but labels/descriptions are not auto-converted to MonolingualTexts
         and statements are only assembled into Statements when accessed.
+        Anything assembled from the JSON is kept and returned again on later access
+        (see MemoizedViews for how to drop these if the JSON is changed in place).
     """
     def __init__(self, input_arg: I.Pid):
         self.property_json: I.PropertyDict = retrieve_property_json(input_arg)
 
+    @tfsl.utils.memoized_view
     def get_label(self, lang: tfsl.languages.Language) -> tfsl.monolingualtext.MonolingualText:
         """ Assembles a MonolingualText containing the label with the given language code. """
         label_dict: I.LemmaDict = self.property_json["labels"][lang.code]
         return label_dict["value"] @ lang
 
+    @tfsl.utils.memoized_view
     def get_description(self, lang: tfsl.languages.Language) -> tfsl.monolingualtext.MonolingualText:
         """ Assembles a MonolingualText containing the description with the given language code. """
         description_dict: I.LemmaDict = self.property_json["descriptions"][lang.code]
         return description_dict["value"] @ lang
 
-    def get_stmts(self, prop: I.Pid) -> I.StatementList:
+    @tfsl.utils.memoized_view
+    def get_stmts(self, prop: I.Pid) -> PVector[tfsl.statement.Statement]:
         """ Assembles a list of Statements present on the property with the given property. """
-        return [tfsl.statement.build_statement(stmt) for stmt in self.property_json["claims"].get(prop,[])]
+        return PVector(tfsl.statement.build_statement(stmt) for stmt in self.property_json["claims"].get(prop,[]))
 
     def __getitem__(self, prop: I.Pid) -> I.StatementList:
         return self.get_stmts(prop)
@@ -1,43 +1,42 @@
 """ Holds the Reference class and a function to build one given a JSON representation of it. """
 
-from collections import defaultdict, Counter
-from copy import deepcopy
+from collections import defaultdict
 from functools import singledispatchmethod
 from textwrap import indent
-from typing import Any, DefaultDict, List, Optional, Union
+from typing import List, Optional, Union
 
 import tfsl.interfaces as I
 import tfsl.claim
 import tfsl.utils
+from tfsl.persistent import EMPTY_VECTOR, PMap, PVector
 
-class ClaimSet(DefaultDict[I.Pid, I.ClaimList]):
-    """ Representation of a set of Claims. """
-    def __init__(self, *args: Any, **kwargs: I.ClaimList):
-        if args:
-            super(ClaimSet, self).__init__(*args, **kwargs)
-        else:
-            super(ClaimSet, self).__init__(list, **kwargs)
+class ClaimSet(PMap[I.Pid, PVector[tfsl.claim.Claim]]):
+    """ Representation of a set of Claims.
+        This is immutable; adding or removing a claim returns a new ClaimSet
+        sharing the claims of other properties with this one.
+    """
+    def __getitem__(self, property_in: I.Pid) -> PVector[tfsl.claim.Claim]:
+        return self.get(property_in, EMPTY_VECTOR)
 
     def add(self, arg: tfsl.claim.Claim) -> 'ClaimSet':
         """ Adds a claim to a ClaimSet. """
-        newclaimset = deepcopy(self)
-        newclaimset[arg.property].append(arg)
-        return newclaimset
+        return self.set(arg.property, self[arg.property].appended(arg))
 
     def sub(self, arg: tfsl.claim.Claim) -> 'ClaimSet':
         """ Removes a claim from a ClaimSet. """
-        newclaimset = deepcopy(self)
-        newclaimset[arg.property] = [claim for claim in newclaimset[arg.property] if claim != arg]
-        if len(newclaimset[arg.property]) == 0:
-            del newclaimset[arg.property]
-        return newclaimset
+        remaining_claims = self[arg.property].without(arg)
+        if len(remaining_claims) == 0:
+            return self.discard(arg.property)
+        return self.set(arg.property, remaining_claims)
 
 class Reference:
     """ Representation of a reference. """
     def __init__(self, *args: Union[tfsl.claim.Claim, ClaimSet]):
         self._claims = ClaimSet()
         for arg in args:
-            if isinstance(arg, tfsl.claim.Claim):
+            if isinstance(arg, ClaimSet) and len(self._claims) == 0:
+                self._claims = arg
+            elif isinstance(arg, tfsl.claim.Claim):
                 self._claims = self._claims.add(arg)
             else:
                 for prop in arg:
@@ -52,9 +51,12 @@ class Reference:
 
     def __delitem__(self, arg: Union[I.Pid, tfsl.claim.Claim]) -> None:
         if isinstance(arg, tfsl.claim.Claim):
-            self._claims[arg.property] = [claim for claim in self._claims[arg.property] if claim.value != arg.value]
+            remaining_claims = PVector(claim for claim in self._claims[arg.property] if claim.value != arg.value)
+            self._claims = self._claims.set(arg.property, remaining_claims)
+        elif arg in self._claims:
+            self._claims = self._claims.discard(arg)
         else:
-            del self._claims[arg]
+            raise KeyError(arg)
 
     def __add__(self, arg: object) -> 'Reference':
         newclaims = self.add(arg)
@@ -98,18 +100,32 @@ class Reference:
     def _(self, arg: str) -> bool:
         return arg in self._claims
 
+    @property
+    def fingerprint(self) -> str:
+        """ Returns a digest of the claims in the reference, regardless of their order,
+            which is computed from those of the claims and kept until the claims change.
+        """
+        parts = (self._claims,)
+        if (fingerprint := tfsl.utils.get_cached_fragment(self, parts, '_fingerprint')) is not None:
+            return fingerprint
+        claim_fingerprints = sorted(claim.fingerprint for claims in self._claims.values() for claim in claims)
+        return tfsl.utils.set_cached_fragment(self, parts, tfsl.utils.make_fingerprint("reference", claim_fingerprints), '_fingerprint')
+
     def __eq__(self, rhs: object) -> bool:
         if not isinstance(rhs, Reference):
             return NotImplemented
-        return Counter(self._claims) == Counter(rhs._claims)
+        return self.fingerprint == rhs.fingerprint
 
     def __hash__(self) -> int:
-        return hash((claim for k, v in self._claims.items() for claim in v))
+        return hash(self.fingerprint)
 
     def __str__(self) -> str:
         return "["+indent("\n".join([str(claim) for key in self._claims for claim in self._claims[key]]), tfsl.utils.DEFAULT_INDENT)+"]"
 
     def __jsonout__(self) -> I.ReferenceDict:
+        parts = (self._claims, self.hash)
+        if (fragment := tfsl.utils.get_cached_fragment(self, parts)) is not None:
+            return fragment
         snaks_order = list(self._claims.keys())
         base_dict: I.ReferenceDict = {
             "snaks-order": snaks_order
@@ -121,7 +137,7 @@ class Reference:
         base_dict["snaks"] = dict(snak_dict)
         if self.hash is not None:
             base_dict["hash"] = self.hash
-        return base_dict
+        return tfsl.utils.set_cached_fragment(self, parts, base_dict)
 
 
 def build_ref(ref_in: I.ReferenceDict) -> Reference:
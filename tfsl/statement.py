@@ -1,7 +1,5 @@
 """ Holds the Statement class and a function to build one given a JSON representation of it. """
 
-from collections import defaultdict
-from copy import deepcopy
 from enum import Enum
 from textwrap import indent
 from typing import List, Optional, Union
@@ -10,6 +8,10 @@ import tfsl.interfaces as I
 import tfsl.claim
 import tfsl.reference
 import tfsl.utils
+from tfsl.persistent import PVector, pvector
+
+# counts the values of statements replaced in place, so that indexes of statement values can tell when they may be out of date
+value_generation = 0
 
 class Rank(Enum):
     """ Represents the rank of a given statement. """
@@ -34,32 +36,26 @@ class Statement:
             self.rank = rank
 
         self.property: I.Pid = property_in
-        self.value: I.ClaimValue
+        self._value: I.ClaimValue
         if tfsl.utils.is_novalue(value_in) or tfsl.utils.is_somevalue(value_in):
-            self.value = value_in
+            self._value = value_in
         else:
             value_type = type(value_in)
             property_type = tfsl.claim.type_string_to_type[tfsl.utils.values_type(self.property)]
             if property_type == value_type:
-                self.value = value_in
+                self._value = value_in
             else:
                 raise TypeError(f"Providing {value_type} as {self.property} value where {property_type} expected")
 
         self.qualifiers: tfsl.reference.ClaimSet = tfsl.reference.ClaimSet()
 
         if isinstance(qualifiers, tfsl.reference.ClaimSet):
-            for prop in qualifiers:
-                for claim in qualifiers[prop]:
-                    self.qualifiers = self.qualifiers.add(claim)
+            self.qualifiers = qualifiers
         elif qualifiers is not None:
             for arg in qualifiers:
                 self.qualifiers = self.qualifiers.add(arg)
 
-        self.references: I.ReferenceList
-        if references is None:
-            self.references = []
-        else:
-            self.references = deepcopy(references)
+        self.references: PVector[tfsl.reference.Reference] = pvector(references)
 
         self.id: Optional[str] = None # pylint: disable=invalid-name
         self.qualifiers_order: List[I.Pid] = []
@@ -126,6 +122,17 @@ class Statement:
         stmt_out.set_published_settings(published_settings)
         return stmt_out
 
+    @property
+    def value(self) -> I.ClaimValue:
+        """ Returns the value of the statement. """
+        return self._value
+
+    @value.setter
+    def value(self, value_in: I.ClaimValue) -> None:
+        global value_generation # pylint: disable=global-statement,invalid-name
+        self._value = value_in
+        value_generation += 1
+
     def __matmul__(self, arg: object) -> 'Statement':
         if isinstance(arg, Rank):
             return self.matmul_rank(arg)
@@ -140,9 +147,28 @@ class Statement:
         if isinstance(rhs, tfsl.claim.Claim):
             return self.property == rhs.property and self.value == rhs.value
         elif isinstance(rhs, Statement):
-            return self.property == rhs.property and self.value == rhs.value and self.rank == rhs.rank and self.qualifiers == rhs.qualifiers and self.references == rhs.references
+            return self.fingerprint == rhs.fingerprint
         return NotImplemented
 
+    # equality depends on content which may be changed in place
+    __hash__ = None # type: ignore[assignment]
+
+    @property
+    def fingerprint(self) -> str:
+        """ Returns a digest of the statement's property, value, rank, qualifiers and references,
+            disregarding the order of the qualifiers and references (but not its ID).
+            This is computed from the fingerprints of the qualifiers and references
+            and kept until one of those parts changes.
+        """
+        reference_fingerprints = [reference.fingerprint for reference in self.references]
+        parts = (self.property, self.value, self.rank, self.qualifiers, *reference_fingerprints)
+        if (fingerprint := tfsl.utils.get_cached_fragment(self, parts, '_fingerprint')) is not None:
+            return fingerprint
+        qualifier_fingerprints = sorted(claim.fingerprint for claims in self.qualifiers.values() for claim in claims)
+        fingerprint = tfsl.utils.make_fingerprint("statement", tfsl.claim.claim_fingerprint(self.property, self.value),
+                                                  self.rank.name, qualifier_fingerprints, sorted(reference_fingerprints))
+        return tfsl.utils.set_cached_fragment(self, parts, fingerprint, '_fingerprint')
+
     def set_to_remove(self) -> 'Statement':
         published_settings = self.get_published_settings()
         stmt_out = Statement(self.property, self.value, self.rank, self.qualifiers, self.references)
@@ -188,26 +214,25 @@ class Statement:
         return base_str + qualifiers_str + references_str
 
     def __jsonout__(self) -> I.StatementDict:
-        base_dict: I.StatementDict = {"type": "statement", "mainsnak": tfsl.claim.Claim(self.property, self.value).__jsonout__()}
+        reference_dicts = [reference.__jsonout__() for reference in self.references]
+        parts = (self.property, self.value, self.rank, self.qualifiers, self.references, self.id, self.toremove, *reference_dicts)
+        if (fragment := tfsl.utils.get_cached_fragment(self, parts)) is not None:
+            return fragment
+
+        mainsnak = tfsl.claim.build_snak(self.property, self.value, tfsl.utils.values_datatype(self.property))
+        base_dict: I.StatementDict = {"type": "statement", "mainsnak": mainsnak}
         if self.id is not None:
             base_dict["id"] = self.id
         if self.toremove:
             base_dict["remove"] = ""
-            return base_dict
+            return tfsl.utils.set_cached_fragment(self, parts, base_dict)
 
         base_dict["rank"] = ["deprecated", "normal", "preferred"][self.rank.value+1]
-        base_dict["qualifiers"] = defaultdict(list)
-        for stmtprop, stmtval in self.qualifiers.items():
-            base_dict["qualifiers"][stmtprop].extend([stmt.__jsonout__() for stmt in stmtval])
-        if base_dict["qualifiers"] == {}:
-            del base_dict["qualifiers"]
-        else:
-            base_dict["qualifiers"] = dict(base_dict["qualifiers"])
-        base_dict["qualifiers-order"] = list(self.qualifiers.keys())
-        if base_dict["qualifiers-order"] == []:
-            del base_dict["qualifiers-order"]
-        base_dict["references"] = [reference.__jsonout__() for reference in self.references]
-        return base_dict
+        if self.qualifiers:
+            base_dict["qualifiers"] = {stmtprop: [stmt.__jsonout__() for stmt in stmtval] for stmtprop, stmtval in self.qualifiers.items()}
+            base_dict["qualifiers-order"] = list(self.qualifiers.keys())
+        base_dict["references"] = reference_dicts
+        return tfsl.utils.set_cached_fragment(self, parts, base_dict)
 
     def get_ItemValue(self, # pylint: disable=invalid-name
                       novalue: Optional[tfsl.itemvalue.ItemValue]=None,
@@ -248,7 +273,7 @@ def build_quals(quals_in: Optional[I.ClaimDictSet] = None) -> tfsl.reference.Cla
     if quals_in is not None:
         for prop in quals_in:
             for qual in quals_in[prop]:
-                quals[prop].append(tfsl.claim.build_claim(qual))
+                quals = quals.add(tfsl.claim.build_claim(qual))
     return quals
 
 def build_statement(stmt_in: I.StatementDict) -> Statement:
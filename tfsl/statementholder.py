@@ -1,122 +1,399 @@
 """ Holds the StatementHolder class and a function to build one given a JSON representation of it. """
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from copy import deepcopy
 from textwrap import indent
-from typing import Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Union
 
 import tfsl.interfaces as I
 import tfsl.itemvalue
+import tfsl.languages
+import tfsl.monolingualtext
+import tfsl.quantityvalue
 import tfsl.statement
-import tfsl.utils as U
+import tfsl.utils
+from tfsl.persistent import EMPTY_VECTOR, PMap, PVector
+
+StatementMap = PMap[I.Pid, PVector['tfsl.statement.Statement']]
+ValueIndex = PMap[I.Pid, PMap[Any, int]]
+
+def get_value_key(value: I.ClaimValue) -> Any:
+    """ Returns a hashable key for a claim value such that two values are equal exactly when their keys are.
+        (An ItemValue is equal to the string of its ID, so its key is that string.)
+    """
+    if isinstance(value, tfsl.itemvalue.ItemValue):
+        return value.id
+    return value
+
+class StatementsFromJSON(object):
+    """ The JSON of all statements with one property on an entity as retrieved,
+        which is only built into Statements when they are first needed.
+    """
+    __slots__ = ('json', 'built')
+
+    def __init__(self, statements_json: List[I.StatementDict]):
+        self.json = statements_json
+        self.built: Optional[PVector['tfsl.statement.Statement']] = None
+
+    def get_statements(self) -> PVector['tfsl.statement.Statement']:
+        """ Returns the statements built from the JSON. """
+        if self.built is None:
+            self.built = PVector(tfsl.statement.build_statement(stmt) for stmt in self.json)
+        return self.built
+
+def is_same_json(lhs: object, rhs: object) -> bool:
+    """ Checks whether the provided entries of StatementHolders hold the same JSON, with no statements built from it yet. """
+    if not isinstance(lhs, StatementsFromJSON) or not isinstance(rhs, StatementsFromJSON):
+        return False
+    return lhs.built is None and rhs.built is None and lhs.json == rhs.json
+
+StatementEntries = PMap[I.Pid, Union[PVector['tfsl.statement.Statement'], StatementsFromJSON]]
+
+def build_statement_map(statements: Optional[Union[StatementEntries, I.StatementHolderInput]]) -> StatementEntries:
+    """ Groups the provided statements by property into a StatementMap,
+        reusing the provided one if it is already a PMap.
+    """
+    if isinstance(statements, PMap):
+        return statements
+    grouped: I.StatementSet = defaultdict(list)
+    if isinstance(statements, Mapping):
+        for prop in statements:
+            for arg in statements[prop]:
+                grouped[arg.property].append(arg)
+    elif isinstance(statements, Sequence):
+        for arg in statements:
+            grouped[arg.property].append(arg)
+    return PMap((prop, PVector(stmts)) for prop, stmts in grouped.items())
 
 class StatementHolder(object):
-    """ Holds a set of statements. """
+    """ Holds a set of statements.
+        The statements are kept in persistent collections, so adding or removing a statement
+        shares the statements of every other property with the original StatementHolder.
+        Statements shared in this way are copied by each holder the first time it hands them out
+        (through get_statements, indexing or the 'statements' attribute), so that changing them in place
+        through one holder leaves the other alone; view_statements returns them without copying them.
+
+        A StatementHolder built with from_json keeps the JSON of each property's statements
+        and only builds Statements for a property when they are first needed;
+        the statements of properties which are never built are output as that JSON.
+    """
     def __init__(self,
-                 statements: Optional[I.StatementHolderInput]=None,
-                 removed_statements: Optional[I.StatementSet]=None):
+                 statements: Optional[Union[StatementEntries, I.StatementHolderInput]]=None,
+                 removed_statements: Optional[Union[StatementMap, I.StatementSet]]=None):
         super().__init__()
 
-        self.statements = defaultdict(list)
-        if isinstance(statements, defaultdict):
-            for prop in statements:
-                for arg in statements[prop]:
-                    self.statements[arg.property].append(arg)
-        elif isinstance(statements, list):
-            for arg in statements:
-                self.statements[arg.property].append(arg)
-        if removed_statements is None:
-            self.removed_statements = defaultdict(list)
+        self.statement_map: StatementEntries = build_statement_map(statements)
+        self.removed_statements: StatementMap = build_statement_map(removed_statements)
+        self._statements: Optional[StatementMap] = None
+
+        # counts of statement values by property, filled in for a property when first needed
+        self.value_index: ValueIndex = PMap()
+        self.index_generation = tfsl.statement.value_generation
+
+        # None while the statements held are this holder's alone; otherwise they are shared with another holder,
+        # and these are the properties whose statements have since been copied for this holder
+        self.copied_properties: Optional[Set[I.Pid]] = None
+
+    @classmethod
+    def from_json(cls, claims_dict: I.StatementDictSet) -> 'StatementHolder':
+        """ Returns a StatementHolder for the provided JSON dictionary of statements
+            which builds the statements of each property only when they are first needed.
+        """
+        return cls(PMap((prop, StatementsFromJSON(stmts)) for prop, stmts in claims_dict.items()))
+
+    @property
+    def statements(self) -> StatementMap:
+        """ Returns the statements held, grouped by property, which may be changed in place. """
+        if self.copied_properties is not None:
+            for prop in self.statement_map:
+                self.own_statements(prop)
+            self.copied_properties = None
+        return self.view_statement_map()
+
+    def view_statement_map(self) -> StatementMap:
+        """ :meta private: """
+        if self._statements is None:
+            if any(isinstance(entry, StatementsFromJSON) for entry in self.statement_map.values()):
+                self._statements = PMap((prop, self.view_statements(prop)) for prop in self.statement_map)
+            else:
+                self._statements = self.statement_map
+        return self._statements
+
+    def get_statements(self, property_in: I.Pid) -> PVector['tfsl.statement.Statement']:
+        """ Returns a list of statements with the provided property, which may be changed in place. """
+        self.own_statements(property_in)
+        return self.view_statements(property_in)
+
+    def view_statements(self, property_in: I.Pid) -> PVector['tfsl.statement.Statement']:
+        """ Returns a list of statements with the provided property without copying any shared with another holder,
+            so these should only be read.
+        """
+        entry = self.statement_map.get(property_in, EMPTY_VECTOR)
+        if isinstance(entry, StatementsFromJSON):
+            return entry.get_statements()
+        return entry
+
+    def own_statements(self, property_in: I.Pid) -> None:
+        """ :meta private: """
+        if self.copied_properties is None or property_in in self.copied_properties:
+            return
+        self.copied_properties.add(property_in)
+        entry = self.statement_map.get(property_in)
+        if entry is None:
+            return
+        if isinstance(entry, StatementsFromJSON) and entry.built is None:
+            copied_entry: Union[PVector['tfsl.statement.Statement'], StatementsFromJSON] = StatementsFromJSON(entry.json)
         else:
-            self.removed_statements = removed_statements
+            copied_entry = PVector(deepcopy(stmt) for stmt in self.view_statements(property_in))
+        self.statement_map = self.statement_map.set(property_in, copied_entry)
+        self._statements = None
+
+    def mark_shared(self) -> None:
+        """ :meta private: """
+        self.copied_properties = set()
+        self._statements = None
+
+    def copy(self) -> 'StatementHolder':
+        """ Returns a StatementHolder with the same statements as this one,
+            which either holder copies before handing them out (see the class documentation).
+        """
+        holder_out = StatementHolder(self.statement_map, self.removed_statements)
+        holder_out.set_value_index(self.value_index, self.index_generation)
+        tfsl.utils.copy_cached_fragments(self, holder_out)
+        self.mark_shared()
+        holder_out.mark_shared()
+        return holder_out
+
+    def is_unbuilt(self) -> bool:
+        """ Checks whether every statement held is still only the JSON it was provided as by from_json. """
+        return all(isinstance(entry, StatementsFromJSON) and entry.built is None for entry in self.statement_map.values())
+
+    def get_value_counts(self, property_in: I.Pid) -> PMap[Any, int]:
+        """ Returns the number of statements with the provided property having each value,
+            keyed by get_value_key of the value.
+        """
+        value_counts = self.get_value_index().get(property_in)
+        if value_counts is None:
+            counter = Counter(get_value_key(stmt.value) for stmt in self.view_statements(property_in))
+            value_counts = PMap(counter.items())
+            self.value_index = self.value_index.set(property_in, value_counts)
+        return value_counts
+
+    def get_value_index(self) -> ValueIndex:
+        """ :meta private: """
+        # a statement's value was replaced in place since the index was started, so it may be out of date
+        if self.index_generation != tfsl.statement.value_generation:
+            self.index_generation = tfsl.statement.value_generation
+            self.value_index = PMap()
+        return self.value_index
 
-    def get_statements(self, property_in: I.Pid) -> I.StatementList:
-        """ Returns a list of statements with the provided property. """
-        return self.statements.get(property_in, [])
+    def set_value_index(self, value_index: ValueIndex, index_generation: int) -> None:
+        """ :meta private: """
+        self.value_index = value_index
+        self.index_generation = index_generation
+
+    def adjust_value_index(self, property_in: I.Pid, value: I.ClaimValue, change: int) -> ValueIndex:
+        """ :meta private: """
+        value_counts = self.get_value_index().get(property_in)
+        if value_counts is None:
+            return self.value_index
+        key = get_value_key(value)
+        new_count = value_counts.get(key, 0) + change
+        if new_count > 0:
+            return self.value_index.set(property_in, value_counts.set(key, new_count))
+        return self.value_index.set(property_in, value_counts.discard(key))
 
     def haswbstatement(self, property_in: I.Pid, value_in: Optional[I.ClaimValue]=None) -> bool:
         """Shamelessly named after the keyword used on Wikidata to look for a statement."""
         if value_in is None:
-            return property_in in self.statements
-        elif U.is_novalue(value_in):
-            def compare_function(stmt: tfsl.Statement) -> bool:
-                return U.is_novalue(stmt.value)
-        elif U.is_somevalue(value_in):
-            def compare_function(stmt: tfsl.Statement) -> bool:
-                return U.is_somevalue(stmt.value)
-        else:
-            def compare_function(stmt: tfsl.statement.Statement) -> bool:
-                return stmt.value == value_in
-        return any(map(compare_function, self.statements[property_in]))
+            return property_in in self.statement_map
+        return get_value_key(value_in) in self.get_value_counts(property_in)
 
     def __jsonout__(self) -> I.StatementDictSet:
+        removed_dicts = [(stmtprop, [stmt.__jsonout__() for stmt in stmtval]) for stmtprop, stmtval in self.removed_statements.items()]
+        held_dicts = [(stmtprop, self.get_statement_dicts(entry)) for stmtprop, entry in self.statement_map.items()]
+        stmt_dicts = [stmt_dict for _, dicts in removed_dicts + held_dicts for stmt_dict in dicts]
+        parts = (self.removed_statements, self.statement_map, *stmt_dicts)
+        if (fragment := tfsl.utils.get_cached_fragment(self, parts)) is not None:
+            return fragment
+
         statement_dict = defaultdict(list)
-        for stmtprop, stmtval in self.removed_statements.items():
-            statement_dict[stmtprop].extend([stmt.__jsonout__() for stmt in stmtval])
-        for stmtprop, stmtval in self.statements.items():
-            statement_dict[stmtprop].extend([stmt.__jsonout__() for stmt in stmtval])
-        return dict(statement_dict)
+        for stmtprop, dicts in removed_dicts + held_dicts:
+            statement_dict[stmtprop].extend(dicts)
+        return tfsl.utils.set_cached_fragment(self, parts, dict(statement_dict))
+
+    @staticmethod
+    def get_statement_dicts(entry: Union[PVector['tfsl.statement.Statement'], StatementsFromJSON]) -> List[I.StatementDict]:
+        """ :meta private: """
+        if isinstance(entry, StatementsFromJSON):
+            if entry.built is None:
+                return entry.json
+            # the built statements may since have been changed in place
+            entry = entry.built
+        return [stmt.__jsonout__() for stmt in entry]
+
+    @property
+    def fingerprint(self) -> str:
+        """ Returns a digest of the statements held (but not those marked for removal), regardless of their order,
+            computed from the fingerprints of the statements and kept until one of those changes.
+        """
+        statement_fingerprints = [stmt.fingerprint for prop in self.statement_map for stmt in self.view_statements(prop)]
+        parts = (self.statement_map, *statement_fingerprints)
+        if (fingerprint := tfsl.utils.get_cached_fragment(self, parts, '_fingerprint')) is not None:
+            return fingerprint
+        fingerprint = tfsl.utils.make_fingerprint("statements", sorted(statement_fingerprints))
+        return tfsl.utils.set_cached_fragment(self, parts, fingerprint, '_fingerprint')
+
+    def has_same_statements(self, rhs: 'StatementHolder') -> bool:
+        """ Checks whether the provided StatementHolder holds the same statements (by fingerprint), regardless of their order.
+            Statements of a property still held only as JSON by both holders are compared as that JSON, without building them.
+        """
+        if len(self.statement_map) != len(rhs.statement_map):
+            return False
+        for prop, entry in self.statement_map.items():
+            rhs_entry = rhs.statement_map.get(prop)
+            if rhs_entry is None:
+                return False
+            if rhs_entry is entry or is_same_json(entry, rhs_entry):
+                continue
+            fingerprints = sorted(stmt.fingerprint for stmt in self.view_statements(prop))
+            if fingerprints != sorted(stmt.fingerprint for stmt in rhs.view_statements(prop)):
+                return False
+        return True
 
     def __len__(self) -> int:
-        return len(self.statements)
+        return len(self.statement_map)
 
     def __eq__(self, rhs: object) -> bool:
         if isinstance(rhs, StatementHolder):
-            return self.statements == rhs.statements
+            return self.view_statement_map() == rhs.view_statement_map()
         elif isinstance(rhs, dict):
-            return self.statements == rhs
+            return self.view_statement_map() == rhs
         return NotImplemented
 
     def __contains__(self, arg: object) -> bool:
         if isinstance(arg, str):
             if I.is_Pid(arg):
-                return arg in self.statements
+                return arg in self.statement_map
             raise TypeError(f"String {arg} is not a property")
         elif isinstance(arg, tfsl.claim.Claim):
-            for prop in self.statements:
-                for stmt in self.statements[prop]:
-                    if stmt == arg:
-                        return True
+            return get_value_key(arg.value) in self.get_value_counts(arg.property)
         elif isinstance(arg, tfsl.statement.Statement):
-            return arg in self.statements[arg.property]
+            if get_value_key(arg.value) not in self.get_value_counts(arg.property):
+                return False
+            return arg in self.view_statements(arg.property)
         raise TypeError(f"Can't check for {type(arg)} in StatementHolder")
 
-    def __getitem__(self, arg: object) -> I.StatementList:
+    def __getitem__(self, arg: object) -> PVector['tfsl.statement.Statement']:
         if isinstance(arg, str):
             if I.is_Pid(arg):
-                return self.statements[arg]
+                return self.get_statements(arg)
         raise KeyError(f"String {arg} is not a property")
 
     def __str__(self) -> str:
-        if self.statements:
-            stmt_list = [str(stmt) for prop in self.statements for stmt in self.statements[prop]]
+        if self.statement_map:
+            stmt_list = [str(stmt) for prop in self.statement_map for stmt in self.view_statements(prop)]
             return "<\n"+indent("\n".join(stmt_list), tfsl.utils.DEFAULT_INDENT)+"\n>"
         return ""
 
     def __add__(self, rhs: object) -> 'StatementHolder':
         if not isinstance(rhs, tfsl.statement.Statement):
             raise TypeError(f"Can't add {type(rhs)} to StatementHolder")
-        newstmts = deepcopy(self.statements)
-        newstmts[rhs.property].append(rhs)
-        return StatementHolder(newstmts)
+        newstmts = self.statement_map.set(rhs.property, self.view_statements(rhs.property).appended(rhs))
+        holder_out = StatementHolder(newstmts, self.removed_statements)
+        holder_out.set_value_index(self.adjust_value_index(rhs.property, rhs.value, 1), self.index_generation)
+        self.mark_shared()
+        holder_out.mark_shared()
+        return holder_out
 
     def __sub__(self, rhs: object) -> 'StatementHolder':
         if isinstance(rhs, str):
             if I.is_Pid(rhs):
-                newstmts = deepcopy(self.statements)
-                newremoved = deepcopy(self.removed_statements)
-                newremoved[rhs].extend([stmt.set_to_remove() for stmt in newstmts[rhs]])
-                del newstmts[rhs]
-                return StatementHolder(newstmts, newremoved)
+                removed_for_prop = self.removed_statements.get(rhs, EMPTY_VECTOR)
+                removed_for_prop = removed_for_prop.extended(stmt.set_to_remove() for stmt in self.view_statements(rhs))
+                newremoved = self.removed_statements.set(rhs, removed_for_prop)
+                holder_out = StatementHolder(self.statement_map.discard(rhs), newremoved)
+                holder_out.set_value_index(self.get_value_index().discard(rhs), self.index_generation)
+                self.mark_shared()
+                holder_out.mark_shared()
+                return holder_out
             raise TypeError(f"String {rhs} is not a property")
         elif isinstance(rhs, tfsl.statement.Statement):
-            newstmts = deepcopy(self.statements)
-            newremoved = deepcopy(self.removed_statements)
-            newstmts[rhs.property] = [stmt for stmt in newstmts[rhs.property] if stmt != rhs]
-            newremoved[rhs.property].append(rhs.set_to_remove())
-            return StatementHolder(newstmts, newremoved)
+            remaining_stmts = self.view_statements(rhs.property).without(rhs)
+            if len(remaining_stmts) == 0:
+                newstmts = self.statement_map.discard(rhs.property)
+            else:
+                newstmts = self.statement_map.set(rhs.property, remaining_stmts)
+            removed_for_prop = self.removed_statements.get(rhs.property, EMPTY_VECTOR).appended(rhs.set_to_remove())
+            newremoved = self.removed_statements.set(rhs.property, removed_for_prop)
+            holder_out = StatementHolder(newstmts, newremoved)
+            removed_count = len(self.view_statements(rhs.property)) - len(remaining_stmts)
+            holder_out.set_value_index(self.adjust_value_index(rhs.property, rhs.value, -removed_count), self.index_generation)
+            self.mark_shared()
+            holder_out.mark_shared()
+            return holder_out
         raise TypeError(f"Can't subtract {type(rhs)} from StatementHolder")
 
+    def edit(self) -> 'StatementHolderEditor':
+        """ Returns a mutable copy of this StatementHolder for making many changes at once. """
+        return StatementHolderEditor(self)
+
+class StatementHolderEditor(object):
+    """ Mutable counterpart of a StatementHolder.
+        Only the statements of properties that are actually changed are copied into lists,
+        and these lists are turned back into a StatementHolder once by freeze().
+        The statements in these lists are shared with the original StatementHolder,
+        so they should be replaced rather than changed in place.
+    """
+    def __init__(self, holder: StatementHolder):
+        self.holder = holder
+        holder.mark_shared()
+        self.changed: Dict[I.Pid, List['tfsl.statement.Statement']] = {}
+        self.removed: Dict[I.Pid, List['tfsl.statement.Statement']] = {}
+
+    def get_statements(self, property_in: I.Pid) -> List['tfsl.statement.Statement']:
+        """ Returns the current (mutable) list of statements with the provided property. """
+        if property_in not in self.changed:
+            self.changed[property_in] = list(self.holder.view_statements(property_in))
+        return self.changed[property_in]
+
+    def add(self, arg: object) -> None:
+        """ Adds the provided statement. """
+        if not isinstance(arg, tfsl.statement.Statement):
+            raise TypeError(f"Can't add {type(arg)} to StatementHolder")
+        self.get_statements(arg.property).append(arg)
+
+    def sub(self, arg: object) -> None:
+        """ Removes the provided statement, or all statements with the provided property. """
+        if isinstance(arg, str):
+            if I.is_Pid(arg):
+                stmts = self.get_statements(arg)
+                self.removed.setdefault(arg, []).extend(stmt.set_to_remove() for stmt in stmts)
+                stmts.clear()
+                return
+            raise TypeError(f"String {arg} is not a property")
+        elif isinstance(arg, tfsl.statement.Statement):
+            stmts = self.get_statements(arg.property)
+            stmts[:] = [stmt for stmt in stmts if stmt != arg]
+            self.removed.setdefault(arg.property, []).append(arg.set_to_remove())
+            return
+        raise TypeError(f"Can't subtract {type(arg)} from StatementHolder")
+
+    def freeze(self) -> StatementHolder:
+        """ Returns a StatementHolder with all changes made so far. """
+        newstmts = self.holder.statement_map
+        for prop, stmts in self.changed.items():
+            if stmts:
+                newstmts = newstmts.set(prop, PVector(stmts))
+            else:
+                newstmts = newstmts.discard(prop)
+        newremoved = self.holder.removed_statements
+        for prop, stmts in self.removed.items():
+            newremoved = newremoved.set(prop, newremoved.get(prop, EMPTY_VECTOR).extended(stmts))
+        holder_out = StatementHolder(newstmts, newremoved)
+        holder_out.mark_shared()
+        return holder_out
+
 def build_statement_list(claims_dict: I.StatementDictSet) -> I.StatementSet:
     """ Builds a statement set from a JSON dictionary of statements. """
     claims: I.StatementSet = defaultdict(list)
@@ -125,22 +402,56 @@ def build_statement_list(claims_dict: I.StatementDictSet) -> I.StatementSet:
             claims[prop].append(tfsl.statement.build_statement(claim))
     return claims
 
+def get_datavalue_matcher(value_in: I.ClaimValue) -> Callable[[Any], bool]:
+    """ Returns a function checking whether the 'value' part of a statement's datavalue JSON
+        is equal to the provided value, with no objects built from that JSON along the way.
+    """
+    if isinstance(value_in, str):
+        # ItemValues are equal to the strings of their IDs
+        def match_string(value: Any) -> bool:
+            if isinstance(value, str):
+                return value == value_in
+            return value.get("id") == value_in
+        return match_string
+    elif isinstance(value_in, tfsl.itemvalue.ItemValue):
+        value_id, value_type = value_in.id, value_in.type
+        def match_entity(value: Any) -> bool:
+            if isinstance(value, str):
+                return value == value_id
+            return value.get("id") == value_id and value.get("entity-type") == value_type
+        return match_entity
+    elif isinstance(value_in, tfsl.monolingualtext.MonolingualText):
+        text, code = value_in.text, value_in.language.code
+        if tfsl.languages.get_first_lang(code) != value_in.language:
+            return lambda value: False
+        def match_text(value: Any) -> bool:
+            return isinstance(value, dict) and value.get("text") == text and value.get("language") == code
+        return match_text
+    elif isinstance(value_in, tfsl.quantityvalue.QuantityValue):
+        # the JSON of a quantity may write its unit and bounds in more than one way
+        def match_quantity(value: Any) -> bool:
+            if not isinstance(value, dict) or not tfsl.quantityvalue.is_quantityvalue(value):
+                return False
+            return tfsl.quantityvalue.build_quantityvalue(value) == value_in
+        return match_quantity
+    value_json = value_in.__jsonout__()
+    def match_json(value: Any) -> bool:
+        return value == value_json
+    return match_json
+
 def haswbstatement(statementset: I.StatementDictSet, property_in: I.Pid, value_in: Optional[I.ClaimValue]=None) -> bool:
+    """ Checks the JSON of a set of statements for a statement with the provided property and value. """
     if value_in is None:
         return property_in in statementset
     elif tfsl.utils.is_novalue(value_in):
-        def compare_function(stmt: I.StatementDict) -> bool:
-            mainsnak = stmt["mainsnak"]
-            return mainsnak["snaktype"] == "novalue"
+        snaktype = "novalue"
     elif tfsl.utils.is_somevalue(value_in):
-        def compare_function(stmt: I.StatementDict) -> bool:
-            mainsnak = stmt["mainsnak"]
-            return mainsnak["snaktype"] == "somevalue"
+        snaktype = "somevalue"
     else:
-        def compare_function(stmt: I.StatementDict) -> bool:
+        matches = get_datavalue_matcher(value_in)
+        for stmt in statementset.get(property_in, []):
             mainsnak = stmt["mainsnak"]
-            if mainsnak["snaktype"] not in {"novalue", "somevalue"}:
-                datavalue = mainsnak["datavalue"]
-                return tfsl.claim.build_value(datavalue["value"]) == value_in
-            return False
-    return any(map(compare_function, statementset.get(property_in,[])))
+            if mainsnak["snaktype"] == "value" and matches(mainsnak["datavalue"]["value"]):
+                return True
+        return False
+    return any(stmt["mainsnak"]["snaktype"] == snaktype for stmt in statementset.get(property_in, []))
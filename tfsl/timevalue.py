@@ -21,6 +21,16 @@ class TimeValue:
         self.precision: int = precision
         self.calendarmodel: str = calendarmodel
 
+    def __eq__(self, rhs: object) -> bool:
+        if not isinstance(rhs, TimeValue):
+            return NotImplemented
+        times_equal = self.time == rhs.time and self.timezone == rhs.timezone
+        bounds_equal = self.before == rhs.before and self.after == rhs.after
+        return times_equal and bounds_equal and self.precision == rhs.precision and self.calendarmodel == rhs.calendarmodel
+
+    def __hash__(self) -> int:
+        return hash((self.time, self.timezone, self.before, self.after, self.precision, self.calendarmodel))
+
     def __jsonout__(self) -> I.TimeValueDict:
         base_dict: I.TimeValueDict = {
             "time": self.time,
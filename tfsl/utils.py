@@ -1,11 +1,13 @@
 """ Miscellaneous utility functions. """
 
-from copy import deepcopy
-from functools import lru_cache
-from typing import Any, List, TypeVar
+import hashlib
+import json
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple, TypeVar
 
 import tfsl.auth
 import tfsl.interfaces as I
+from tfsl.persistent import PVector, pvector
 
 DEFAULT_INDENT = "    "
 WD_PREFIX = "http://www.wikidata.org/entity/"
@@ -20,18 +22,87 @@ def strip_prefix_wd(arg: str) -> str:
         return arg[len(WD_PREFIX):]
     return arg
 
+ViewT = TypeVar('ViewT')
+def memoized_view(method: Callable[..., ViewT]) -> Callable[..., ViewT]:
+    """ Makes the decorated method of a MemoizedViews subclass compute its result
+        only once for each set of (hashable) arguments, until clear_views is called.
+    """
+    @wraps(method)
+    def memoized_method(self: 'MemoizedViews', *args: Hashable) -> ViewT:
+        views = self.get_views()
+        key = (method.__name__, args)
+        try:
+            return views[key]
+        except KeyError:
+            view = method(self, *args)
+            views[key] = view
+            return view
+    return memoized_method
+
+class MemoizedViews(object):
+    """ Base for the classes wrapping raw entity JSON (L_, LF_, LS_, Q_ and P_),
+        which keep the objects they build from that JSON to return them again on later access.
+        If the JSON is changed in place, clear_views should be called so that they are built anew.
+    """
+    def get_views(self) -> Dict[Tuple[str, Tuple[Hashable, ...]], Any]:
+        """ :meta private: """
+        try:
+            return self.__dict__['_views']
+        except KeyError:
+            return self.__dict__.setdefault('_views', {})
+
+    def clear_views(self) -> None:
+        """ Drops every object built from the JSON so far. """
+        self.__dict__.pop('_views', None)
+
+FragmentT = TypeVar('FragmentT')
+def get_cached_fragment(obj: object, parts: Tuple[Any, ...], slot: str='_fragment') -> Any:
+    """ Returns the JSON fragment (or other derived value, if a different slot is provided)
+        last stored for the provided object by set_cached_fragment,
+        or None if any of the parts it was built from has since been replaced.
+        Parts are compared by identity, so this takes constant time per part.
+    """
+    try:
+        cached_parts, fragment = obj.__dict__[slot]
+    except KeyError:
+        return None
+    if len(cached_parts) != len(parts):
+        return None
+    for cached_part, part in zip(cached_parts, parts):
+        if cached_part is not part:
+            return None
+    return fragment
+
+def set_cached_fragment(obj: object, parts: Tuple[Any, ...], fragment: FragmentT, slot: str='_fragment') -> FragmentT:
+    """ Stores the JSON fragment built for the provided object from the provided parts and returns it.
+        The fragment is shared between calls and so should not be modified by callers.
+    """
+    obj.__dict__[slot] = (parts, fragment)
+    return fragment
+
+def copy_cached_fragments(obj: object, obj_out: object) -> None:
+    """ Stores for a copy of an object the JSON fragment and fingerprint cached for the object,
+        which remain valid for the copy for as long as the parts they were built from are the same.
+    """
+    for slot in ('_fragment', '_fingerprint'):
+        if slot in obj.__dict__:
+            obj_out.__dict__[slot] = obj.__dict__[slot]
+
+def make_fingerprint(*parts: Any) -> str:
+    """ Returns a digest of the provided JSON-serializable parts,
+        such that parts with the same content always have the same digest.
+    """
+    serialized = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(serialized.encode('utf-8'), digest_size=16).hexdigest()
+
 ListT = TypeVar('ListT')
-def add_to_list(references: List[ListT], arg: ListT) -> List[ListT]:
-    """ Adds a ListT to a list of ListTs. """
-    newreferences = deepcopy(references)
-    newreferences.append(arg)
-    return newreferences
-
-def sub_from_list(references: List[ListT], arg: ListT) -> List[ListT]:
-    """ Removes a ListT from a list of ListTs. """
-    newreferences = deepcopy(references)
-    newreferences = [reference for reference in newreferences if reference != arg]
-    return newreferences
+def add_to_list(references: Iterable[ListT], arg: ListT) -> PVector[ListT]:
+    """ Adds a ListT to a list of ListTs, sharing the unchanged ListTs with the original list. """
+    return pvector(references).appended(arg)
+
+def sub_from_list(references: Iterable[ListT], arg: ListT) -> PVector[ListT]:
+    """ Removes a ListT from a list of ListTs, sharing the remaining ListTs with the original list. """
+    return pvector(references).without(arg)
 
 external_to_internal_type_mapping = {
     "commonsMedia": "string",